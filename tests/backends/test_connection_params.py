@@ -40,6 +40,39 @@ class TestConnectionParams(test.TestCase):
                 sql_mode="STRICT_TRANS_TABLES",
             )
 
+    async def test_mysql_max_allowed_packet(self):
+        with patch("aiomysql.create_pool", new=CoroutineMock()) as mysql_connect:
+            await Tortoise._init_connections(
+                {
+                    "models": {
+                        "engine": "tortoise.backends.mysql",
+                        "credentials": {
+                            "database": "test",
+                            "host": "127.0.0.1",
+                            "password": "foomip",
+                            "port": 3306,
+                            "user": "root",
+                            "max_allowed_packet": "1048576",
+                        },
+                    }
+                },
+                False,
+            )
+
+            self.assertEqual(Tortoise.get_connection("models").max_allowed_packet, 1048576)
+            mysql_connect.assert_awaited_once_with(  # nosec
+                autocommit=True,
+                charset="utf8mb4",
+                db="test",
+                host="127.0.0.1",
+                password="foomip",
+                port=3306,
+                user="root",
+                maxsize=5,
+                minsize=1,
+                sql_mode="STRICT_TRANS_TABLES",
+            )
+
     async def test_postres_connection_params(self):
         try:
             with patch("asyncpg.create_pool", new=CoroutineMock()) as asyncpg_connect:
@@ -72,3 +72,14 @@ class TestPostgreSQL(test.SimpleTestCase):
             await Tortoise.init(self.db_config, _create_db=True)
         except ConnectionError:
             pass
+
+    async def test_statement_cache_size(self):
+        self.db_config["connections"]["models"]["credentials"]["statement_cache_size"] = 0
+        await Tortoise.init(self.db_config, _create_db=True)
+        await Tortoise.generate_schemas()
+        self.assertEqual(Tortoise.get_connection("models")._template["statement_cache_size"], 0)
+
+        tournament = await Tournament.create(name="Test")
+        tournament.name = "Updated"
+        await tournament.save()
+        self.assertEqual(await Tournament.filter(name="Updated").count(), 1)
@@ -0,0 +1,78 @@
+import asyncio
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise.batching import batched, current_batch_loader
+from tortoise.contrib import test
+from tortoise.exceptions import DoesNotExist
+
+
+class TestBatching(test.TestCase):
+    async def setUp(self):
+        self.db = Tournament._meta.db
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(5)]
+        for tournament in self.tournaments:
+            event = await Event.create(name=tournament.name, tournament=tournament)
+            await event.participants.add(await Team.create(name=tournament.name))
+        self.events = await Event.all().order_by("name")
+
+    async def test_fetch_related(self):
+        with batched(), test.count_queries(self.db) as execute_query:
+            await asyncio.gather(
+                *[event.fetch_related("tournament", "participants") for event in self.events]
+            )
+        self.assertEqual(execute_query.call_count, 2)
+        self.assertEqual([event.tournament.name for event in self.events], list("01234"))
+        self.assertEqual(
+            [[team.name for team in event.participants] for event in self.events],
+            [[name] for name in "01234"],
+        )
+
+    async def test_fetch_related_different_fields(self):
+        with batched(), test.count_queries(self.db) as execute_query:
+            await asyncio.gather(
+                self.events[0].fetch_related("tournament"),
+                self.events[1].fetch_related("tournament"),
+                self.events[2].fetch_related("participants"),
+            )
+        self.assertEqual(execute_query.call_count, 2)
+        self.assertEqual(self.events[1].tournament.name, "1")
+        self.assertEqual(self.events[2].participants[0].name, "2")
+
+    async def test_get(self):
+        with batched(), test.count_queries(self.db) as execute_query:
+            tournaments = await asyncio.gather(
+                *[Tournament.get(pk=tournament.pk) for tournament in self.tournaments],
+                Tournament.get(id=self.tournaments[0].id),
+            )
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual([tournament.name for tournament in tournaments], list("012340"))
+
+    async def test_get_does_not_exist(self):
+        with batched():
+            tournament, error = await asyncio.gather(
+                Tournament.get(pk=self.tournaments[0].pk),
+                Tournament.get(pk=-1),
+                return_exceptions=True,
+            )
+        self.assertEqual(tournament.name, "0")
+        self.assertIsInstance(error, DoesNotExist)
+
+    async def test_get_chained(self):
+        with batched():
+            tournament = await Tournament.get(pk=self.tournaments[0].pk).only("id")
+        self.assertEqual(tournament.pk, self.tournaments[0].pk)
+        self.assertTrue(tournament._partial)
+
+    async def test_fk(self):
+        with batched(), test.count_queries(self.db) as execute_query:
+            tournaments = await asyncio.gather(*[event.tournament for event in self.events])
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual([tournament.name for tournament in tournaments], list("01234"))
+
+    async def test_unbatched(self):
+        with batched():
+            self.assertIsNotNone(current_batch_loader.get())
+        self.assertIsNone(current_batch_loader.get())
+        with test.count_queries(self.db) as execute_query:
+            await asyncio.gather(*[event.fetch_related("tournament") for event in self.events])
+        self.assertEqual(execute_query.call_count, 5)
@@ -1,8 +1,8 @@
 from uuid import UUID, uuid4
 
-from tests.testmodels import UniqueName, UUIDPkModel
+from tests.testmodels import Event, Tournament, UniqueName, UUIDPkModel
 from tortoise.contrib import test
-from tortoise.exceptions import IntegrityError
+from tortoise.exceptions import FieldError, IntegrityError, ParamsError
 from tortoise.transactions import in_transaction
 
 
@@ -31,6 +31,104 @@ class TestBulk(test.TruncationTestCase):
         inc = all_[1000]["id"]
         self.assertEqual(all_[1000:], [{"id": val + inc, "name": None} for val in range(1000)])
 
+    async def test_bulk_create_batch_size(self):
+        await UniqueName.bulk_create(
+            [UniqueName(id=id_) for id_ in range(1000, 1100)]
+            + [UniqueName(name=str(i)) for i in range(1000)],
+            batch_size=33,
+        )
+        all_ = await UniqueName.all().order_by("id").values("id", "name")
+        self.assertEqual(len(all_), 1100)
+        self.assertEqual(all_[:100], [{"id": id_, "name": None} for id_ in range(1000, 1100)])
+        self.assertEqual(
+            sorted(item["name"] for item in all_[100:]), sorted(str(i) for i in range(1000))
+        )
+
+    async def test_bulk_create_statement_cache(self):
+        for size in range(1, 41):
+            await UniqueName.bulk_create([UniqueName(name=f"{size}-{i}") for i in range(size)])
+        self.assertEqual(await UniqueName.all().count(), 820)
+        bulk_cache = UniqueName._meta.db.get_executor(UniqueName).bulk_cache
+        self.assertLessEqual(len(bulk_cache), bulk_cache.maxsize)
+
+    async def test_bulk_create_batch_size_invalid(self):
+        with self.assertRaises(ParamsError):
+            await UniqueName.bulk_create([UniqueName()], batch_size=0)
+
+    async def test_bulk_create_batch_size_fail(self):
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_create(
+                [UniqueName(name=str(i)) for i in range(10)]
+                + [UniqueName(name=str(i)) for i in range(10)],
+                batch_size=5,
+            )
+        if UniqueName._meta.db.capabilities.supports_transactions:
+            self.assertEqual(await UniqueName.all().count(), 0)
+
+    async def test_bulk_create_fetch_generated(self):
+        objs = [UniqueName(name=str(i)) for i in range(100)] + [UniqueName(id=1000, name="c")]
+        await UniqueName.bulk_create(objs, fetch_generated=True)
+        self.assertEqual(
+            sorted((obj.pk, obj.name) for obj in objs),
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+        self.assertEqual(objs[-1].pk, 1000)
+        self.assertTrue(all(obj._saved_in_db for obj in objs))
+
+        objs[0].name = "updated"
+        await objs[0].save()
+        self.assertEqual(await UniqueName.get(name="updated"), objs[0])
+        self.assertEqual(await UniqueName.all().count(), 101)
+
+    async def test_bulk_create_fetch_generated_batch_size(self):
+        objs = [UniqueName(name=str(i)) for i in range(100)]
+        await UniqueName.bulk_create(objs, batch_size=7, fetch_generated=True)
+        self.assertEqual(
+            [(obj.pk, obj.name) for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+
+    async def test_bulk_create_fetch_generated_uuidpk(self):
+        objs = [UUIDPkModel() for _ in range(10)]
+        await UUIDPkModel.bulk_create(objs, fetch_generated=True)
+        self.assertEqual(
+            sorted(obj.pk for obj in objs),
+            sorted(await UUIDPkModel.all().values_list("id", flat=True)),
+        )
+
+    async def test_bulk_create_on_conflict_ignore(self):
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(10)])
+        await UniqueName.bulk_create(
+            [UniqueName(name=str(i)) for i in range(5, 15)], on_conflict=["name"], batch_size=3
+        )
+        self.assertEqual(
+            sorted(await UniqueName.all().values_list("name", flat=True)),
+            sorted(str(i) for i in range(15)),
+        )
+
+    async def test_bulk_create_on_conflict_update(self):
+        await UniqueName.bulk_create([UniqueName(id=id_, name=str(id_)) for id_ in range(1, 11)])
+        await UniqueName.bulk_create(
+            [UniqueName(id=id_, name=f"updated{id_}") for id_ in range(6, 16)],
+            on_conflict=["id"],
+            update_fields=["name"],
+        )
+        self.assertEqual(
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+            [(id_, str(id_)) for id_ in range(1, 6)]
+            + [(id_, f"updated{id_}") for id_ in range(6, 16)],
+        )
+
+    async def test_bulk_create_on_conflict_invalid(self):
+        with self.assertRaises(ParamsError):
+            await UniqueName.bulk_create([UniqueName()], update_fields=["name"])
+        with self.assertRaises(ParamsError):
+            await UniqueName.bulk_create([UniqueName()], on_conflict=["name"], fetch_generated=True)
+        with self.assertRaises(FieldError):
+            await UniqueName.bulk_create([UniqueName()], on_conflict=["unknown"])
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_create([UniqueName()], on_conflict=["name"], update_fields=["id"])
+
     async def test_bulk_create_uuidpk(self):
         await UUIDPkModel.bulk_create([UUIDPkModel() for _ in range(1000)])
         res = await UUIDPkModel.all().values_list("id", flat=True)
@@ -80,3 +178,105 @@ class TestBulk(test.TruncationTestCase):
         with self.assertRaises(IntegrityError):
             async with in_transaction():
                 await UUIDPkModel.bulk_create([UUIDPkModel(id=val) for _ in range(10)])
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_copy(self):
+        db = UniqueName._meta.db
+        copy_threshold = db.copy_threshold
+        db.copy_threshold = 10
+        try:
+            await UniqueName.bulk_create(
+                [UniqueName(id=id_) for id_ in range(1000, 1010)]
+                + [UniqueName(name=str(i)) for i in range(100)]
+            )
+        finally:
+            db.copy_threshold = copy_threshold
+        all_ = await UniqueName.all().order_by("id").values("id", "name")
+        self.assertEqual(len(all_), 110)
+        self.assertEqual(all_[:10], [{"id": id_, "name": None} for id_ in range(1000, 1010)])
+        self.assertEqual(
+            sorted(item["name"] for item in all_[10:]), sorted(str(i) for i in range(100))
+        )
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_copy_fail(self):
+        db = UniqueName._meta.db
+        copy_threshold = db.copy_threshold
+        db.copy_threshold = 10
+        try:
+            with self.assertRaises(IntegrityError):
+                await UniqueName.bulk_create(
+                    [UniqueName(name=str(i)) for i in range(10)]
+                    + [UniqueName(name=str(i)) for i in range(10)]
+                )
+        finally:
+            db.copy_threshold = copy_threshold
+
+    async def test_bulk_update(self):
+        objs = [UniqueName(name=str(i)) for i in range(100)]
+        await UniqueName.bulk_create(objs, fetch_generated=True)
+        for obj in objs[:50]:
+            obj.name = f"updated{obj.name}"
+        self.assertEqual(await UniqueName.bulk_update(objs[:50], fields=["name"]), 50)
+        self.assertEqual(
+            [(obj.pk, obj.name) for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+
+    async def test_bulk_update_batch_size(self):
+        objs = [UniqueName(name=str(i)) for i in range(100)]
+        await UniqueName.bulk_create(objs, fetch_generated=True)
+        for obj in objs:
+            obj.name = None if obj.pk % 2 else f"updated{obj.name}"
+        self.assertEqual(await UniqueName.bulk_update(objs, fields=["name"], batch_size=7), 100)
+        self.assertEqual(
+            [(obj.pk, obj.name) for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+
+    async def test_bulk_update_fields(self):
+        tournament = await Tournament.create(name="Tournament")
+        tournament2 = await Tournament.create(name="Tournament2")
+        events = [await Event.create(name=str(i), tournament=tournament) for i in range(10)]
+        for event in events:
+            event.name = f"updated{event.name}"
+            event.tournament = tournament2
+            event.alias = int(event.name[-1])
+            event.token = "token"
+        await Event.bulk_update(events, fields=["name", "tournament", "alias"])
+        self.assertEqual(
+            [(event.pk, event.name, tournament2.pk, event.alias) for event in events],
+            await Event.all()
+            .order_by("event_id")
+            .values_list("event_id", "name", "tournament_id", "alias"),
+        )
+        self.assertEqual(await Event.filter(token="token").count(), 0)
+
+    async def test_bulk_update_empty(self):
+        self.assertEqual(await UniqueName.bulk_update([], fields=["name"]), 0)
+
+    async def test_bulk_update_invalid(self):
+        objs = [await UniqueName.create(name="a")]
+        with self.assertRaises(FieldError):
+            await UniqueName.bulk_update(objs, fields=["unknown"])
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_update(objs, fields=["id"])
+        with self.assertRaises(FieldError):
+            await Event.bulk_update([], fields=["participants"])
+        with self.assertRaises(ParamsError):
+            await UniqueName.bulk_update(objs, fields=[])
+        with self.assertRaises(ParamsError):
+            await UniqueName.bulk_update(objs, fields=["name"], batch_size=0)
+
+    async def test_bulk_update_batch_size_fail(self):
+        objs = [UniqueName(name=str(i)) for i in range(10)]
+        await UniqueName.bulk_create(objs, fetch_generated=True)
+        for obj in objs:
+            obj.name = "same" if obj is objs[-1] or obj is objs[0] else f"updated{obj.name}"
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_update(objs, fields=["name"], batch_size=3)
+        if UniqueName._meta.db.capabilities.supports_transactions:
+            self.assertEqual(
+                sorted(await UniqueName.all().values_list("name", flat=True)),
+                sorted(str(i) for i in range(10)),
+            )
@@ -0,0 +1,154 @@
+import pickle
+from typing import Any, Dict, Iterable, List, Optional
+
+from tests.testmodels import Event, Team, Tournament
+from tortoise.cache import BaseCacheStore, LRUCacheStore, get_cache_store, set_cache_store
+from tortoise.contrib import test
+from tortoise.transactions import in_transaction
+
+
+class PickleCacheStore(BaseCacheStore):
+    """
+    A store that serialises the values, like an external store would.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[str, bytes] = {}
+        self.versions: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.entries.get(key)
+        return None if value is None else pickle.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.entries[key] = pickle.dumps(value)
+
+    async def get_versions(self, tables: List[str]) -> List[int]:
+        return [self.versions.get(table, 0) for table in tables]
+
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self.versions[table] = self.versions.get(table, 0) + 1
+
+
+class TestCache(test.TruncationTestCase):
+    async def setUp(self):
+        self.store = LRUCacheStore()
+        set_cache_store(self.store)
+        self.db = Tournament._meta.db
+        self.tournament = await Tournament.create(name="tournament")
+        self.event = await Event.create(name="event", tournament=self.tournament)
+
+    async def tearDown(self):
+        set_cache_store(None)
+
+    async def test_cache(self):
+        with test.count_queries(self.db) as execute_query:
+            first = await Tournament.all().cache()
+            second = await Tournament.all().cache()
+            await Tournament.filter(name="other").cache()
+        self.assertEqual(execute_query.call_count, 2)
+        self.assertEqual([tournament.name for tournament in second], ["tournament"])
+        self.assertIsNot(first[0], second[0])
+        self.assertTrue(second[0]._saved_in_db)
+        self.assertEqual(self.store.entries.info()["size"], 2)
+
+    async def test_get(self):
+        with test.count_queries(self.db) as execute_query:
+            await Tournament.get(pk=self.tournament.pk).cache()
+            tournament = await Tournament.get(pk=self.tournament.pk).cache()
+        self.assertEqual(execute_query.call_count, 1)
+        self.assertEqual(tournament.pk, self.tournament.pk)
+
+    async def test_key(self):
+        await Tournament.all().cache(key="tournaments")
+        self.assertEqual(
+            [
+                tournament.name
+                for tournament in await Tournament.filter(pk=-1).cache(key="tournaments")
+            ],
+            ["tournament"],
+        )
+
+    async def test_ttl(self):
+        with test.count_queries(self.db) as execute_query:
+            await Tournament.all().cache(ttl=0)
+            await Tournament.all().cache(ttl=0)
+        self.assertEqual(execute_query.call_count, 2)
+
+    async def test_invalidation(self):
+        async def fetch():
+            return sorted(tournament.name for tournament in await Tournament.all().cache())
+
+        self.assertEqual(await fetch(), ["tournament"])
+        self.tournament.name = "saved"
+        await self.tournament.save()
+        self.assertEqual(await fetch(), ["saved"])
+        await Tournament.bulk_create([Tournament(name="bulk")])
+        self.assertEqual(await fetch(), ["bulk", "saved"])
+        await Tournament.filter(name="bulk").update(name="updated")
+        self.assertEqual(await fetch(), ["saved", "updated"])
+        await Tournament.filter(name="updated").delete()
+        self.assertEqual(await fetch(), ["saved"])
+        await self.event.delete()
+        await self.tournament.delete()
+        self.assertEqual(await fetch(), [])
+
+    async def test_joined_tables(self):
+        event = await Event.get(name="event").select_related("tournament").cache()
+        self.assertEqual(event.tournament.name, "tournament")
+        await Tournament.filter(pk=self.tournament.pk).update(name="updated")
+        event = await Event.get(name="event").select_related("tournament").cache()
+        self.assertEqual(event.tournament.name, "updated")
+
+    async def test_m2m(self):
+        team = await Team.create(name="A")
+
+        async def fetch():
+            return await Event.filter(participants__name="A").cache()
+
+        self.assertEqual(await fetch(), [])
+        await self.event.participants.add(team)
+        self.assertEqual(await fetch(), [self.event])
+        await self.event.participants.remove(team)
+        self.assertEqual(await fetch(), [])
+        await self.event.participants.add(team)
+        self.assertEqual(await fetch(), [self.event])
+        await self.event.participants.clear()
+        self.assertEqual(await fetch(), [])
+
+    async def test_prefetch(self):
+        tournament = await Tournament.get(name="tournament").prefetch_related("events").cache()
+        await Event.create(name="other", tournament=self.tournament)
+        tournament = await Tournament.get(name="tournament").prefetch_related("events").cache()
+        self.assertEqual(len(tournament.events), 2)
+
+    async def test_store(self):
+        store = PickleCacheStore()
+        set_cache_store(store)
+        await Tournament.all().cache()
+        tournaments = await Tournament.all().cache()
+        self.assertEqual([tournament.name for tournament in tournaments], ["tournament"])
+        self.assertIs(get_cache_store(), store)
+        self.assertEqual(len(store.entries), 1)
+
+    async def test_rollback(self):
+        try:
+            async with in_transaction() as connection:
+                await Tournament.create(name="uncommitted", using_db=connection)
+                tournaments = await Tournament.all().using_db(connection).cache()
+                self.assertEqual(len(tournaments), 2)
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertEqual(await Tournament.all().cache(), [self.tournament])
+
+    async def test_commit(self):
+        async with in_transaction() as connection:
+            await Tournament.filter(pk=self.tournament.pk).using_db(connection).update(name="a")
+            await self.event.participants.add(await Team.create(name="A"), using_db=connection)
+            tables = ["event_team", "tournament"]
+            # Readers outside of the transaction could cache the committed rows at these versions
+            versions = await self.store.get_versions(tables)
+        committed = await self.store.get_versions(tables)
+        self.assertTrue(all(new > old for old, new in zip(versions, committed)))
@@ -0,0 +1,87 @@
+from tests.testmodels import Event, Team, Tournament
+from tortoise.contrib import test
+from tortoise.functions import Count
+from tortoise.identity import current_identity_map, identity_map
+from tortoise.transactions import in_transaction
+
+
+class TestIdentityMap(test.TestCase):
+    async def setUp(self):
+        self.tournament = await Tournament.create(name="tournament")
+        self.event = await Event.create(name="event", tournament=self.tournament)
+        self.team = await Team.create(name="team")
+        await self.event.participants.add(self.team)
+
+    async def test_queries(self):
+        with identity_map():
+            tournament = await Tournament.get(name="tournament")
+            self.assertIs(await Tournament.filter(pk=self.tournament.pk).first(), tournament)
+            self.assertIs((await Tournament.all())[0], tournament)
+            event = await Event.get(pk=self.event.pk).select_related("tournament")
+            self.assertIs(event.tournament, tournament)
+        self.assertIsNot(await Tournament.get(name="tournament"), tournament)
+
+    async def test_prefetch(self):
+        with identity_map():
+            team = await Team.get(name="team")
+            event = await Event.get(name="event").prefetch_related("participants", "tournament")
+            self.assertIs(event.participants[0], team)
+            tournament = await Tournament.get(name="tournament").prefetch_related("events")
+            self.assertIs(tournament.events[0], event)
+            self.assertIs(event.tournament, tournament)
+
+    async def test_get_pk(self):
+        with identity_map():
+            tournament = await Tournament.get(name="tournament")
+            with test.count_queries(Tournament._meta.db) as execute_query:
+                self.assertIs(await Tournament.get(pk=self.tournament.pk), tournament)
+                self.assertIs(await Tournament.get(id=str(self.tournament.pk)), tournament)
+            self.assertEqual(execute_query.call_count, 0)
+
+    async def test_partial(self):
+        with identity_map():
+            partial = await Tournament.get(name="tournament").only("id", "name")
+            tournament = await Tournament.get(name="tournament")
+            self.assertIsNot(tournament, partial)
+            self.assertIs(await Tournament.get(pk=self.tournament.pk), tournament)
+
+    async def test_annotated(self):
+        with identity_map():
+            tournament = await Tournament.get(name="tournament")
+            annotated = await Tournament.annotate(events_count=Count("events")).get(
+                name="tournament"
+            )
+            self.assertIsNot(annotated, tournament)
+            self.assertEqual(annotated.events_count, 1)
+            self.assertFalse(hasattr(tournament, "events_count"))
+            event = (
+                await Event.annotate(teams_count=Count("participants"))
+                .get(name="event")
+                .select_related("tournament")
+            )
+            self.assertIs(event.tournament, tournament)
+
+    async def test_discard(self):
+        with identity_map() as instances:
+            tournament = await Tournament.get(name="tournament")
+            instances.discard(Tournament, str(tournament.pk))
+            self.assertIsNone(instances.get(Tournament, tournament.pk))
+
+    async def test_write_invalidation(self):
+        with identity_map() as instances:
+            tournament = await Tournament.get(name="tournament")
+            await Tournament.filter(pk=tournament.pk).update(name="updated")
+            self.assertIsNone(instances.get(Tournament, tournament.pk))
+            self.assertEqual((await Tournament.get(pk=tournament.pk)).name, "updated")
+
+            event = await Event.get(name="event")
+            await event.delete()
+            self.assertIsNone(instances.get(Event, event.pk))
+
+    async def test_transaction(self):
+        with identity_map() as instances:
+            async with in_transaction():
+                tournament = await Tournament.get(name="tournament")
+                self.assertIs(instances.get(Tournament, tournament.pk), tournament)
+            self.assertIsNone(instances.get(Tournament, tournament.pk))
+        self.assertIsNone(current_identity_map.get())
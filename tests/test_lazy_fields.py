@@ -0,0 +1,65 @@
+from tests.testmodels import LazyJSONFields
+from tortoise.contrib import test
+
+
+class TestLazyFields(test.TestCase):
+    async def setUp(self) -> None:
+        self.obj = await LazyJSONFields.create(name="Test", data={"a": [1, 2]})
+
+    async def test_get(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+
+        self.assertIn("_data_raw", obj.__dict__)
+        self.assertNotIn("data", obj.__dict__)
+        self.assertEqual(obj.name, "Test")
+        self.assertEqual(obj.data, {"a": [1, 2]})
+        self.assertIsNone(obj.data_null)
+        self.assertNotIn("_data_raw", obj.__dict__)
+        self.assertIs(obj.data, obj.data)
+
+    async def test_partial(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk).only("id", "data")
+
+        self.assertEqual(obj.data, {"a": [1, 2]})
+        with self.assertRaises(AttributeError):
+            _ = obj.data_null
+
+    async def test_save_untouched(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        obj.name = "Updated"
+        await obj.save()
+
+        self.assertIn("_data_raw", obj.__dict__)
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        self.assertEqual(obj.name, "Updated")
+        self.assertEqual(obj.data, {"a": [1, 2]})
+
+    async def test_save_decoded(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        obj.data["a"].append(3)
+        await obj.save()
+
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        self.assertEqual(obj.data, {"a": [1, 2, 3]})
+
+    async def test_save_assigned(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        obj.data = {"b": 1}
+
+        self.assertNotIn("_data_raw", obj.__dict__)
+        await obj.save()
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        self.assertEqual(obj.data, {"b": 1})
+
+    async def test_bulk_update(self):
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        obj.name = "Updated"
+        await LazyJSONFields.bulk_update([obj], fields=["name", "data"])
+
+        obj = await LazyJSONFields.get(pk=self.obj.pk)
+        self.assertEqual(obj.name, "Updated")
+        self.assertEqual(obj.data, {"a": [1, 2]})
+
+    async def test_auto_now_not_lazy(self):
+        self.assertNotIn("modified", LazyJSONFields._meta.lazy_fields)
+        self.assertIn("data", LazyJSONFields._meta.lazy_fields)
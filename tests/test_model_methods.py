@@ -10,6 +10,8 @@ from tests.testmodels import (
     RequiredPKModel,
     Team,
     Tournament,
+    UniqueName,
+    UniqueTogetherFieldsWithFK,
     UUIDFkRelatedNullModel,
 )
 from tortoise.contrib import test
@@ -63,6 +65,42 @@ class TestModelCreate(test.TestCase):
         with self.assertRaises(IntegrityError):
             await UUIDFkRelatedNullModel.create(id=cid, name="Test")
 
+    async def test_get_or_create_unique(self):
+        mdl, created = await UniqueName.get_or_create(name="Test")
+        self.assertTrue(created)
+        self.assertIsNotNone(mdl.id)
+        mdl2, created = await UniqueName.get_or_create(name="Test")
+        self.assertFalse(created)
+        self.assertEqual(mdl, mdl2)
+
+    async def test_get_or_create_unique_together(self):
+        tournament = await Tournament.create(name="Tournament")
+        mdl, created = await UniqueTogetherFieldsWithFK.get_or_create(
+            text="Test", tournament=tournament
+        )
+        self.assertTrue(created)
+        mdl2, created = await UniqueTogetherFieldsWithFK.get_or_create(
+            text="Test", tournament_id=tournament.id
+        )
+        self.assertFalse(created)
+        self.assertEqual(mdl, mdl2)
+        self.assertEqual(await UniqueTogetherFieldsWithFK.all().count(), 1)
+
+    async def test_update_or_create_unique(self):
+        tournament = await Tournament.create(name="Tournament")
+        tournament2 = await Tournament.create(name="Tournament2")
+        mdl, created = await UniqueTogetherFieldsWithFK.update_or_create(
+            text="Test", defaults={"tournament": tournament}
+        )
+        self.assertTrue(created)
+        mdl2, created = await UniqueTogetherFieldsWithFK.update_or_create(
+            id=mdl.id, defaults={"tournament": tournament2}
+        )
+        self.assertFalse(created)
+        self.assertEqual(mdl, mdl2)
+        mdl3 = await UniqueTogetherFieldsWithFK.get(id=mdl.id)
+        self.assertEqual(mdl3.tournament_id, tournament2.id)
+
     async def test_clone_pk_required_error(self):
         mdl = await RequiredPKModel.create(id="A", name="name_a")
         with self.assertRaises(ParamsError):
@@ -160,6 +198,18 @@ class TestModelMethods(test.TestCase):
         mdl2 = await self.cls.get(name="Test2")
         self.assertEqual(mdl, mdl2)
 
+    async def test_update_or_create(self):
+        mdl, created = await self.cls.update_or_create(name="Test", defaults={"desc": "Desc"})
+        self.assertFalse(created)
+        self.assertEqual(self.mdl, mdl)
+        self.assertEqual((await self.cls.get(name="Test")).desc, "Desc")
+        mdl, created = await self.cls.update_or_create(name="Test2", defaults={"desc": "Desc2"})
+        self.assertTrue(created)
+        self.assertNotEqual(self.mdl, mdl)
+        mdl2 = await self.cls.get(name="Test2")
+        self.assertEqual(mdl, mdl2)
+        self.assertEqual(mdl2.desc, "Desc2")
+
     async def test_first(self):
         mdl = await self.cls.first()
         self.assertEqual(self.mdl.id, mdl.id)
@@ -333,6 +383,20 @@ class TestModelConstructor(test.TestCase):
     async def test_fk_saved(self):
         await Event.create(name="a", tournament=await Tournament.create(name="a"))
 
+    async def test_defaults(self):
+        tournament = await Tournament.create(name="a")
+        event = Event(name="a", tournament=tournament)
+        event2 = Event(name="b", tournament_id=tournament.pk, token="token")
+
+        self.assertEqual(event.tournament_id, tournament.pk)
+        self.assertIsNone(event.alias)
+        self.assertIsNone(event.reporter_id)
+        self.assertNotEqual(event.token, Event(name="c").token)
+        self.assertEqual(event2.token, "token")
+        self.assertEqual(event2.tournament_id, tournament.pk)
+        self.assertFalse(event._custom_generated_pk)
+        self.assertTrue(Event(event_id=1, name="a")._custom_generated_pk)
+
     async def test_noneawaitable(self):
         self.assertFalse(NoneAwaitable)
         self.assertIsNone(await NoneAwaitable)
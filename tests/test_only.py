@@ -57,6 +57,25 @@ class TestOnlyStraight(test.TestCase):
         instance2 = await self.model.get(pk=self.instance.pk)
         self.assertEqual(instance2.chars, "Test1")
 
+    async def test_hydration_plan(self):
+        instance_part = await self.model.get(chars="Test").only("chars", "eyedee")
+
+        self.assertTrue(instance_part._partial)
+        self.assertEqual(instance_part.eyedee, self.instance.eyedee)
+        self.assertEqual(instance_part.chars, "Test")
+        plan = self.model._meta.get_hydration_plan(("chars", "eyedee"))
+        self.assertTrue(plan[0])
+        self.assertEqual(
+            sorted(field for _, field, *_ in plan[1] + plan[2] + plan[3]), ["chars", "eyedee"]
+        )
+        self.assertIs(self.model._meta.get_hydration_plan(("chars", "eyedee")), plan)
+
+    async def test_hydration_plan_all_fields(self):
+        instance = await self.model.get(chars="Test")
+
+        self.assertFalse(instance._partial)
+        self.assertEqual(instance.blip, "BLIP")
+
 
 class TestOnlySource(TestOnlyStraight):
     async def setUp(self) -> None:
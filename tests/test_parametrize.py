@@ -0,0 +1,150 @@
+from unittest import TestCase as _TestCase
+
+from tests.testmodels import CharFields, Event, IntFields, Tournament
+from tortoise.contrib import test
+from tortoise.functions import Count
+from tortoise.queryset import QUERY_SHAPE_CACHE
+from tortoise.utils import LRUCache
+
+
+class TestParametrizeQueries(test.TestCase):
+    async def setUp(self):
+        self.db = IntFields._meta.db
+        self.executor = self.db.executor_class(model=IntFields, db=self.db)
+        self.parametrize_queries = self.db.parametrize_queries
+        self.db.parametrize_queries = True
+        for intnum in range(10, 40, 10):
+            await IntFields.create(intnum=intnum)
+
+    async def tearDown(self):
+        self.db.parametrize_queries = self.parametrize_queries
+
+    def _parametrize(self, queryset):
+        queryset._make_query()
+        return self.executor.parametrize_query(queryset.query)
+
+    def test_parametrize_query(self):
+        sql, values = self._parametrize(
+            IntFields.filter(intnum__gte=10, intnum__in=[20, 30]).only("id")
+        )
+        placeholders = [self.executor.parameter(pos).get_sql() for pos in range(3)]
+        self.assertEqual(values, [10, 20, 30])
+        for placeholder in placeholders:
+            self.assertIn(placeholder, sql)
+        self.assertNotIn("20", sql)
+
+    def test_parametrize_query_same_shape(self):
+        sql1, values1 = self._parametrize(IntFields.filter(intnum=10))
+        sql2, values2 = self._parametrize(IntFields.filter(intnum=20))
+        self.assertEqual(sql1, sql2)
+        self.assertEqual(values1, [10])
+        self.assertEqual(values2, [20])
+
+    def test_parametrize_query_without_values(self):
+        queryset = IntFields.filter(intnum__isnull=True)
+        self.assertEqual(self._parametrize(queryset), (queryset.sql(), None))
+
+    async def test_filter(self):
+        self.assertEqual(
+            await IntFields.filter(intnum__gt=10)
+            .order_by("intnum")
+            .values_list("intnum", flat=True),
+            [20, 30],
+        )
+        self.assertEqual(await IntFields.filter(intnum__in=[10, 30]).count(), 2)
+        self.assertTrue(await IntFields.filter(intnum__range=[15, 25]).exists())
+        self.assertEqual(await IntFields.filter(intnum=30).values("intnum"), [{"intnum": 30}])
+
+    async def test_update_delete(self):
+        self.assertEqual(await IntFields.filter(intnum=10).update(intnum_null=1), 1)
+        self.assertEqual(await IntFields.filter(intnum_null=1).delete(), 1)
+        self.assertEqual(await IntFields.all().count(), 2)
+
+    async def test_literal_percent(self):
+        await CharFields.create(char="100%")
+        await CharFields.create(char="100")
+        obj = await CharFields.get(char__startswith="100%", char="100%")
+        self.assertEqual(obj.char, "100%")
+
+
+class TestQueryShapeCache(test.TestCase):
+    async def setUp(self):
+        self.db = Tournament._meta.db
+        self.parametrize_queries = self.db.parametrize_queries
+        self.db.parametrize_queries = True
+        QUERY_SHAPE_CACHE.clear()
+        self.tournament1 = await Tournament.create(name="1")
+        self.tournament2 = await Tournament.create(name="2")
+        await Event.create(name="Event1", tournament=self.tournament1)
+        await Event.create(name="Event2", tournament=self.tournament2)
+
+    async def tearDown(self):
+        self.db.parametrize_queries = self.parametrize_queries
+
+    async def test_same_shape_hits(self):
+        self.assertEqual(await Tournament.filter(name="1"), [self.tournament1])
+        self.assertEqual(QUERY_SHAPE_CACHE.info()["misses"], 1)
+        self.assertEqual(await Tournament.filter(name="2"), [self.tournament2])
+        self.assertEqual(await Tournament.filter(name="3"), [])
+        self.assertEqual(
+            QUERY_SHAPE_CACHE.info(), {"hits": 2, "misses": 1, "size": 1, "maxsize": 256}
+        )
+
+    async def test_different_shapes_miss(self):
+        await Tournament.filter(name="1")
+        await Tournament.filter(name="1").order_by("-id")
+        await Tournament.filter(name__in=["1"])
+        await Tournament.filter(name__in=["1", "2"])
+        await Tournament.filter(name="1").limit(1)
+        self.assertEqual(QUERY_SHAPE_CACHE.hits, 0)
+        self.assertEqual(QUERY_SHAPE_CACHE.misses, 5)
+
+    async def test_select_related(self):
+        event = await Event.filter(tournament__name="1").select_related("tournament").first()
+        self.assertEqual(event.tournament.name, "1")
+        event = await Event.filter(tournament__name="2").select_related("tournament").first()
+        self.assertEqual(event.tournament.name, "2")
+        self.assertEqual(QUERY_SHAPE_CACHE.hits, 1)
+
+    async def test_get(self):
+        self.assertEqual(await Tournament.get(pk=self.tournament1.pk), self.tournament1)
+        self.assertEqual(await Tournament.get(pk=self.tournament2.pk), self.tournament2)
+        self.assertEqual(QUERY_SHAPE_CACHE.hits, 1)
+
+    async def test_inlined_values_not_cached(self):
+        self.assertEqual(await Tournament.filter(name__contains="1"), [self.tournament1])
+        self.assertEqual(await Tournament.filter(name__contains="2"), [self.tournament2])
+        self.assertEqual(QUERY_SHAPE_CACHE.hits, 0)
+
+    async def test_annotations_not_cached(self):
+        for _ in range(2):
+            await Tournament.annotate(events_count=Count("events")).filter(events_count=1)
+        self.assertEqual(QUERY_SHAPE_CACHE.info()["size"], 0)
+
+    async def test_not_parametrized(self):
+        self.db.parametrize_queries = False
+        await Tournament.filter(name="1")
+        self.assertEqual(QUERY_SHAPE_CACHE.info()["misses"], 0)
+
+
+class TestLRUCache(_TestCase):
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.info(), {"hits": 2, "misses": 1, "size": 2, "maxsize": 2})
+
+    def test_resize(self):
+        cache = LRUCache(maxsize=3)
+        for key in "abc":
+            cache.set(key, key)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("c"), "c")
+        cache.resize(0)
+        cache.set("d", "d")
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,100 @@
+from tests.testmodels import PKCachedMembership, PKCachedUser, Tournament
+from tortoise.contrib import test
+from tortoise.transactions import in_transaction
+
+
+class TestPKCache(test.TruncationTestCase):
+    async def setUp(self):
+        self.pk_cache = PKCachedUser._meta.pk_cache
+        self.pk_cache.clear()
+        self.user = await PKCachedUser.create(name="user")
+        self.membership = await PKCachedMembership.create(user=self.user)
+        self.db = PKCachedUser._meta.db
+
+    async def test_get(self):
+        self.assertEqual(len(self.pk_cache.rows), 0)
+        first = await PKCachedUser.get(pk=self.user.pk)
+        with test.count_queries(self.db) as execute_query:
+            user = await PKCachedUser.get(pk=self.user.pk)
+            user_by_id = await PKCachedUser.get(id=str(self.user.pk))
+            user_by_key = await PKCachedUser[self.user.pk]
+        self.assertEqual(execute_query.call_count, 0)
+        self.assertIsNot(user, first)
+        self.assertEqual((user.pk, user.name), (self.user.pk, "user"))
+        self.assertTrue(user._saved_in_db)
+        self.assertEqual(user_by_id.name, "user")
+        self.assertEqual(user_by_key.name, "user")
+
+    async def test_populated_by_queries(self):
+        await PKCachedUser.all()
+        membership = await PKCachedMembership.get(pk=self.membership.pk)
+        with test.count_queries(self.db) as execute_query:
+            user = await membership.user
+        self.assertEqual(execute_query.call_count, 0)
+        self.assertEqual(user.name, "user")
+
+    async def test_select_related(self):
+        await PKCachedMembership.all().select_related("user")
+        with test.count_queries(self.db) as execute_query:
+            await PKCachedUser.get(pk=self.user.pk)
+        self.assertEqual(execute_query.call_count, 0)
+
+    async def test_partial(self):
+        await PKCachedUser.all().only("id")
+        self.assertEqual(len(self.pk_cache.rows), 0)
+
+    async def test_get_or_none(self):
+        await PKCachedUser.all()
+        self.assertIsNone(await PKCachedUser.get_or_none(pk=-1))
+        with self.assertRaises(KeyError):
+            await PKCachedUser[-1]
+
+    async def test_invalidation(self):
+        user = await PKCachedUser.get(pk=self.user.pk)
+        user.name = "saved"
+        await user.save()
+        self.assertEqual((await PKCachedUser.get(pk=user.pk)).name, "saved")
+
+        await PKCachedUser.filter(pk=user.pk).update(name="updated")
+        self.assertEqual((await PKCachedUser.get(pk=user.pk)).name, "updated")
+
+        await PKCachedUser.bulk_update([PKCachedUser(id=user.pk, name="bulk")], fields=["name"])
+        self.assertEqual((await PKCachedUser.get(pk=user.pk)).name, "bulk")
+
+        await self.membership.delete()
+        await user.delete()
+        self.assertIsNone(await PKCachedUser.get_or_none(pk=user.pk))
+        self.assertEqual(len(self.pk_cache.rows), 0)
+
+    def test_disabled(self):
+        self.assertIsNone(Tournament._meta.pk_cache)
+
+    async def test_transaction(self):
+        await PKCachedUser.all()
+        try:
+            async with in_transaction() as connection:
+                with test.count_queries(connection) as execute_query:
+                    user = await PKCachedUser.get(pk=self.user.pk)
+                    self.assertEqual(user.name, "user")
+                    self.assertEqual(execute_query.call_count, 1)
+                self.pk_cache.clear()
+                await PKCachedUser.create(name="uncommitted")
+                await PKCachedUser.all()
+                self.assertEqual(len(self.pk_cache.rows), 0)
+                raise ValueError()
+        except ValueError:
+            pass
+        self.assertEqual(len(self.pk_cache.rows), 0)
+        self.assertEqual([user.name for user in await PKCachedUser.all()], ["user"])
+
+    async def test_commit(self):
+        _, committed_rows = await self.db.execute_query(
+            f"SELECT * FROM {PKCachedUser._meta.db_table}"
+        )
+        async with in_transaction() as connection:
+            await PKCachedUser.filter(pk=self.user.pk).using_db(connection).update(name="updated")
+            # A reader outside of the transaction still loads, and caches, the committed row
+            PKCachedUser._init_from_db_rows(committed_rows, cache_rows=True)
+            self.assertEqual(len(self.pk_cache.rows), 1)
+        self.assertEqual(len(self.pk_cache.rows), 0)
+        self.assertEqual((await PKCachedUser.get(pk=self.user.pk)).name, "updated")
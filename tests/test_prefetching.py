@@ -52,6 +52,20 @@ class TestPrefetching(test.TestCase):
         )
         self.assertEqual(len(fetched_events.participants), 1)
 
+    async def test_prefetch_m2m_shared(self):
+        tournament = await Tournament.create(name="tournament")
+        team = await Team.create(name="1")
+        team_second = await Team.create(name="2")
+        for name in ("First", "Second", "Third"):
+            event = await Event.create(name=name, tournament=tournament)
+            await event.participants.add(team, team_second)
+        events = await Event.all().order_by("name").prefetch_related("participants")
+        self.assertEqual(
+            [sorted(team.name for team in event.participants) for event in events],
+            [["1", "2"]] * 3,
+        )
+        self.assertEqual(len({id(team) for event in events for team in event.participants}), 2)
+
     async def test_prefetch_o2o(self):
         tournament = await Tournament.create(name="tournament")
         event = await Event.create(name="First", tournament=tournament)
@@ -150,3 +164,67 @@ class TestPrefetching(test.TestCase):
             Prefetch("tournament", queryset=Tournament.all(), to_attr="to_attr_tournament")
         )
         self.assertEqual(event.to_attr_tournament.id, tournament.id)
+
+
+class TestPrefetchingChunks(test.TestCase):
+    async def setUp(self):
+        self.db = Tournament._meta.db
+        self.prefetch_chunk_size = self.db.prefetch_chunk_size
+        self.db.prefetch_chunk_size = 2
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(5)]
+        self.events = [
+            await Event.create(name=f"{tournament.name}-{i}", tournament=tournament)
+            for tournament in self.tournaments
+            for i in range(2)
+        ]
+        self.teams = [await Team.create(name=str(i)) for i in range(3)]
+        for event in self.events:
+            await event.participants.add(*self.teams[: event.pk % 3 + 1])
+
+    async def tearDown(self):
+        self.db.prefetch_chunk_size = self.prefetch_chunk_size
+
+    def test_chunks(self):
+        executor = self.db.executor_class(model=Event, db=self.db)
+        self.assertEqual(
+            executor._get_prefetch_chunks(Tournament.all(), [1, 2, 1, 3, 2, 4, 5]),
+            [[1, 2], [3, 4], [5]],
+        )
+        self.assertEqual(
+            executor._get_prefetch_chunks(Tournament.all().limit(10), [1, 2, 1, 3]), [[1, 2, 3]]
+        )
+        self.db.prefetch_chunk_size = 0
+        self.assertEqual(executor._get_prefetch_chunks(Tournament.all(), [1, 2, 1]), [[1, 2]])
+
+    async def test_reverse_fk(self):
+        tournaments = await Tournament.all().order_by("id").prefetch_related("events")
+        self.assertEqual(
+            [[event.name for event in tournament.events] for tournament in tournaments],
+            [[f"{i}-0", f"{i}-1"] for i in range(5)],
+        )
+
+    async def test_direct(self):
+        events = await Event.all().order_by("event_id").prefetch_related("tournament")
+        self.assertEqual(
+            [event.tournament.name for event in events], [str(i // 2) for i in range(10)]
+        )
+
+    async def test_m2m(self):
+        events = await Event.all().order_by("event_id").prefetch_related("participants")
+        self.assertEqual(
+            [sorted(team.name for team in event.participants) for event in events],
+            [[str(i) for i in range(event.pk % 3 + 1)] for event in events],
+        )
+
+    @test.requireCapability(dialect="postgres")
+    async def test_any(self):
+        self.db.prefetch_any = True
+        parametrize_queries = self.db.parametrize_queries
+        self.db.parametrize_queries = True
+        try:
+            await self.test_reverse_fk()
+            await self.test_direct()
+            await self.test_m2m()
+        finally:
+            self.db.prefetch_any = False
+            self.db.parametrize_queries = parametrize_queries
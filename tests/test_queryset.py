@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from tests.testmodels import Event, IntFields, MinRelation, Node, Reporter, Tournament, Tree
 from tortoise import Tortoise
 from tortoise.contrib import test
@@ -9,6 +11,7 @@ from tortoise.exceptions import (
     ParamsError,
 )
 from tortoise.expressions import F
+from tortoise.functions import Upper
 
 # TODO: Test the many exceptions in QuerySet
 # TODO: .filter(intnum_null=None) does not work as expected
@@ -237,6 +240,140 @@ class TestQueryset(test.TestCase):
 
         self.assertEqual(await IntFields.all().count(), counter)
 
+    async def test_iterator(self):
+        intnums = [obj.intnum async for obj in IntFields.all().order_by("intnum").iterator(7)]
+        self.assertEqual(intnums, list(range(10, 100, 3)))
+
+    async def test_iterator_queries_between_chunks(self):
+        seen = []
+        async for obj in IntFields.filter(intnum__lt=40).order_by("intnum").iterator(2):
+            seen.append(obj.intnum)
+            await IntFields.filter(id=obj.id).update(intnum_null=obj.intnum)
+        self.assertEqual(seen, list(range(10, 40, 3)))
+        self.assertEqual(await IntFields.filter(intnum_null__isnull=False).count(), 10)
+
+    async def test_iterator_break(self):
+        async for obj in IntFields.all().order_by("intnum").iterator(5):
+            if obj.intnum == 22:
+                break
+        self.assertEqual(await IntFields.all().count(), 30)
+
+    async def test_iterator_close(self):
+        db = IntFields._meta.db
+        execute_query_stream = db.execute_query_stream
+        streams = []
+
+        def stream(*args):
+            streams.append(execute_query_stream(*args))
+            return streams[-1]
+
+        with patch.object(db, "execute_query_stream", stream):
+            for query in [
+                IntFields.all().order_by("intnum"),
+                IntFields.all().order_by("intnum").values_list("intnum", flat=True),
+                IntFields.all().order_by("intnum").values("intnum"),
+            ]:
+                iterator = query.iterator(5)
+                async for _ in iterator:
+                    break
+                await iterator.aclose()
+        # Closed generators have no frame left
+        self.assertEqual([stream.ag_frame for stream in streams], [None, None, None])
+        self.assertEqual(await IntFields.all().count(), 30)
+
+    async def test_iterator_prefetch(self):
+        tournament = await Tournament.create(name="Tournament")
+        tournament2 = await Tournament.create(name="Tournament2")
+        await Event.create(name="Event", tournament=tournament)
+        await Event.create(name="Event2", tournament=tournament2)
+        await Event.create(name="Event3", tournament=tournament2)
+        names = [
+            (obj.name, sorted(event.name for event in obj.events))
+            async for obj in Tournament.all()
+            .order_by("name")
+            .prefetch_related("events")
+            .iterator(1)
+        ]
+        self.assertEqual(names, [("Tournament", ["Event"]), ("Tournament2", ["Event2", "Event3"])])
+
+    async def test_iterator_values(self):
+        self.assertEqual(
+            [
+                row
+                async for row in IntFields.filter(intnum__lt=20)
+                .order_by("intnum")
+                .values("intnum")
+                .iterator(2)
+            ],
+            [{"intnum": 10}, {"intnum": 13}, {"intnum": 16}, {"intnum": 19}],
+        )
+        self.assertEqual(
+            [
+                row
+                async for row in IntFields.filter(intnum__lt=20)
+                .order_by("intnum")
+                .values_list("intnum")
+            ],
+            [(10,), (13,), (16,), (19,)],
+        )
+        self.assertEqual(
+            [
+                intnum
+                async for intnum in IntFields.filter(intnum__lt=20)
+                .order_by("intnum")
+                .values_list("intnum", flat=True)
+                .iterator(3)
+            ],
+            [10, 13, 16, 19],
+        )
+
+    async def test_iterate_by_key(self):
+        intnums = [obj.intnum async for obj in IntFields.all().iterate_by_key(batch_size=7)]
+        self.assertEqual(intnums, list(range(10, 100, 3)))
+        intnums = [
+            obj.intnum
+            async for obj in IntFields.filter(intnum__gte=40)
+            .order_by("-intnum")
+            .only("id", "intnum")
+            .iterate_by_key("intnum", batch_size=5)
+        ]
+        self.assertEqual(intnums, list(range(40, 100, 3)))
+
+    async def test_iterate_by_key_exact_batches(self):
+        intnums = [obj.intnum async for obj in IntFields.all().iterate_by_key(batch_size=10)]
+        self.assertEqual(intnums, list(range(10, 100, 3)))
+
+    async def test_iterate_by_key_prefetch(self):
+        for name in ("A", "B", "C"):
+            tournament = await Tournament.create(name=name)
+            await Event.create(name=f"Event{name}", tournament=tournament)
+        names = [
+            (obj.name, [event.name for event in obj.events])
+            async for obj in Tournament.all()
+            .prefetch_related("events")
+            .iterate_by_key(batch_size=2)
+        ]
+        self.assertEqual(names, [("A", ["EventA"]), ("B", ["EventB"]), ("C", ["EventC"])])
+
+    async def test_iterate_by_key_invalid(self):
+        with self.assertRaises(ParamsError):
+            async for _ in IntFields.all().iterate_by_key(batch_size=0):
+                pass
+        with self.assertRaises(ParamsError):
+            async for _ in IntFields.all().limit(10).iterate_by_key():
+                pass
+        with self.assertRaises(FieldError):
+            async for _ in IntFields.all().iterate_by_key("unknown"):
+                pass
+        with self.assertRaises(FieldError):
+            async for _ in IntFields.all().only("intnum").iterate_by_key():
+                pass
+
+    async def test_iterator_invalid(self):
+        with self.assertRaises(ParamsError):
+            async for _ in IntFields.all().iterator(0):
+                pass
+
     async def test_update_basic(self):
         obj0 = await IntFields.create(intnum=2147483647)
         await IntFields.filter(id=obj0.id).update(intnum=2147483646)
@@ -362,3 +499,38 @@ class TestQueryset(test.TestCase):
         self.assertEqual(tree.parent.name, parent_node.name)
         self.assertEqual(tree.child.pk, child_node.pk)
         self.assertEqual(tree.child.name, child_node.name)
+
+    async def test_init_from_db_rows(self):
+        tournament = await Tournament.create(name="1", desc="Desc")
+        await Event.create(name="1", tournament=tournament, token="a")
+        events = await Event.all().annotate(upper_name=Upper("name"))
+
+        rows = await self.db.execute_query_dict(Event.all().sql())
+        event = Event._init_from_db(**rows[0])
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].__dict__, {**event.__dict__, "upper_name": "1"})
+        self.assertFalse(events[0]._partial)
+        self.assertTrue(events[0]._saved_in_db)
+
+    async def test_init_from_db_rows_partial(self):
+        tournament = await Tournament.create(name="1")
+        tournament = await Tournament.all().only("id", "name").get()
+        self.assertTrue(tournament._partial)
+        self.assertEqual(tournament.name, "1")
+
+    async def test_select_related_many_rows(self):
+        tournament = await Tournament.create(name="1")
+        tournament2 = await Tournament.create(name="2")
+        reporter = await Reporter.create(name="Reporter")
+        await Event.create(name="1", tournament=tournament, reporter=reporter)
+        await Event.create(name="2", tournament=tournament2)
+        events = (
+            await Event.all()
+            .select_related("tournament", "reporter")
+            .annotate(upper_name=Upper("name"))
+            .order_by("name")
+        )
+        self.assertEqual([event.tournament.name for event in events], ["1", "2"])
+        self.assertEqual([event.upper_name for event in events], ["1", "2"])
+        self.assertEqual(events[0].reporter.name, "Reporter")
+        self.assertIsNone(events[1].reporter.pk)
@@ -1,10 +1,15 @@
+import asyncio
 from typing import List, Optional, Type
 
-from tests.testmodels import Signals
+from tests.testmodels import Signals, Tournament
 from tortoise import BaseDBAsyncClient
 from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError
+from tortoise.signals import Signals as SignalTypes
 from tortoise.signals import post_delete, post_save, pre_delete, pre_save
 
+background_saved: List[str] = []
+
 
 @pre_save(Signals)
 async def signal_pre_save(
@@ -26,6 +31,17 @@ async def signal_post_save(
     await Signals.filter(name="test6").update(name="test_post-save")
 
 
+@post_save(Signals, background=True)
+async def signal_post_save_background(
+    sender: "Type[Signals]",
+    instance: Signals,
+    created: bool,
+    using_db: "Optional[BaseDBAsyncClient]",
+    update_fields: List,
+) -> None:
+    background_saved.append(instance.name)
+
+
 @pre_delete(Signals)
 async def signal_pre_delete(
     sender: "Type[Signals]", instance: Signals, using_db: "Optional[BaseDBAsyncClient]"
@@ -79,3 +95,32 @@ class TestSignals(test.TestCase):
 
         self.assertEqual(signal3.name, "test_pre-delete")
         self.assertEqual(signal4.name, "test_post-delete")
+
+    async def test_get_or_create(self):
+        # An upsert could skip the insert after pre_save was sent
+        self.assertIsNone(Signals._get_conflict_target(Signals._meta.db, {"id": 1}))
+
+        await Signals.filter(pk=self.signal1.pk).update(name="test1")
+        signal, created = await Signals.get_or_create(id=self.signal_save.pk)
+        self.assertFalse(created)
+        self.assertEqual((await Signals.get(pk=self.signal1.pk)).name, "test1")
+
+        signal, created = await Signals.get_or_create(
+            id=self.signal6.pk + 1, defaults={"name": "test-get-or-create"}
+        )
+        self.assertTrue(created)
+        self.assertEqual((await Signals.get(pk=self.signal1.pk)).name, "test_pre-save")
+
+    async def test_background(self):
+        background_saved.clear()
+        await Signals.create(name="test-background")
+        await asyncio.sleep(0)
+        self.assertEqual(background_saved, ["test-background"])
+
+    async def test_background_pre_signal(self):
+        with self.assertRaises(ConfigurationError):
+            Signals.register_listener(SignalTypes.pre_save, signal_pre_save, background=True)
+
+    def test_registered_signals(self):
+        self.assertEqual(Signals._meta.signals, set(SignalTypes))
+        self.assertEqual(Tournament._meta.signals, set())
@@ -0,0 +1,62 @@
+from tests.testmodels import SlotsEvent, SlotsTournament
+from tortoise.contrib import test
+from tortoise.functions import Count
+
+
+class TestSlots(test.TestCase):
+    async def setUp(self) -> None:
+        self.tournament = await SlotsTournament.create(name="Tournament")
+        self.event = await SlotsEvent.create(
+            name="Event", tournament=self.tournament, data={"a": 1}
+        )
+
+    def test_slots(self):
+        self.assertIn("name", SlotsEvent.__slots__)
+        self.assertIn("tournament_id", SlotsEvent.__slots__)
+        self.assertIn("_tournament", SlotsEvent.__slots__)
+        self.assertIn("_sponsors", SlotsEvent.__slots__)
+        self.assertNotIn("tournament", SlotsEvent.__slots__)
+
+    async def test_get(self):
+        event = await SlotsEvent.get(pk=self.event.pk)
+
+        self.assertEqual(event.name, "Event")
+        self.assertEqual(event.data, {"a": 1})
+        self.assertEqual(event.tournament_id, self.tournament.pk)
+        self.assertTrue(event._saved_in_db)
+        self.assertFalse(event._partial)
+        self.assertEqual(vars(event), {})
+
+    async def test_only(self):
+        event = await SlotsEvent.get(pk=self.event.pk).only("id", "name")
+
+        self.assertTrue(event._partial)
+        self.assertEqual(event.name, "Event")
+        with self.assertRaises(AttributeError):
+            _ = event.data
+
+    async def test_save(self):
+        event = await SlotsEvent.get(pk=self.event.pk)
+        event.name = "Updated"
+        await event.save()
+
+        self.assertEqual((await SlotsEvent.get(pk=self.event.pk)).name, "Updated")
+
+    async def test_relations(self):
+        await self.event.sponsors.add(self.tournament)
+        tournament = await SlotsTournament.get(pk=self.tournament.pk).prefetch_related(
+            "events", "sponsored_events"
+        )
+
+        self.assertEqual([event.pk for event in tournament.events], [self.event.pk])
+        self.assertEqual([event.pk for event in tournament.sponsored_events], [self.event.pk])
+        event = await SlotsEvent.get(pk=self.event.pk).select_related("tournament")
+        self.assertEqual(event.tournament.name, "Tournament")
+        self.assertEqual(await (await SlotsEvent.get(pk=self.event.pk)).tournament, tournament)
+
+    async def test_annotate(self):
+        tournament = await SlotsTournament.annotate(events_count=Count("events")).get(
+            pk=self.tournament.pk
+        )
+
+        self.assertEqual(tournament.events_count, 1)
@@ -213,3 +213,19 @@ class TestTransactions(test.TruncationTestCase):
         self.assertEqual(
             await Tournament.all().values("id", "name"), [{"id": obj.id, "name": "Test1"}]
         )
+
+    async def test_reused_executor(self):
+        db = Tournament._meta.db
+        executor = db.get_executor(Tournament)
+        self.assertIs(db.get_executor(Tournament), executor)
+        self.assertIs(executor.db, db)
+
+        try:
+            async with in_transaction() as connection:
+                self.assertIs(connection.get_executor(Tournament).db, connection)
+                await Tournament.create(name="Test1", using_db=connection)
+                raise SomeException("Some error")
+        except SomeException:
+            pass
+
+        self.assertEqual(await Tournament.all(), [])
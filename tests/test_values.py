@@ -1,7 +1,7 @@
 from tests.testmodels import Event, Team, Tournament
 from tortoise.contrib import test
 from tortoise.exceptions import FieldError
-from tortoise.functions import Length, Trim
+from tortoise.functions import Count, Length, Trim
 
 
 class TestValues(test.TestCase):
@@ -172,3 +172,57 @@ class TestValues(test.TestCase):
         self.assertEqual(
             tournaments, [{"name": "  x", "name_trim": "x"}, {"name": " y ", "name_trim": "y"}]
         )
+
+    async def test_values_list_raw(self):
+        tournament = await Tournament.create(name="New Tournament")
+        await Event.create(name="Test", tournament_id=tournament.id)
+
+        events = await Event.filter(name="Test").values_list("name", "tournament__name", raw=True)
+        self.assertEqual([tuple(event) for event in events], [("Test", "New Tournament")])
+        self.assertEqual(events[0][1], "New Tournament")
+
+    async def test_values_list_raw_flat(self):
+        await Tournament.create(name="x")
+        await Tournament.create(name="y")
+
+        tournaments = (
+            await Tournament.all().order_by("name").values_list("name", flat=True, raw=True)
+        )
+        self.assertEqual(tournaments, ["x", "y"])
+
+    async def test_values_list_raw_converted(self):
+        tournament = await Tournament.create(name="x")
+
+        tournaments = await Tournament.annotate(name_trim=Trim("name")).values_list(
+            "name", "created", "name_trim", raw=True
+        )
+        self.assertEqual(tournaments, [("x", tournament.created, "x")])
+        created = await Tournament.all().values_list("created", flat=True, raw=True)
+        self.assertEqual(created, [tournament.created])
+
+    async def test_values_list_raw_annotation_order(self):
+        tournament = await Tournament.create(name="x")
+        await Event.create(name="a", tournament=tournament)
+        await Event.create(name="b", tournament=tournament)
+
+        query = Tournament.annotate(events_count=Count("events"))
+        values = await query.values_list("id", "events_count", "name")
+        raw_values = await query.values_list("id", "events_count", "name", raw=True)
+        self.assertEqual(values, [(tournament.id, 2, "x")])
+        self.assertEqual(raw_values, values)
+        raw_flat = await query.values_list("events_count", flat=True, raw=True)
+        self.assertEqual(raw_flat, [2])
+
+    async def test_values_list_raw_iterator(self):
+        await Tournament.create(name="x")
+
+        tournaments = [
+            tuple(row) async for row in Tournament.all().values_list("name", raw=True).iterator()
+        ]
+        self.assertEqual(tournaments, [("x",)])
+
+    async def test_values_list_many_fields(self):
+        tournament = await Tournament.create(name="x")
+
+        tournaments = await Tournament.all().values_list(*["name"] * 10, "id")
+        self.assertEqual(tournaments, [("x",) * 10 + (tournament.id,)])
@@ -263,6 +263,62 @@ class JSONFields(Model):
     data_default = fields.JSONField(default={"a": 1})
 
 
+class LazyJSONFields(Model):
+    """
+    This model decodes its JSON blobs on first access
+    """
+
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=50)
+    data = fields.JSONField()
+    data_null = fields.JSONField(null=True)
+    modified = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        lazy_fields = True
+
+
+class SlotsTournament(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255)
+
+    events: fields.ReverseRelation["SlotsEvent"]
+
+    class Meta:
+        slots = True
+
+
+class SlotsEvent(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255)
+    tournament: fields.ForeignKeyRelation[SlotsTournament] = fields.ForeignKeyField(
+        "models.SlotsTournament", related_name="events"
+    )
+    sponsors: fields.ManyToManyRelation[SlotsTournament] = fields.ManyToManyField(
+        "models.SlotsTournament", related_name="sponsored_events"
+    )
+    data = fields.JSONField(null=True)
+
+    class Meta:
+        slots = True
+
+
+class PKCachedUser(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255)
+
+    class Meta:
+        pk_cache_size = 10
+        pk_cache_ttl = 60
+
+
+class PKCachedMembership(Model):
+    id = fields.IntField(pk=True)
+    user: fields.ForeignKeyRelation[PKCachedUser] = fields.ForeignKeyField(
+        "models.PKCachedUser", related_name="memberships"
+    )
+
+
 class UUIDFields(Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid1)
     data = fields.UUIDField()
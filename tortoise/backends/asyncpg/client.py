@@ -1,8 +1,20 @@
 import asyncio
 from functools import wraps
-from typing import Any, Callable, List, Optional, SupportsInt, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    SupportsInt,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import asyncpg
+from asyncpg.cursor import Cursor
 from asyncpg.transaction import Transaction
 from pypika import PostgreSQLQuery
 
@@ -67,10 +79,14 @@ class AsyncpgDBClient(BaseDBAsyncClient):
         self.schema = self.extra.pop("schema", None)
         self.extra.pop("connection_name", None)
         self.extra.pop("fetch_inserted", None)
+        self.extra.pop("parametrize_queries", None)
+        self.extra.pop("prefetch_chunk_size", None)
         self.loop = self.extra.pop("loop", None)
         self.connection_class = self.extra.pop("connection_class", self.connection_class)
         self.pool_minsize = int(self.extra.pop("minsize", 1))
         self.pool_maxsize = int(self.extra.pop("maxsize", 5))
+        self.copy_threshold = int(self.extra.pop("copy_threshold", 1000))
+        self.prefetch_any = bool(self.extra.pop("prefetch_any", False))
 
         self._template: dict = {}
         self._pool: Optional[asyncpg.pool] = None
@@ -137,14 +153,12 @@ class AsyncpgDBClient(BaseDBAsyncClient):
     async def execute_insert(self, query: str, values: list) -> Optional[asyncpg.Record]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Cache prepared statement
             return await connection.fetchrow(query, *values)
 
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Consider using copy_records_to_table instead
             transaction = connection.transaction()
             await transaction.start()
             try:
@@ -155,6 +169,19 @@ class AsyncpgDBClient(BaseDBAsyncClient):
             else:
                 await transaction.commit()
 
+    @translate_exceptions
+    async def execute_copy(self, table_name: str, columns: List[str], values: list) -> None:
+        """
+        Bulk loads the rows of values into the table with ``COPY``.
+
+        :param table_name: The table to load into.
+        :param columns: The DB columns of the values, in order.
+        :param values: The rows of values to load.
+        """
+        async with self.acquire_connection() as connection:
+            self.log.debug("COPY %s (%s): %s rows", table_name, ", ".join(columns), len(values))
+            await connection.copy_records_to_table(table_name, records=values, columns=columns)
+
     @translate_exceptions
     async def execute_query(
         self, query: str, values: Optional[list] = None
@@ -184,6 +211,30 @@ class AsyncpgDBClient(BaseDBAsyncClient):
                 return list(map(dict, await connection.fetch(query, *values)))
             return list(map(dict, await connection.fetch(query)))
 
+    async def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            # Cursors only exist within a transaction
+            async with connection.transaction():
+                cursor = await self._open_cursor(connection, query, values)
+                while True:
+                    rows = await self._fetch_cursor(cursor, chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+
+    @translate_exceptions
+    async def _open_cursor(
+        self, connection: asyncpg.Connection, query: str, values: Optional[list]
+    ) -> Cursor:
+        return await connection.cursor(query, *(values or []))
+
+    @translate_exceptions
+    async def _fetch_cursor(self, cursor: Cursor, chunk_size: int) -> List[asyncpg.Record]:
+        return await cursor.fetch(chunk_size)
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -198,6 +249,12 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
         self._trxlock = asyncio.Lock()
         self.log = connection.log
         self.connection_name = connection.connection_name
+        self.parametrize_queries = connection.parametrize_queries
+        self.prefetch_chunk_size = connection.prefetch_chunk_size
+        self._executors = {}
+        self._invalidations = []
+        self.copy_threshold = connection.copy_threshold
+        self.prefetch_any = connection.prefetch_any
         self.transaction: Transaction = None
         self._finalized = False
         self._parent = connection
@@ -212,9 +269,22 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Consider using copy_records_to_table instead
             await connection.executemany(query, values)
 
+    async def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            cursor = await self._open_cursor(connection, query, values)
+        while True:
+            # Only lock per chunk, so that the transaction can run other queries between the chunks
+            async with self.acquire_connection():
+                rows = await self._fetch_cursor(cursor, chunk_size)
+            if not rows:
+                break
+            yield rows
+
     @translate_exceptions
     async def start(self) -> None:
         self.transaction = self._connection.transaction()
@@ -225,6 +295,7 @@ class TransactionWrapper(AsyncpgDBClient, BaseTransactionWrapper):
             raise TransactionManagementError("Transaction already finalised")
         await self.transaction.commit()
         self._finalized = True
+        await self._invalidate_committed()
 
     async def rollback(self) -> None:
         if self._finalized:
@@ -1,16 +1,24 @@
 import uuid
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
 
 import asyncpg
 from pypika import Parameter
+from pypika.terms import Criterion, Term
 
 from tortoise import Model
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.executor import BaseExecutor
+from tortoise.filters import BindArray
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.asyncpg.client import AsyncpgDBClient
 
 
 class AsyncpgExecutor(BaseExecutor):
     EXPLAIN_PREFIX = "EXPLAIN (FORMAT JSON, VERBOSE)"
     DB_NATIVE = BaseExecutor.DB_NATIVE | {bool, uuid.UUID}
+    MAX_BIND_PARAMETERS = 32767
+    BULK_UPDATE_PARAMETERS_PER_FIELD = 1
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("$%d" % (pos + 1,))
@@ -35,3 +43,87 @@ class AsyncpgExecutor(BaseExecutor):
             db_projection = instance._meta.fields_db_projection_reverse
             for key, val in zip(generated_fields, results):
                 setattr(instance, db_projection[key], val)
+
+    async def _execute_bulk_insert(
+        self,
+        query: str,
+        columns: List[str],
+        values_lists: List[list],
+        batch_size: Optional[int] = None,
+        fetch_generated: bool = False,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> list:
+        db = cast("AsyncpgDBClient", self.db)
+        if (
+            not fetch_generated
+            and not on_conflict
+            and db.copy_threshold
+            and len(values_lists) >= db.copy_threshold
+        ):
+            db_projection = self.model._meta.fields_db_projection
+            await db.execute_copy(
+                self.model._meta.db_table,
+                [db_projection[column] for column in columns],
+                values_lists,
+            )
+            return []
+        return await super()._execute_bulk_insert(
+            query, columns, values_lists, batch_size, fetch_generated, on_conflict, update_fields
+        )
+
+    def _get_bulk_update_sql(self, fields: List[str], rows: int) -> str:
+        # UPDATE ... FROM (VALUES ...) binds every value once, instead of twice for CASE
+        key = ("update", tuple(fields), rows)
+        sql = self.bulk_cache.get(key)
+        if sql is None:
+            meta = self.model._meta
+            columns = [meta.db_pk_column] + [meta.fields_db_projection[field] for field in fields]
+            types = [
+                meta.fields_map[field].get_for_dialect("postgres", "SQL_TYPE")
+                for field in [meta.pk_attr] + fields
+            ]
+            values = ", ".join(
+                "("
+                + ", ".join(
+                    f"{self.parameter(row * len(columns) + pos)}::{types[pos]}"
+                    for pos in range(len(columns))
+                )
+                + ")"
+                for row in range(rows)
+            )
+            sql = (
+                f'UPDATE "{meta.db_table}" SET '
+                + ", ".join(f'"{column}"="_bulk"."{column}"' for column in columns[1:])
+                + f' FROM (VALUES {values}) AS "_bulk"('
+                + ", ".join(f'"{column}"' for column in columns)
+                + f') WHERE "{meta.db_table}"."{meta.db_pk_column}"="_bulk"."{meta.db_pk_column}"'
+            )
+            self.bulk_cache.set(key, sql)
+        return sql
+
+    async def _execute_bulk_update_batch(
+        self, db: BaseDBAsyncClient, fields: List[str], values_lists: List[list]
+    ) -> int:
+        return (
+            await db.execute_query(
+                self._get_bulk_update_sql(fields, len(values_lists)),
+                [value for values in values_lists for value in values],
+            )
+        )[0]
+
+    @property
+    def _prefetch_any(self) -> bool:
+        # Without bind parameters the array would be rendered inline, so there is nothing to gain
+        db = cast("AsyncpgDBClient", self.db)
+        return db.prefetch_any and db.parametrize_queries
+
+    def _get_prefetch_filter(self, key: str, keys: list) -> Dict[str, Any]:
+        if self._prefetch_any:
+            return {key: BindArray(keys)}
+        return super()._get_prefetch_filter(key, keys)
+
+    def _get_prefetch_criterion(self, term: Term, keys: list) -> Criterion:
+        if self._prefetch_any:
+            return term == BindArray(keys)
+        return super()._get_prefetch_criterion(term, keys)
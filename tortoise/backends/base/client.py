@@ -1,14 +1,31 @@
 import asyncio
 import logging
-from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pypika import Query
 
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
 from tortoise.exceptions import TransactionManagementError
+from tortoise.identity import clear_identity_map
 from tortoise.transactions import current_transaction_map
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
 
 class Capabilities:
     """
@@ -67,6 +84,13 @@ class BaseDBAsyncClient:
 
     Parameters get passed as kwargs, and is mostly driver specific.
 
+    :param connection_name: Name of the connection.
+    :param fetch_inserted: Should DB-generated values be fetched on insert?
+    :param parametrize_queries: Should filter values be sent as bind parameters
+        instead of being inlined into the SQL text?
+    :param prefetch_chunk_size: Max number of keys per prefetch query,
+        larger prefetches are split into concurrent queries. ``0`` disables splitting.
+
     .. attribute:: query_class
         :annotation: Type[pypika.Query]
 
@@ -93,10 +117,32 @@ class BaseDBAsyncClient:
     schema_generator: Type[BaseSchemaGenerator] = BaseSchemaGenerator
     capabilities: Capabilities = Capabilities("")
 
-    def __init__(self, connection_name: str, fetch_inserted: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        connection_name: str,
+        fetch_inserted: bool = True,
+        parametrize_queries: bool = False,
+        prefetch_chunk_size: int = 900,
+        **kwargs: Any,
+    ) -> None:
         self.log = logging.getLogger("db_client")
         self.connection_name = connection_name
         self.fetch_inserted = fetch_inserted
+        self.parametrize_queries = parametrize_queries
+        self.prefetch_chunk_size = prefetch_chunk_size
+        self._executors: Dict[Type["Model"], BaseExecutor] = {}
+
+    def get_executor(self, model: Type["Model"]) -> BaseExecutor:
+        """
+        Returns the executor for the model on this client, for operations without
+        per-query state (prefetching or ``select_related``).
+        It is only created once, and then reused.
+        """
+        try:
+            return self._executors[model]
+        except KeyError:
+            executor = self._executors[model] = self.executor_class(model=model, db=self)
+            return executor
 
     async def create_connection(self, with_db: bool) -> None:
         """
@@ -193,6 +239,24 @@ class BaseDBAsyncClient:
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    async def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        """
+        Executes a RAW SQL query statement, and yields the resultset in chunks of rows,
+        instead of loading it into memory at once.
+
+        This default implementation fetches the whole resultset, and is overridden
+        with server-side cursors where the DB driver supports them.
+
+        :param query: The SQL string, pre-parametrized for the target DB dialect.
+        :param values: A sequence of positional DB parameters.
+        :param chunk_size: The number of rows to fetch per chunk.
+        """
+        _, rows = await self.execute_query(query, values)
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start : start + chunk_size]  # noqa
+
 
 class ConnectionWrapper:
     __slots__ = ("connection", "lock")
@@ -233,6 +297,8 @@ class TransactionContext:
             else:
                 await self.connection.commit()
         current_transaction_map[self.connection_name].reset(self.token)
+        # The instances may not match the rows anymore, once the transaction ended
+        clear_identity_map()
         self.lock.release()
 
 
@@ -255,6 +321,8 @@ class TransactionContextPooled(TransactionContext):
             else:
                 await self.connection.commit()
         current_transaction_map[self.connection_name].reset(self.token)
+        # The instances may not match the rows anymore, once the transaction ended
+        clear_identity_map()
         if self.connection._parent._pool:
             await self.connection._parent._pool.release(self.connection._connection)
 
@@ -269,6 +337,7 @@ class NestedTransactionContext(TransactionContext):
                 # Can't rollback a transaction that already failed.
                 if exc_type is not TransactionManagementError:
                     await self.connection.rollback()
+        clear_identity_map()
 
 
 class NestedTransactionPooledContext(TransactionContext):
@@ -283,6 +352,7 @@ class NestedTransactionPooledContext(TransactionContext):
                 # Can't rollback a transaction that already failed.
                 if exc_type is not TransactionManagementError:
                     await self.connection.rollback()
+        clear_identity_map()
 
 
 class PoolConnectionWrapper:
@@ -301,6 +371,8 @@ class PoolConnectionWrapper:
 
 
 class BaseTransactionWrapper:
+    _invalidations: List[Callable[[], Awaitable[None]]]
+
     async def start(self) -> None:
         raise NotImplementedError()  # pragma: nocoverage
 
@@ -312,3 +384,13 @@ class BaseTransactionWrapper:
 
     async def commit(self) -> None:
         raise NotImplementedError()  # pragma: nocoverage
+
+    async def _invalidate_committed(self) -> None:
+        """
+        Repeats the cache invalidations of the writes of the transaction, once it committed.
+
+        Other connections could cache the rows that the writes replaced until then.
+        """
+        invalidations, self._invalidations = self._invalidations, []
+        for invalidate in invalidations:
+            await invalidate()
@@ -28,6 +28,10 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
             "max_cached_statement_lifetime": int,
             "max_cacheable_statement_size": int,
             "ssl": bool,
+            "parametrize_queries": bool,
+            "copy_threshold": int,
+            "prefetch_chunk_size": int,
+            "prefetch_any": bool,
         },
     },
     "sqlite": {
@@ -35,7 +39,11 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
         "skip_first_char": False,
         "vmap": {"path": "file_path"},
         "defaults": {"journal_mode": "WAL", "journal_size_limit": 16384},
-        "cast": {"journal_size_limit": int},
+        "cast": {
+            "journal_size_limit": int,
+            "parametrize_queries": bool,
+            "prefetch_chunk_size": int,
+        },
     },
     "mysql": {
         "engine": "tortoise.backends.mysql",
@@ -54,6 +62,9 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
             "echo": bool,
             "no_delay": bool,
             "use_unicode": bool,
+            "max_allowed_packet": int,
+            "parametrize_queries": bool,
+            "prefetch_chunk_size": int,
         },
     },
 }
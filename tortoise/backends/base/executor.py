@@ -6,6 +6,7 @@ from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Callable,
     Dict,
     Iterable,
@@ -20,8 +21,10 @@ from typing import (
 )
 
 from pypika import JoinType, Parameter, Query, Table
-from pypika.terms import ArithmeticExpression, Function
+from pypika.queries import QueryBuilder
+from pypika.terms import ArithmeticExpression, Case, Criterion, Function, Term
 
+from tortoise.cache import invalidate_model
 from tortoise.exceptions import OperationalError
 from tortoise.fields.base import Field
 from tortoise.fields.relational import (
@@ -30,7 +33,9 @@ from tortoise.fields.relational import (
     ManyToManyFieldInstance,
     RelationalField,
 )
+from tortoise.filters import BIND_MARKER
 from tortoise.query_utils import QueryModifier
+from tortoise.utils import LRUCache
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.backends.base.client import BaseDBAsyncClient
@@ -39,7 +44,17 @@ if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.queryset import QuerySet
 
 EXECUTOR_CACHE: Dict[
-    str, Tuple[list, str, list, str, Dict[str, Callable], str, Dict[str, str]]
+    str,
+    Tuple[
+        list,
+        str,
+        list,
+        str,
+        Dict[str, Callable],
+        str,
+        Dict[str, str],
+        LRUCache,
+    ],
 ] = {}
 
 
@@ -48,6 +63,14 @@ class BaseExecutor:
     FILTER_FUNC_OVERRIDE: Dict[Callable, Callable] = {}
     EXPLAIN_PREFIX: str = "EXPLAIN"
     DB_NATIVE = {bytes, str, int, float, decimal.Decimal, datetime.datetime, datetime.date}
+    #: Max number of bind parameters per statement, for statements with many rows
+    MAX_BIND_PARAMETERS: int = 999
+    #: Should bulk inserts use multi-row statements, instead of ``execute_many()``?
+    BULK_INSERT_MULTI_ROW: bool = False
+    #: Number of bind parameters per field per row, in a bulk update statement
+    BULK_UPDATE_PARAMETERS_PER_FIELD: int = 2
+    #: Can upserts return the inserted rows only? (``ON CONFLICT DO NOTHING RETURNING``)
+    UPSERT_RETURNING: bool = True
 
     def __init__(
         self,
@@ -57,10 +80,16 @@ class BaseExecutor:
         prefetch_queries: Optional[Dict[str, List[Tuple[Optional[str], "QuerySet"]]]] = None,
         select_related_idx: Optional[List[Tuple["Type[Model]", int, str, "Type[Model]"]]] = None,
     ) -> None:
+        from tortoise.backends.base.client import BaseTransactionWrapper
+
         self.model = model
         self.db: "BaseDBAsyncClient" = db
+        # Rows read in a transaction may not be committed, so they are kept out of the PK caches
+        self.cache_rows = not isinstance(db, BaseTransactionWrapper)
         self.prefetch_map = prefetch_map or {}
-        self._prefetch_queries = prefetch_queries or {}
+        self._prefetch_queries = {
+            field: copy(queries) for field, queries in (prefetch_queries or {}).items()
+        }
         self.select_related_idx = select_related_idx
         key = f"{self.db.connection_name}:{self.model._meta.db_table}"
         if key not in EXECUTOR_CACHE:
@@ -93,6 +122,8 @@ class BaseExecutor:
                 ).delete()
             )
             self.update_cache: Dict[str, str] = {}
+            # The row counts of the last batches vary, so only the recent statements are kept
+            self.bulk_cache = LRUCache(maxsize=16)
 
             EXECUTOR_CACHE[key] = (
                 self.regular_columns,
@@ -102,6 +133,7 @@ class BaseExecutor:
                 self.column_map,
                 self.delete_query,
                 self.update_cache,
+                self.bulk_cache,
             )
 
         else:
@@ -113,51 +145,141 @@ class BaseExecutor:
                 self.column_map,
                 self.delete_query,
                 self.update_cache,
+                self.bulk_cache,
             ) = EXECUTOR_CACHE[key]
 
     async def execute_explain(self, query: Query) -> Any:
         sql = " ".join((self.EXPLAIN_PREFIX, query.get_sql()))
         return (await self.db.execute_query(sql))[1]
 
+    def parametrize_query(self, query: QueryBuilder) -> Tuple[str, Optional[list]]:
+        """
+        Renders the query with its filter values as positional bind parameters.
+
+        Queries that only differ by filter values render to identical SQL,
+        so the DB (or driver) can re-use its parsed statements and plans.
+
+        :param query: The query to render.
+        :return: A tuple of: (The SQL, The bind values or ``None`` if nothing was bound)
+        """
+        values: list = []
+        sql = query.get_sql(bind_values=values, bind_types=self.DB_NATIVE)
+        if not values:
+            return sql, None
+        parts = sql.split(BIND_MARKER)
+        if len(parts) != len(values) + 1:
+            # The marker showed up in an inlined literal, so play it safe
+            return query.get_sql(), None
+        return self._join_parametrized_sql(parts), values
+
+    def _join_parametrized_sql(self, parts: List[str]) -> str:
+        sql = [parts[0]]
+        for pos, part in enumerate(parts[1:]):
+            sql.append(self.parameter(pos).get_sql())
+            sql.append(part)
+        return "".join(sql)
+
+    def _get_sql_and_values(self, query: QueryBuilder) -> Tuple[str, Optional[list]]:
+        if self.db.parametrize_queries:
+            return self.parametrize_query(query)
+        return query.get_sql(), None
+
     async def execute_select(self, query: Query, custom_fields: Optional[list] = None) -> list:
-        _, raw_results = await self.db.execute_query(query.get_sql())
-        instance_list = []
-        for row in raw_results:
-            if self.select_related_idx:
-                _, current_idx, _, _ = self.select_related_idx[0]
-                dict_row = dict(row)
-                keys = list(dict_row.keys())
-                values = list(dict_row.values())
-                instance: "Model" = self.model._init_from_db(
-                    **dict(zip(keys[:current_idx], values[:current_idx]))
-                )
-                instances = [instance]
-                for model, index, model_name, parent_model in self.select_related_idx[1:]:
-                    obj = model._init_from_db(
-                        **dict(
-                            zip(
-                                map(
-                                    lambda x: x.split(".")[1],
-                                    keys[current_idx : current_idx + index],  # noqa
-                                ),
-                                values[current_idx : current_idx + index],  # noqa
-                            )
-                        )
-                    )
-                    for ins in instances:
-                        if isinstance(ins, parent_model):
-                            setattr(ins, model_name, obj)
-                    instances.append(obj)
-                    current_idx += index
-            else:
-                instance = self.model._init_from_db(**row)
+        sql, values = self._get_sql_and_values(query)
+        return await self.execute_select_sql(sql, values, custom_fields=custom_fields)
+
+    async def execute_select_sql(
+        self, sql: str, values: Optional[list] = None, custom_fields: Optional[list] = None
+    ) -> list:
+        _, raw_results = await self.db.execute_query(sql, values)
+        instance_list = self._init_instances(raw_results, custom_fields)
+        await self._execute_prefetch_queries(instance_list)
+        return instance_list
+
+    async def execute_select_stream(
+        self,
+        sql: str,
+        values: Optional[list] = None,
+        custom_fields: Optional[list] = None,
+        chunk_size: int = 1000,
+    ) -> AsyncGenerator[list, None]:
+        """
+        Executes the select query, and yields the instances in chunks,
+        as the rows are streamed from the DB.
+
+        The prefetches are done per chunk.
+        """
+        stream = self.db.execute_query_stream(sql, values, chunk_size)
+        try:
+            async for raw_results in stream:
+                instance_list = self._init_instances(raw_results, custom_fields)
+                await self._execute_prefetch_queries(instance_list)
+                yield instance_list
+        finally:
+            # Release the cursor and connection now, instead of once the stream is collected
+            await stream.aclose()
+
+    def _init_instances(self, raw_results: Sequence, custom_fields: Optional[list]) -> list:
+        if not self.select_related_idx:
+            # Annotations are set on the instances, so those can't be shared
+            instance_list = self.model._init_from_db_rows(
+                raw_results, cache_rows=self.cache_rows, use_identity_map=not custom_fields
+            )
             if custom_fields:
+                for obj, row in zip(instance_list, raw_results):
+                    for field in custom_fields:
+                        setattr(obj, field, row[field])
+            return instance_list
+
+        if not raw_results:
+            return []
+        columns = tuple(raw_results[0].keys())
+        if isinstance(raw_results[0], dict):
+            rows: Sequence = [tuple(row.values()) for row in raw_results]
+        else:
+            rows = raw_results
+        plan = self._get_select_related_plan(columns, custom_fields or [])
+        joined = [
+            model._init_from_db_rows(
+                rows, model_columns, offset, self.cache_rows, pos > 0 or not custom_fields
+            )
+            for pos, (model, model_columns, offset, _, _) in enumerate(plan)
+        ]
+        for pos, (_, _, _, field, parents) in enumerate(plan):
+            for parent_pos in parents:
+                for parent, obj in zip(joined[parent_pos], joined[pos]):
+                    setattr(parent, field, obj)
+        instance_list = joined[0]
+        if custom_fields:
+            for obj, row in zip(instance_list, raw_results):
                 for field in custom_fields:
-                    setattr(instance, field, row[field])
-            instance_list.append(instance)
-        await self._execute_prefetch_queries(instance_list)
+                    setattr(obj, field, row[field])
         return instance_list
 
+    def _get_select_related_plan(
+        self, columns: Tuple[str, ...], custom_fields: list
+    ) -> List[Tuple["Type[Model]", Tuple[str, ...], int, Any, List[int]]]:
+        """
+        Resolves the columns of each joined model, and the preceding models
+        that each related instance is attached to.
+        """
+        plan = []
+        start = 0
+        models: List["Type[Model]"] = []
+        for model, count, field, parent_model in self.select_related_idx or []:
+            # The annotations are selected between the model and the joined columns
+            while start < len(columns) and columns[start] in custom_fields:
+                start += 1
+            model_columns = columns[start : start + count]  # noqa
+            if models:
+                # Joined columns are prefixed with the table name
+                model_columns = tuple(column.split(".")[1] for column in model_columns)
+            parents = [pos for pos, parent in enumerate(models) if issubclass(parent, parent_model)]
+            plan.append((model, model_columns, start, field, parents))
+            models.append(model)
+            start += count
+        return plan
+
     def _prepare_insert_columns(
         self, include_generated: bool = False
     ) -> Tuple[List[str], List[str]]:
@@ -208,12 +330,23 @@ class BaseExecutor:
                 for field_name in self.regular_columns_all
             ]
             await self.db.execute_insert(self.insert_query_all, values)
+        await self._invalidate_caches([instance])
 
-    async def execute_bulk_insert(self, instances: "Iterable[Model]") -> None:
+    async def execute_bulk_insert(
+        self,
+        instances: "Iterable[Model]",
+        batch_size: Optional[int] = None,
+        fetch_generated: bool = False,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> None:
+        instances_all = []
         values_lists_all = []
+        instances_generated = []
         values_lists = []
         for instance in instances:
             if instance._custom_generated_pk:
+                instances_all.append(instance)
                 values_lists_all.append(
                     [
                         self.column_map[field_name](getattr(instance, field_name), instance)
@@ -221,6 +354,7 @@ class BaseExecutor:
                     ]
                 )
             else:
+                instances_generated.append(instance)
                 values_lists.append(
                     [
                         self.column_map[field_name](getattr(instance, field_name), instance)
@@ -229,9 +363,271 @@ class BaseExecutor:
                 )
 
         if values_lists_all:
-            await self.db.execute_many(self.insert_query_all, values_lists_all)
+            await self._execute_bulk_insert(
+                self.insert_query_all,
+                self.regular_columns_all,
+                values_lists_all,
+                batch_size,
+                on_conflict=on_conflict,
+                update_fields=update_fields,
+            )
         if values_lists:
-            await self.db.execute_many(self.insert_query, values_lists)
+            fetch_generated_fields = fetch_generated and bool(self.model._meta.generated_db_fields)
+            results = await self._execute_bulk_insert(
+                self.insert_query,
+                self.regular_columns,
+                values_lists,
+                batch_size,
+                fetch_generated=fetch_generated_fields,
+                on_conflict=on_conflict,
+                update_fields=update_fields,
+            )
+            if fetch_generated_fields:
+                for instance, result in zip(instances_generated, results):
+                    await self._process_insert_result(instance, result)
+        if fetch_generated:
+            for instance in instances_all + instances_generated:
+                instance._saved_in_db = True
+        await self._invalidate_caches(None if on_conflict else instances_all + instances_generated)
+
+    async def _execute_bulk_insert(
+        self,
+        query: str,
+        columns: List[str],
+        values_lists: List[list],
+        batch_size: Optional[int] = None,
+        fetch_generated: bool = False,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> list:
+        """
+        Inserts the rows of DB values.
+
+        :param query: The single row insert statement.
+        :param columns: The field names of the values, in order.
+        :param values_lists: The rows of DB values to insert.
+        :param batch_size: Max number of rows per multi-row insert statement.
+        :param fetch_generated: Should the generated values of the rows be returned?
+        :param on_conflict: The unique field names, that rows conflicting on are not inserted.
+        :param update_fields: The field names to update of the conflicting rows instead.
+        :return: The insert results of the rows (as passed to ``_process_insert_result()``)
+            if ``fetch_generated`` is set.
+        """
+        if not self.BULK_INSERT_MULTI_ROW and not fetch_generated and not on_conflict:
+            await self.db.execute_many(query, values_lists)
+            return []
+
+        batches = list(self._get_bulk_insert_batches(columns, values_lists, batch_size))
+        if len(batches) == 1:
+            return await self._execute_bulk_insert_batch(
+                self.db, columns, batches[0], fetch_generated, on_conflict, update_fields
+            )
+
+        # The batches must succeed or fail as a whole, as with execute_many()
+        results = []
+        async with self.db._in_transaction() as connection:
+            for batch in batches:
+                results.extend(
+                    await self._execute_bulk_insert_batch(
+                        connection, columns, batch, fetch_generated, on_conflict, update_fields
+                    )
+                )
+        return results
+
+    async def _execute_bulk_insert_batch(
+        self,
+        db: "BaseDBAsyncClient",
+        columns: List[str],
+        values_lists: List[list],
+        fetch_generated: bool,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> list:
+        """
+        Inserts the rows of DB values with a single multi-row insert statement.
+
+        :return: The insert results of the rows if ``fetch_generated`` is set.
+        """
+        _, rows = await db.execute_query(
+            self._get_bulk_insert_sql(
+                columns, len(values_lists), fetch_generated, on_conflict, update_fields
+            ),
+            [value for values in values_lists for value in values],
+        )
+        return list(rows) if fetch_generated else []
+
+    def _get_bulk_insert_batches(
+        self, columns: List[str], values_lists: List[list], batch_size: Optional[int]
+    ) -> Iterable[List[list]]:
+        max_rows = max(self.MAX_BIND_PARAMETERS // max(len(columns), 1), 1)
+        if batch_size:
+            max_rows = min(batch_size, max_rows)
+        for start in range(0, len(values_lists), max_rows):
+            yield values_lists[start : start + max_rows]  # noqa
+
+    def _get_bulk_insert_sql(
+        self,
+        columns: List[str],
+        rows: int,
+        returning: bool = False,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> str:
+        key = (
+            "insert",
+            tuple(columns),
+            rows,
+            returning,
+            tuple(on_conflict or ()),
+            tuple(update_fields or ()),
+        )
+        sql = self.bulk_cache.get(key)
+        if sql is None:
+            db_columns = [self.model._meta.fields_db_projection[column] for column in columns]
+            query = self.db.query_class.into(self.model._meta.basetable).columns(*db_columns)
+            for row in range(rows):
+                query = query.insert(
+                    *[self.parameter(row * len(columns) + pos) for pos in range(len(columns))]
+                )
+            sql = str(query)
+            if on_conflict:
+                sql += self._get_on_conflict_sql(on_conflict, update_fields or [])
+            if returning:
+                sql += self._get_returning_sql()
+            self.bulk_cache.set(key, sql)
+        return sql
+
+    def _get_on_conflict_sql(self, on_conflict: List[str], update_fields: List[str]) -> str:
+        """
+        Returns the clause of an insert statement, that skips or updates the conflicting rows.
+        """
+        db_projection = self.model._meta.fields_db_projection
+        sql = " ON CONFLICT (" + ",".join(f'"{db_projection[field]}"' for field in on_conflict)
+        if not update_fields:
+            return sql + ") DO NOTHING"
+        return (
+            sql
+            + ") DO UPDATE SET "
+            + ",".join(
+                f'"{db_projection[field]}"=EXCLUDED."{db_projection[field]}"'
+                for field in update_fields
+            )
+        )
+
+    def _get_returning_sql(self) -> str:
+        """
+        Returns the clause of an insert statement, that returns the generated fields of the rows.
+        """
+        db_fields = list(self.model._meta.generated_db_fields) or [self.model._meta.db_pk_column]
+        return " RETURNING " + ",".join(f'"{db_field}"' for db_field in db_fields)
+
+    async def execute_upsert(self, instance: "Model", on_conflict: List[str]) -> bool:
+        """
+        Inserts the instance with a single statement,
+        unless it conflicts with an existing row on the ``on_conflict`` fields.
+
+        Requires ``UPSERT_RETURNING``.
+
+        :param instance: The instance to insert.
+        :param on_conflict: The unique field names to check for conflicts.
+        :return: If the instance was inserted.
+        """
+        columns = (
+            self.regular_columns_all if instance._custom_generated_pk else self.regular_columns
+        )
+        values = [
+            self.column_map[column](getattr(instance, column), instance) for column in columns
+        ]
+        results = await self._execute_bulk_insert_batch(
+            self.db, columns, [values], True, on_conflict
+        )
+        if not results:
+            return False
+        if not instance._custom_generated_pk:
+            await self._process_insert_result(instance, results[0])
+        await self._invalidate_caches([instance])
+        return True
+
+    async def execute_bulk_update(
+        self, instances: "Iterable[Model]", fields: List[str], batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Updates the given fields of the instances, with multi-row update statements.
+
+        :param instances: The instances to update.
+        :param fields: The (non-PK) field names to update, as in ``column_map``.
+        :param batch_size: Max number of rows to update per statement.
+        :return: The number of updated rows.
+        """
+        instances = list(instances)
+        pk_to_db = self.model._meta.pk.to_db_value
+        values_lists = [
+            [pk_to_db(instance.pk, instance)]
+            + [self._get_db_value(instance, field) for field in fields]
+            for instance in instances
+        ]
+        if not values_lists:
+            return 0
+
+        max_rows = max(
+            self.MAX_BIND_PARAMETERS // (self.BULK_UPDATE_PARAMETERS_PER_FIELD * len(fields) + 1),
+            1,
+        )
+        if batch_size:
+            max_rows = min(batch_size, max_rows)
+        batches = [
+            values_lists[start : start + max_rows]  # noqa
+            for start in range(0, len(values_lists), max_rows)
+        ]
+        if len(batches) == 1:
+            count = await self._execute_bulk_update_batch(self.db, fields, batches[0])
+        else:
+            count = 0
+            async with self.db._in_transaction() as connection:
+                for batch in batches:
+                    count += await self._execute_bulk_update_batch(connection, fields, batch)
+        await self._invalidate_caches(instances)
+        return count
+
+    async def _execute_bulk_update_batch(
+        self, db: "BaseDBAsyncClient", fields: List[str], values_lists: List[list]
+    ) -> int:
+        """
+        Updates the rows of ``[pk, *values]`` with a single ``CASE`` update statement.
+
+        :return: The number of updated rows.
+        """
+        values = [
+            value
+            for pos in range(1, len(fields) + 1)
+            for row in values_lists
+            for value in (row[0], row[pos])
+        ]
+        values.extend(row[0] for row in values_lists)
+        return (
+            await db.execute_query(self._get_bulk_update_sql(fields, len(values_lists)), values)
+        )[0]
+
+    def _get_bulk_update_sql(self, fields: List[str], rows: int) -> str:
+        key = ("update", tuple(fields), rows)
+        sql = self.bulk_cache.get(key)
+        if sql is None:
+            table = self.model._meta.basetable
+            pk_column = table[self.model._meta.db_pk_column]
+            query = self.db.query_class.update(table)
+            count = 0
+            for field in fields:
+                case = Case()
+                for _ in range(rows):
+                    case = case.when(pk_column == self.parameter(count), self.parameter(count + 1))
+                    count += 2
+                query = query.set(self.model._meta.fields_db_projection[field], case)
+            query = query.where(
+                pk_column.isin([self.parameter(count + row) for row in range(rows)])
+            )
+            sql = str(query)
+            self.bulk_cache.set(key, sql)
+        return sql
 
     def get_update_sql(
         self,
@@ -264,13 +660,28 @@ class BaseExecutor:
         sql = self.update_cache[key] = query.get_sql()
         return sql
 
+    def _get_db_value(self, instance: "Union[Type[Model], Model]", field: str) -> Any:
+        raw_key = self.model._meta.lazy_fields.get(field)
+        if raw_key:
+            # Untouched lazy fields are written back as is, without decoding them
+            values = instance.__dict__
+            if raw_key in values:
+                return values[raw_key]
+        return self.column_map[field](getattr(instance, field), instance)
+
     async def execute_update(
         self, instance: "Union[Type[Model], Model]", update_fields: Optional[Iterable[str]]
     ) -> int:
         values = []
         arithmetic_or_function = {}
+        lazy_fields = self.model._meta.lazy_fields
         for field in update_fields or self.model._meta.fields_db_projection.keys():
             if not self.model._meta.fields_map[field].pk:
+                raw_key = lazy_fields.get(field)
+                if raw_key and raw_key in instance.__dict__:
+                    # Untouched lazy fields are written back as is, without decoding them
+                    values.append(instance.__dict__[raw_key])
+                    continue
                 instance_field = getattr(instance, field)
                 if isinstance(instance_field, (ArithmeticExpression, Function)):
                     arithmetic_or_function[field] = instance_field
@@ -278,18 +689,31 @@ class BaseExecutor:
                     value = self.column_map[field](instance_field, instance)
                     values.append(value)
         values.append(self.model._meta.pk.to_db_value(instance.pk, instance))
-        return (
+        rows = (
             await self.db.execute_query(
                 self.get_update_sql(update_fields, arithmetic_or_function), values
             )
         )[0]
+        await self._invalidate_caches([instance])
+        return rows
 
     async def execute_delete(self, instance: "Union[Type[Model], Model]") -> int:
-        return (
+        rows = (
             await self.db.execute_query(
                 self.delete_query, [self.model._meta.pk.to_db_value(instance.pk, instance)]
             )
         )[0]
+        await self._invalidate_caches([instance])
+        return rows
+
+    async def _invalidate_caches(
+        self, instances: "Optional[Iterable[Union[Type[Model], Model]]]" = None
+    ) -> None:
+        """
+        Invalidates the cached query results of the model, after writing to its table,
+        and the PK cache rows of the instances (or all of them).
+        """
+        await invalidate_model(self.model, instances, self.db)
 
     async def _prefetch_reverse_relation(
         self,
@@ -298,27 +722,24 @@ class BaseExecutor:
         related_query: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
         related_field: BackwardFKRelation = self.model._meta.fields_map[field]  # type: ignore
         related_field_name = related_field.to_field_instance.model_field_name
         relation_field = related_field.relation_field
 
-        for instance in instance_list:
-            if relation_field not in related_objects_for_fetch:
-                related_objects_for_fetch[relation_field] = []
-            related_objects_for_fetch[relation_field].append(
+        related_query.resolve_ordering(
+            related_query.model, related_query.model._meta.basetable, [], {}
+        )
+        related_object_list = await self._fetch_prefetch_chunks(
+            related_query,
+            relation_field,
+            [
                 self._field_to_db(
                     instance._meta.fields_map[related_field_name],
                     getattr(instance, related_field_name),
                     instance,
                 )
-            )
-
-        related_query.resolve_ordering(
-            related_query.model, related_query.model._meta.basetable, [], {}
-        )
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+                for instance in instance_list
+            ],
         )
 
         related_object_map: Dict[str, list] = {}
@@ -343,24 +764,21 @@ class BaseExecutor:
         related_query: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
         related_field: BackwardOneToOneRelation = self.model._meta.fields_map[field]  # type: ignore
         related_field_name = related_field.to_field_instance.model_field_name
         relation_field = related_field.relation_field
 
-        for instance in instance_list:
-            if relation_field not in related_objects_for_fetch:
-                related_objects_for_fetch[relation_field] = []
-            related_objects_for_fetch[relation_field].append(
+        related_object_list = await self._fetch_prefetch_chunks(
+            related_query,
+            relation_field,
+            [
                 self._field_to_db(
                     instance._meta.fields_map[related_field_name],
                     getattr(instance, related_field_name),
                     instance,
                 )
-            )
-
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+                for instance in instance_list
+            ],
         )
 
         related_object_map = {}
@@ -386,13 +804,68 @@ class BaseExecutor:
         related_query: Tuple[Optional[str], "QuerySet"],
     ) -> "Iterable[Model]":
         to_attr, related_query = related_query
-        instance_id_set: set = {
-            self._field_to_db(instance._meta.pk, instance.pk, instance)
-            for instance in instance_list
+        field_object: ManyToManyFieldInstance = self.model._meta.fields_map[field]  # type: ignore
+        related_pk_field = related_query.model._meta.db_pk_column
+        related_query.resolve_ordering(
+            related_query.model, related_query.model._meta.basetable, [], {}
+        )
+
+        chunks = self._get_prefetch_chunks(
+            related_query,
+            [
+                self._field_to_db(instance._meta.pk, instance.pk, instance)
+                for instance in instance_list
+            ],
+        )
+        raw_results: Sequence[dict]
+        if len(chunks) == 1:
+            raw_results = await self._execute_m2m_prefetch(field_object, related_query, chunks[0])
+        else:
+            raw_results = [
+                row
+                for rows in await asyncio.gather(
+                    *[
+                        self._execute_m2m_prefetch(field_object, related_query, chunk)
+                        for chunk in chunks
+                    ]
+                )
+                for row in rows
+            ]
+
+        # Index the join rows by their distinct keys, so each key is converted once,
+        # and each related object is hydrated once and shared by all of its parents
+        related_rows: Dict[Any, Any] = {}
+        backward_keys: Dict[Any, list] = {}
+        for row in raw_results:
+            related_key = row[related_pk_field]
+            if related_key not in related_rows:
+                related_rows[related_key] = row
+            backward_key = row["_backward_relation_key"]
+            if backward_key not in backward_keys:
+                backward_keys[backward_key] = []
+            backward_keys[backward_key].append(related_key)
+
+        related_object_list = related_query.model._init_from_db_rows(list(related_rows.values()))
+        await self.__class__(
+            model=related_query.model, db=self.db, prefetch_map=related_query._prefetch_map
+        )._execute_prefetch_queries(related_object_list)
+        related_object_map = dict(zip(related_rows, related_object_list))
+        to_python_value = self.model._meta.pk.to_python_value
+        relation_map: Dict[Any, list] = {
+            to_python_value(backward_key): [
+                related_object_map[related_key] for related_key in related_keys
+            ]
+            for backward_key, related_keys in backward_keys.items()
         }
 
-        field_object: ManyToManyFieldInstance = self.model._meta.fields_map[field]  # type: ignore
+        for instance in instance_list:
+            relation_container = getattr(instance, field)
+            relation_container._set_result_for_query(relation_map.get(instance.pk, []), to_attr)
+        return instance_list
 
+    async def _execute_m2m_prefetch(
+        self, field_object: ManyToManyFieldInstance, related_query: "QuerySet", keys: list
+    ) -> Sequence[dict]:
         through_table = Table(field_object.through)
 
         subquery = (
@@ -401,12 +874,11 @@ class BaseExecutor:
                 through_table[field_object.backward_key].as_("_backward_relation_key"),
                 through_table[field_object.forward_key].as_("_forward_relation_key"),
             )
-            .where(through_table[field_object.backward_key].isin(instance_id_set))
+            .where(self._get_prefetch_criterion(through_table[field_object.backward_key], keys))
         )
 
         related_query_table = related_query.model._meta.basetable
         related_pk_field = related_query.model._meta.db_pk_column
-        related_query.resolve_ordering(related_query.model, related_query_table, [], {})
         query = (
             related_query.query.join(subquery)
             .on(subquery._forward_relation_key == related_query_table[related_pk_field])
@@ -439,31 +911,8 @@ class BaseExecutor:
             if having_criterion:
                 query = query.having(having_criterion)
 
-        _, raw_results = await self.db.execute_query(query.get_sql())
-        # TODO: we should only resolve the PK's once
-        relations = [
-            (
-                self.model._meta.pk.to_python_value(e["_backward_relation_key"]),
-                field_object.related_model._meta.pk.to_python_value(e[related_pk_field]),
-            )
-            for e in raw_results
-        ]
-        related_object_list = [related_query.model._init_from_db(**e) for e in raw_results]
-        await self.__class__(
-            model=related_query.model, db=self.db, prefetch_map=related_query._prefetch_map
-        )._execute_prefetch_queries(related_object_list)
-        related_object_map = {e.pk: e for e in related_object_list}
-        relation_map: Dict[str, list] = {}
-
-        for object_id, related_object_id in relations:
-            if object_id not in relation_map:
-                relation_map[object_id] = []
-            relation_map[object_id].append(related_object_map[related_object_id])
-
-        for instance in instance_list:
-            relation_container = getattr(instance, field)
-            relation_container._set_result_for_query(relation_map.get(instance.pk, []), to_attr)
-        return instance_list
+        _, raw_results = await self.db.execute_query(*self._get_sql_and_values(query))
+        return raw_results
 
     async def _prefetch_direct_relation(
         self,
@@ -474,20 +923,18 @@ class BaseExecutor:
         # TODO: This will only work if instance_list is all of same type
         # TODO: If that's the case, then we can optimize the key resolver
         to_attr, related_query = related_query
-        related_objects_for_fetch: Dict[str, list] = {}
+        related_objects_for_fetch: list = []
         relation_key_field = f"{field}_id"
+        key = cast(RelationalField, self.model._meta.fields_map[field]).to_field
         for instance in instance_list:
             if getattr(instance, relation_key_field):
-                key = cast(RelationalField, instance._meta.fields_map[field]).to_field
-                if key not in related_objects_for_fetch:
-                    related_objects_for_fetch[key] = []
-                related_objects_for_fetch[key].append(getattr(instance, relation_key_field))
+                related_objects_for_fetch.append(getattr(instance, relation_key_field))
             else:
                 setattr(instance, field, None)
 
         if related_objects_for_fetch:
-            related_object_list = await related_query.filter(
-                **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+            related_object_list = await self._fetch_prefetch_chunks(
+                related_query, key, related_objects_for_fetch
             )
             related_object_map = {getattr(obj, key): obj for obj in related_object_list}
             for instance in instance_list:
@@ -497,6 +944,45 @@ class BaseExecutor:
                     setattr(instance, to_attr, obj)
         return instance_list
 
+    def _get_prefetch_chunks(self, related_query: "QuerySet", keys: list) -> List[list]:
+        """
+        Deduplicates the keys to prefetch, and splits them into chunks
+        of at most ``prefetch_chunk_size`` keys.
+        """
+        keys = list(dict.fromkeys(keys))
+        size = self.db.prefetch_chunk_size
+        # A limit or offset applies to the whole prefetch, so it can't be split
+        if not size or related_query._limit is not None or related_query._offset is not None:
+            return [keys]
+        return [keys[pos : pos + size] for pos in range(0, len(keys), size)]  # noqa
+
+    def _get_prefetch_filter(self, key: str, keys: list) -> Dict[str, Any]:
+        """
+        Returns the filter kwargs of a prefetch query, for the keys of the field ``key``.
+        """
+        return {f"{key}__in": keys}
+
+    def _get_prefetch_criterion(self, term: Term, keys: list) -> Criterion:
+        """
+        Returns the criterion of a prefetch query, for the keys of the column ``term``.
+        """
+        return term.isin(keys)
+
+    async def _fetch_prefetch_chunks(
+        self, related_query: "QuerySet", key: str, keys: list
+    ) -> "List[Model]":
+        """
+        Fetches the related objects for the keys of the field ``key``,
+        with a concurrent query per chunk of keys.
+        """
+        chunks = self._get_prefetch_chunks(related_query, keys)
+        if len(chunks) == 1:
+            return await related_query.filter(**self._get_prefetch_filter(key, chunks[0]))
+        results = await asyncio.gather(
+            *[related_query.filter(**self._get_prefetch_filter(key, chunk)) for chunk in chunks]
+        )
+        return [obj for objects in results for obj in objects]
+
     def _make_prefetch_queries(self) -> None:
         for field_name, forwarded_prefetches in self.prefetch_map.items():
             to_attr = None
@@ -531,7 +1017,10 @@ class BaseExecutor:
         self, instance_list: "Iterable[Model]"
     ) -> "Iterable[Model]":
         if instance_list and (self.prefetch_map or self._prefetch_queries):
-            self._make_prefetch_queries()
+            if self.prefetch_map:
+                self._make_prefetch_queries()
+                # The map is merged into the queries now, so chunks don't merge it again
+                self.prefetch_map = {}
             prefetch_tasks = []
             for field, related_queries in self._prefetch_queries.items():
                 for related_query in related_queries:
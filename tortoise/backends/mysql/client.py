@@ -1,6 +1,17 @@
 import asyncio
 from functools import wraps
-from typing import Any, Callable, List, Optional, SupportsInt, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    SupportsInt,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import aiomysql
 import pymysql
@@ -77,12 +88,16 @@ class MySQLClient(BaseDBAsyncClient):
         self.storage_engine = self.extra.pop("storage_engine", "")
         self.extra.pop("connection_name", None)
         self.extra.pop("fetch_inserted", None)
+        self.extra.pop("parametrize_queries", None)
+        self.extra.pop("prefetch_chunk_size", None)
         self.extra.pop("db", None)
         self.extra.pop("autocommit", None)
         self.extra.setdefault("sql_mode", "STRICT_TRANS_TABLES")
         self.charset = self.extra.pop("charset", "utf8mb4")
         self.pool_minsize = int(self.extra.pop("minsize", 1))
         self.pool_maxsize = int(self.extra.pop("maxsize", 5))
+        # The packet size limit of the server, which multi-row inserts are kept below
+        self.max_allowed_packet = int(self.extra.pop("max_allowed_packet", 4 * 1024 * 1024))
 
         self._template: dict = {}
         self._pool: Optional[aiomysql.Pool] = None
@@ -198,6 +213,31 @@ class MySQLClient(BaseDBAsyncClient):
     async def execute_query_dict(self, query: str, values: Optional[list] = None) -> List[dict]:
         return (await self.execute_query(query, values))[1]
 
+    async def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            # An unbuffered cursor reads the rows from the server as they are fetched
+            async with connection.cursor(aiomysql.SSCursor) as cursor:
+                await self._execute_cursor(cursor, query, values)
+                fields = [description[0] for description in cursor.description or []]
+                while True:
+                    rows = await self._fetch_cursor(cursor, chunk_size)
+                    if not rows:
+                        break
+                    yield [dict(zip(fields, row)) for row in rows]
+
+    @translate_exceptions
+    async def _execute_cursor(
+        self, cursor: aiomysql.SSCursor, query: str, values: Optional[list]
+    ) -> None:
+        await cursor.execute(query, values)
+
+    @translate_exceptions
+    async def _fetch_cursor(self, cursor: aiomysql.SSCursor, chunk_size: int) -> list:
+        return await cursor.fetchmany(chunk_size)
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -215,6 +255,11 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
         self.log = connection.log
         self._finalized: Optional[bool] = None
         self.fetch_inserted = connection.fetch_inserted
+        self.parametrize_queries = connection.parametrize_queries
+        self.prefetch_chunk_size = connection.prefetch_chunk_size
+        self._executors = {}
+        self._invalidations = []
+        self.max_allowed_packet = connection.max_allowed_packet
         self._parent = connection
 
     def _in_transaction(self) -> "TransactionContext":
@@ -230,6 +275,13 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
             async with connection.cursor() as cursor:
                 await cursor.executemany(query, values)
 
+    def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        # An unbuffered cursor would block the connection of the transaction until fully read,
+        # so fetch the whole resultset instead
+        return BaseDBAsyncClient.execute_query_stream(self, query, values, chunk_size)
+
     @translate_exceptions
     async def start(self) -> None:
         await self._connection.begin()
@@ -240,6 +292,7 @@ class TransactionWrapper(MySQLClient, BaseTransactionWrapper):
             raise TransactionManagementError("Transaction already finalised")
         await self._connection.commit()
         self._finalized = True
+        await self._invalidate_committed()
 
     async def rollback(self) -> None:
         if self._finalized:
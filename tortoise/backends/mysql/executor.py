@@ -1,8 +1,11 @@
+from typing import TYPE_CHECKING, Iterable, List, Optional, cast
+
 from pypika import Parameter, functions
 from pypika.enums import SqlTypes
 from pypika.terms import Criterion
 
 from tortoise import Model
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.fields import BigIntField, IntField, SmallIntField
 from tortoise.filters import (
@@ -19,6 +22,9 @@ from tortoise.filters import (
     starts_with,
 )
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.mysql.client import MySQLClient
+
 
 class StrWrapper(ValueWrapper):  # type: ignore
     """
@@ -92,10 +98,67 @@ class MySQLExecutor(BaseExecutor):
         insensitive_ends_with: mysql_insensitive_ends_with,
     }
     EXPLAIN_PREFIX = "EXPLAIN FORMAT=JSON"
+    MAX_BIND_PARAMETERS = 65535
+    BULK_INSERT_MULTI_ROW = True
+    UPSERT_RETURNING = False
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("%s")
 
+    def _get_bulk_insert_batches(
+        self, columns: List[str], values_lists: List[list], batch_size: Optional[int]
+    ) -> Iterable[List[list]]:
+        # Values are interpolated client side, so also keep the statements below max_allowed_packet
+        max_size = cast("MySQLClient", self.db).max_allowed_packet // 2
+        for batch in super()._get_bulk_insert_batches(columns, values_lists, batch_size):
+            start = size = 0
+            for pos, values in enumerate(batch):
+                row_size = sum(
+                    2 * len(value) + 4 if isinstance(value, (str, bytes)) else 32
+                    for value in values
+                )
+                if size + row_size > max_size and pos > start:
+                    yield batch[start:pos]
+                    start, size = pos, 0
+                size += row_size
+            yield batch[start:]
+
+    def _get_on_conflict_sql(self, on_conflict: List[str], update_fields: List[str]) -> str:
+        # MySQL checks all unique keys, so on_conflict is not part of the statement
+        if not update_fields:
+            # A no-op update, as INSERT IGNORE would also ignore other errors
+            db_pk_column = self.model._meta.db_pk_column
+            return f" ON DUPLICATE KEY UPDATE `{db_pk_column}`=`{db_pk_column}`"
+        db_projection = self.model._meta.fields_db_projection
+        return " ON DUPLICATE KEY UPDATE " + ",".join(
+            f"`{db_projection[field]}`=VALUES(`{db_projection[field]}`)" for field in update_fields
+        )
+
+    def _join_parametrized_sql(self, parts: List[str]) -> str:
+        # The driver interpolates the values with %-formatting, so literal %'s must be escaped
+        return super()._join_parametrized_sql([part.replace("%", "%%") for part in parts])
+
+    async def _execute_bulk_insert_batch(
+        self,
+        db: BaseDBAsyncClient,
+        columns: List[str],
+        values_lists: List[list],
+        fetch_generated: bool,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> list:
+        if not fetch_generated:
+            return await super()._execute_bulk_insert_batch(
+                db, columns, values_lists, fetch_generated, on_conflict, update_fields
+            )
+        # LAST_INSERT_ID() is the ID of the first row of a multi-row insert,
+        # and InnoDB allocates consecutive IDs to the rows of a simple multi-row insert
+        first_id = await db.execute_insert(
+            self._get_bulk_insert_sql(columns, len(values_lists)),
+            [value for values in values_lists for value in values],
+        )
+        return list(range(first_id, first_id + len(values_lists)))
+
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
         if (
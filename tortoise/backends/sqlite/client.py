@@ -2,7 +2,7 @@ import asyncio
 import os
 import sqlite3
 from functools import wraps
-from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+from typing import Any, AsyncGenerator, Callable, List, Optional, Sequence, Tuple, TypeVar
 
 import aiosqlite
 
@@ -49,6 +49,8 @@ class SqliteClient(BaseDBAsyncClient):
         self.pragmas = kwargs.copy()
         self.pragmas.pop("connection_name", None)
         self.pragmas.pop("fetch_inserted", None)
+        self.pragmas.pop("parametrize_queries", None)
+        self.pragmas.pop("prefetch_chunk_size", None)
         self.pragmas.setdefault("journal_mode", "WAL")
         self.pragmas.setdefault("journal_size_limit", 16384)
         self.pragmas.setdefault("foreign_keys", "ON")
@@ -141,6 +143,34 @@ class SqliteClient(BaseDBAsyncClient):
             self.log.debug("%s: %s", query, values)
             return list(map(dict, await connection.execute_fetchall(query, values)))
 
+    async def execute_query_stream(
+        self, query: str, values: Optional[list] = None, chunk_size: int = 1000
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        query = query.replace("\x00", "'||CHAR(0)||'")
+        async with self.acquire_connection() as connection:
+            self.log.debug("%s: %s", query, values)
+            cursor = await self._execute_cursor(query, connection, values)
+        try:
+            while True:
+                # Only lock per chunk, so that other queries can run between the chunks
+                async with self.acquire_connection():
+                    rows = await self._fetch_cursor(cursor, chunk_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            await cursor.close()
+
+    @translate_exceptions
+    async def _execute_cursor(
+        self, query: str, connection: aiosqlite.Connection, values: Optional[list]
+    ) -> aiosqlite.Cursor:
+        return await connection.execute(query, values)
+
+    @translate_exceptions
+    async def _fetch_cursor(self, cursor: aiosqlite.Cursor, chunk_size: int) -> list:
+        return list(await cursor.fetchmany(chunk_size))
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -157,6 +187,10 @@ class TransactionWrapper(SqliteClient, BaseTransactionWrapper):
         self.log = connection.log
         self._finalized = False
         self.fetch_inserted = connection.fetch_inserted
+        self.parametrize_queries = connection.parametrize_queries
+        self.prefetch_chunk_size = connection.prefetch_chunk_size
+        self._executors = {}
+        self._invalidations = []
 
     def _in_transaction(self) -> "TransactionContext":
         return NestedTransactionContext(self)
@@ -186,3 +220,4 @@ class TransactionWrapper(SqliteClient, BaseTransactionWrapper):
             raise TransactionManagementError("Transaction already finalised")
         await self._connection.commit()
         self._finalized = True
+        await self._invalidate_committed()
@@ -1,11 +1,13 @@
 import datetime
+import sqlite3
 from decimal import Decimal
-from typing import Optional, Type, Union
+from typing import List, Optional, Type, Union
 
 import pytz
 from pypika import Parameter
 
 from tortoise import Model, fields, timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.fields import (
     BigIntField,
@@ -62,10 +64,40 @@ class SqliteExecutor(BaseExecutor):
     }
     EXPLAIN_PREFIX = "EXPLAIN QUERY PLAN"
     DB_NATIVE = {bytes, str, int, float}
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 999 before SQLite 3.32.0
+    MAX_BIND_PARAMETERS = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+    BULK_INSERT_MULTI_ROW = True
+    BULK_INSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+    UPSERT_RETURNING = BULK_INSERT_RETURNING
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("?")
 
+    def _get_returning_sql(self) -> str:
+        # SQLite can only generate a single ROWID
+        return f' RETURNING "{self.model._meta.db_pk_column}"'
+
+    async def _execute_bulk_insert_batch(
+        self,
+        db: BaseDBAsyncClient,
+        columns: List[str],
+        values_lists: List[list],
+        fetch_generated: bool,
+        on_conflict: Optional[List[str]] = None,
+        update_fields: Optional[List[str]] = None,
+    ) -> list:
+        if not fetch_generated or self.BULK_INSERT_RETURNING:
+            rows = await super()._execute_bulk_insert_batch(
+                db, columns, values_lists, fetch_generated, on_conflict, update_fields
+            )
+            return [row[0] for row in rows]
+        # The rows get consecutive ROWIDs, that end with the last inserted one
+        last_rowid = await db.execute_insert(
+            self._get_bulk_insert_sql(columns, len(values_lists)),
+            [value for values in values_lists for value in values],
+        )
+        return list(range(last_rowid - len(values_lists) + 1, last_rowid + 1))
+
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
         if (
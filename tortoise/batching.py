@@ -0,0 +1,137 @@
+import asyncio
+from contextvars import ContextVar, Token
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Type,
+)
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import Model
+
+current_batch_loader: ContextVar[Optional["BatchLoader"]] = ContextVar(
+    "current_batch_loader", default=None
+)
+
+
+class BatchLoader:
+    """
+    Coalesces the loads that are requested concurrently, in the same iteration of the
+    event loop, into one query per relation or model.
+
+    The loads are collected until the event loop gets to run the dispatch of the batch,
+    which is scheduled by the first load of the batch,
+    and then each load gets its own result from the batch.
+    """
+
+    def __init__(self) -> None:
+        self._batches: Dict[Hashable, List[Any]] = {}
+        self._tasks: Set[asyncio.Future] = set()
+
+    def _add(
+        self, key: Hashable, item: Any, dispatch: Callable[[list], Awaitable[list]]
+    ) -> asyncio.Future:
+        future = asyncio.get_event_loop().create_future()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = []
+            task = asyncio.ensure_future(self._dispatch(key, dispatch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        batch.append((item, future))
+        return future
+
+    async def _dispatch(self, key: Hashable, dispatch: Callable[[list], Awaitable[list]]) -> None:
+        # Loads that are requested from now on get a new batch
+        batch = self._batches.pop(key)
+        try:
+            results = await dispatch([item for item, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def load(
+        self, model: "Type[Model]", db: "BaseDBAsyncClient", pk: Any
+    ) -> "Optional[Model]":
+        """
+        Loads the object with the primary key, or ``None`` if it does not exist.
+
+        :param model: The model to load.
+        :param db: The DB connection to load from.
+        :param pk: The primary key of the object.
+        """
+        pk_field = model._meta.pk
+
+        async def dispatch(pks: list) -> list:
+            objects = await db.get_executor(model)._fetch_prefetch_chunks(
+                model.all().using_db(db), model._meta.pk_attr, pks
+            )
+            object_map = {obj.pk: obj for obj in objects}
+            return [object_map.get(pk) for pk in pks]
+
+        return await self._add((db, model), pk_field.to_python_value(pk), dispatch)
+
+    async def fetch_related(self, db: "BaseDBAsyncClient", instance: "Model", args: tuple) -> None:
+        """
+        Fetches the related fields of the instance.
+
+        :param db: The DB connection to fetch from.
+        :param instance: The instance to fetch the related fields of.
+        :param args: The related fields that should be fetched.
+        """
+
+        async def dispatch(instances: list) -> list:
+            await db.executor_class(model=instance.__class__, db=db).fetch_for_list(
+                instances, *args
+            )
+            return [None] * len(instances)
+
+        await self._add((db, instance.__class__, args), instance, dispatch)
+
+
+class batched:
+    """
+    Batching context manager.
+
+    Inside ``with batched():`` (or ``async with batched():``), concurrent calls of
+    ``instance.fetch_related(...)``, ``await Model.get(pk=...)`` and ``await instance.fk``
+    in the same iteration of the event loop get coalesced into one query per relation or model.
+    Tasks started in the context, such as with ``asyncio.gather()``, share the batching.
+
+    .. code-block:: python3
+
+        with batched():
+            await asyncio.gather(*[event.fetch_related("tournament") for event in events])
+    """
+
+    __slots__ = ("_token",)
+
+    def __init__(self) -> None:
+        self._token: "Optional[Token]" = None
+
+    def __enter__(self) -> BatchLoader:
+        loader = BatchLoader()
+        self._token = current_batch_loader.set(loader)
+        return loader
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        current_batch_loader.reset(self._token)  # type: ignore
+
+    async def __aenter__(self) -> BatchLoader:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,228 @@
+import time
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from tortoise.utils import LRUCache
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import Model
+
+
+class BaseCacheStore:
+    """
+    The interface of the stores for the results of ``QuerySet.cache()``.
+
+    The values are tuples of plain DB values, so a store can serialise them as it needs to.
+    Each table has a version, which is part of the keys of the entries that read from it,
+    so bumping the version of a table invalidates all of its entries.
+    Versions must be kept until they are bumped, as entries would be valid again otherwise.
+    """
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for the key, or ``None`` if it isn't cached or has expired.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Caches the value for the key.
+
+        :param key: The key of the entry.
+        :param value: The value to cache.
+        :param ttl: Number of seconds until the entry expires, or ``None`` to keep it.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def get_versions(self, tables: List[str]) -> List[int]:
+        """
+        Returns the current versions of the tables.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        """
+        Increments the versions of the tables, which invalidates their cached entries.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+
+class LRUCacheStore(BaseCacheStore):
+    """
+    An in-process store, which keeps the most recently used entries.
+
+    :param maxsize: Maximum number of entries to keep.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.entries = LRUCache(maxsize=maxsize)
+        self._versions: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry: Optional[Tuple[Optional[float], Any]] = self.entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and expires < time.monotonic():
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.entries.set(key, (None if ttl is None else time.monotonic() + ttl, value))
+
+    async def get_versions(self, tables: List[str]) -> List[int]:
+        return [self._versions.get(table, 0) for table in tables]
+
+    async def bump_versions(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+
+class PKCache:
+    """
+    The rows of a model by primary key, for the ``pk_cache_size`` Meta option.
+
+    The rows of every full instance that is loaded outside of a transaction get cached,
+    and plain primary key lookups outside of a transaction are hydrated from them.
+    Writes through the model discard the rows they touch, and again once their transaction commits.
+
+    :param maxsize: Maximum number of rows to keep.
+    :param ttl: Number of seconds to keep a row for, or ``None`` to keep it until evicted.
+    """
+
+    __slots__ = ("rows", "ttl")
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self.rows = LRUCache(maxsize=maxsize)
+        self.ttl = ttl
+
+    def get(self, model: Type["Model"], pk: Any) -> "Optional[Model]":
+        """
+        Returns a new instance with the cached row of the primary key, if it is cached.
+        """
+        entry = self.rows.get(model._meta.pk.to_python_value(pk))
+        if entry is None:
+            return None
+        expires, columns, row = entry
+        if expires is not None and expires < time.monotonic():
+            return None
+        return model._init_from_db_rows([row], columns)[0]
+
+    def set_rows(
+        self,
+        model: Type["Model"],
+        rows: Sequence[Sequence[Any]],
+        columns: Tuple[str, ...],
+        offset: int = 0,
+    ) -> None:
+        """
+        Caches the rows of full instances, by their primary key.
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        pk_pos = columns.index(model._meta.db_pk_column) + offset
+        to_python_value = model._meta.pk.to_python_value
+        end = offset + len(columns)
+        for row in rows:
+            pk = row[pk_pos]
+            if pk is not None:
+                self.rows.set(to_python_value(pk), (expires, columns, tuple(row)[offset:end]))
+
+    def discard(self, pk: Any) -> None:
+        """
+        Removes the row of the primary key.
+        """
+        self.rows.discard(pk)
+
+    def clear(self) -> None:
+        """
+        Removes all the rows.
+        """
+        self.rows.clear()
+
+
+_store: Optional[BaseCacheStore] = None
+
+
+def set_cache_store(store: Optional[BaseCacheStore]) -> None:
+    """
+    Sets the store for the results of ``QuerySet.cache()``.
+
+    Writes only invalidate the cached entries once there is a store,
+    so a store that is shared between processes should be set on startup.
+
+    :param store: The store, or ``None`` to use an :class:`LRUCacheStore` once required.
+    """
+    global _store
+    _store = store
+
+
+def get_cache_store() -> BaseCacheStore:
+    """
+    Returns the store for the results of ``QuerySet.cache()``, creating the default one if unset.
+    """
+    global _store
+    if _store is None:
+        _store = LRUCacheStore()
+    return _store
+
+
+def _repeat_on_commit(connection: Any, invalidate: Callable[[], Awaitable[None]]) -> None:
+    # Other connections can cache the committed rows again, until the transaction commits
+    from tortoise.backends.base.client import BaseTransactionWrapper
+
+    if isinstance(connection, BaseTransactionWrapper):
+        connection._invalidations.append(invalidate)
+
+
+async def invalidate_tables(*tables: str, connection: "Optional[BaseDBAsyncClient]" = None) -> None:
+    """
+    Invalidates the cached results that read from the tables.
+
+    Writes through the models invalidate their tables, but raw SQL such as
+    ``execute_query()`` doesn't, so it should be followed by a call to this.
+
+    :param tables: The tables that got written to.
+    :param connection: The connection that wrote to the tables.
+        If it is a transaction, the tables are invalidated again once it commits.
+    """
+    if _store is not None:
+        await _store.bump_versions(tables)
+    _repeat_on_commit(connection, partial(invalidate_tables, *tables))
+
+
+async def invalidate_model(
+    model: Type["Model"],
+    instances: "Optional[Iterable[Union[Type[Model], Model]]]" = None,
+    connection: "Optional[BaseDBAsyncClient]" = None,
+) -> None:
+    """
+    Invalidates the cached results of the model, and its PK cache.
+
+    :param model: The model that got written to.
+    :param instances: The written instances, defaults to all of them.
+    :param connection: The connection that wrote to the model.
+        If it is a transaction, the model is invalidated again once it commits.
+    """
+    pk_cache = model._meta.pk_cache
+    if pk_cache is not None:
+        if instances is None:
+            pk_cache.clear()
+        else:
+            for instance in instances:
+                pk_cache.discard(instance.pk)
+    await invalidate_tables(model._meta.db_table)
+    _repeat_on_commit(connection, partial(invalidate_model, model, instances))
@@ -3,8 +3,9 @@ import os as _os
 import unittest
 from asyncio.events import AbstractEventLoop
 from functools import wraps
-from typing import Any, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, List, Optional
 from unittest import SkipTest, expectedFailure, skip, skipIf, skipUnless
+from unittest.mock import MagicMock, patch
 from unittest.result import TestResult
 
 from asynctest import TestCase as _TestCase
@@ -16,6 +17,9 @@ from tortoise.backends.base.config_generator import generate_config as _generate
 from tortoise.exceptions import DBConnectionError
 from tortoise.transactions import current_transaction_map
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
 __all__ = (
     "SimpleTestCase",
     "TestCase",
@@ -23,6 +27,7 @@ __all__ = (
     "IsolatedTestCase",
     "getDBConfig",
     "requireCapability",
+    "count_queries",
     "env_initializer",
     "initializer",
     "finalizer",
@@ -461,3 +466,21 @@ def requireCapability(connection_name: str = "models", **conditions: Any):
         return test_item
 
     return decorator
+
+
+def count_queries(connection: "BaseDBAsyncClient") -> ContextManager[MagicMock]:
+    """
+    Counts the queries that are run with ``execute_query()`` of the connection.
+
+    Usage:
+
+    .. code-block:: python3
+
+        with count_queries(Tournament._meta.db) as execute_query:
+            await Tournament.get(pk=1)
+        self.assertEqual(execute_query.call_count, 1)
+
+    :param connection: The connection to count the queries of,
+        which is the transaction of the test within ``TestCase``.
+    """
+    return patch.object(connection, "execute_query", wraps=connection.execute_query)
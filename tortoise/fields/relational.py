@@ -16,6 +16,7 @@ from typing import (
 from pypika import Table
 from typing_extensions import Literal
 
+from tortoise.cache import invalidate_tables
 from tortoise.exceptions import ConfigurationError, NoValuesFetched, OperationalError
 from tortoise.fields.base import CASCADE, RESTRICT, SET_NULL, Field
 
@@ -238,6 +239,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             insert_is_required = True
         if insert_is_required:
             await db.execute_query(str(query))
+            await invalidate_tables(self.field.through, connection=db)
 
     async def clear(self, using_db: "Optional[BaseDBAsyncClient]" = None) -> None:
         """
@@ -255,6 +257,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             .delete()
         )
         await db.execute_query(str(query))
+        await invalidate_tables(self.field.through, connection=db)
 
     async def remove(
         self, *instances: MODEL, using_db: "Optional[BaseDBAsyncClient]" = None
@@ -290,6 +293,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             )
         query = db.query_class.from_(through_table).where(condition).delete()
         await db.execute_query(str(query))
+        await invalidate_tables(self.field.through, connection=db)
 
 
 class RelationalField(Field):
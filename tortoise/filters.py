@@ -80,6 +80,72 @@ def escape_like(val: str) -> str:
     return val.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+##############################################################################
+# Bind values
+##############################################################################
+
+#: Marker rendered in place of a bind parameter, replaced by the dialect placeholder afterwards
+BIND_MARKER = "\x1e\x1e"
+
+
+class BindValue(ValueWrapper):  # type: ignore
+    """
+    A filter value that renders inline like any other value,
+    or as a bind parameter if the query is rendered with a ``bind_values`` list.
+
+    Values whose type is not in the ``bind_types`` render kwarg stay inlined,
+    as the driver might not be able to adapt them.
+    """
+
+    def get_bind_value(self) -> Any:
+        """
+        Returns the value as it is passed to the driver.
+        """
+        return self.value.value if isinstance(self.value, Enum) else self.value
+
+    def get_value_sql(self, **kwargs):
+        bind_values = kwargs.get("bind_values")
+        value = self.get_bind_value()
+        if bind_values is None or type(value) not in kwargs.get("bind_types", ()):
+            return super().get_value_sql(**kwargs)
+        bind_values.append(value)
+        return BIND_MARKER
+
+
+class BindArray(Term):  # type: ignore
+    """
+    ``ANY()`` of a list of values, e.g. ``"id"=ANY($1)``, to compare a column with the list
+    as a single array bind parameter (PostgreSQL), instead of a parameter per value.
+
+    Renders as ``ANY(ARRAY[...])`` if the query is not rendered with a ``bind_values`` list.
+    """
+
+    def __init__(self, values: list) -> None:
+        super().__init__()
+        self.values = values
+
+    def get_sql(self, **kwargs: Any) -> str:
+        bind_values = kwargs.get("bind_values")
+        if bind_values is None:
+            kwargs.pop("bind_types", None)
+            return "ANY(ARRAY[{}])".format(
+                ",".join(ValueWrapper(value).get_sql(**kwargs) for value in self.values)
+            )
+        bind_values.append(self.values)
+        return f"ANY({BIND_MARKER})"
+
+
+def bind_value(value: Any) -> Any:
+    """
+    Wraps a DB-encoded filter value (or each value in a list) as a :class:`BindValue`.
+    """
+    if isinstance(value, list):
+        return [bind_value(element) for element in value]
+    if value is None or isinstance(value, tuple) or isinstance(value, Term):
+        return value
+    return BindValue(value)
+
+
 ##############################################################################
 # Encoders
 # Should be type: (Any, instance: "Model", field: Field) -> type:
@@ -180,6 +246,20 @@ def insensitive_ends_with(field: Term, value: str) -> Criterion:
     )
 
 
+#: Operators that take the encoded value (or list of values) as-is, so it can be bound
+BINDABLE_OPERATORS = {
+    operator.eq,
+    operator.ge,
+    operator.le,
+    operator.gt,
+    operator.lt,
+    not_equal,
+    is_in,
+    not_in,
+    between_and,
+}
+
+
 ##############################################################################
 # Filter resolvers
 ##############################################################################
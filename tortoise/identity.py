@@ -0,0 +1,133 @@
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Type
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
+current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "current_identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    Keeps one instance per model and primary key, so the rows that get fetched again
+    resolve to the instance that was hydrated first, instead of a new instance.
+
+    Instances are not refreshed from rows that get fetched again,
+    and partial instances from ``.only()`` and annotated instances are not kept.
+    """
+
+    __slots__ = ("_instances",)
+
+    def __init__(self) -> None:
+        self._instances: Dict[Type["Model"], Dict[Any, "Model"]] = {}
+
+    def get(self, model: Type["Model"], pk: Any) -> "Optional[Model]":
+        """
+        Returns the instance of the model with the primary key, if it has been fetched.
+
+        :param model: The model of the instance.
+        :param pk: The primary key of the instance.
+        """
+        instances = self._instances.get(model)
+        if not instances:
+            return None
+        return instances.get(model._meta.pk.to_python_value(pk))
+
+    def discard(self, model: Type["Model"], pk: Any) -> None:
+        """
+        Forgets the instance of the model with the primary key.
+
+        :param model: The model of the instance.
+        :param pk: The primary key of the instance.
+        """
+        instances = self._instances.get(model)
+        if instances:
+            instances.pop(model._meta.pk.to_python_value(pk), None)
+
+    def clear(self, model: Optional[Type["Model"]] = None) -> None:
+        """
+        Forgets the instances of the model, or of all the models.
+
+        :param model: The model to forget the instances of, defaults to all of them.
+        """
+        if model is None:
+            self._instances.clear()
+        else:
+            self._instances.pop(model, None)
+
+    def _get_instances(
+        self,
+        model: Type["Model"],
+        rows: Sequence[Sequence[Any]],
+        pk_pos: int,
+        hydrate: Callable[[Sequence[Sequence[Any]]], list],
+    ) -> "List[Model]":
+        # Only the rows of instances that haven't been fetched before get hydrated
+        instances = self._instances.setdefault(model, {})
+        to_python_value = model._meta.pk.to_python_value
+        keys = [to_python_value(row[pk_pos]) for row in rows]
+        new_rows: Dict[Any, Sequence[Any]] = {}
+        for key, row in zip(keys, rows):
+            if key is not None and key not in instances and key not in new_rows:
+                new_rows[key] = row
+        if new_rows:
+            instances.update(zip(new_rows, hydrate(list(new_rows.values()))))
+        result = []
+        for key, row in zip(keys, rows):
+            if key is None:
+                result.extend(hydrate([row]))
+            else:
+                result.append(instances[key])
+        return result
+
+
+class identity_map:
+    """
+    Identity map context manager.
+
+    Inside ``with identity_map():`` (or ``async with identity_map():``), every row that is
+    fetched resolves to a single instance per model and primary key,
+    and ``await Model.get(pk=...)`` returns the instance without a query if it has been fetched.
+    Tasks started in the context share the identity map.
+
+    Deleting an instance forgets it, and ``QuerySet.update()`` or ``QuerySet.delete()`` forget
+    all the instances of the model. The identity map is cleared when a transaction ends.
+
+    .. code-block:: python3
+
+        with identity_map():
+            event = await Event.get(pk=1)
+            assert (await Event.filter(name=event.name).first()) is event
+    """
+
+    __slots__ = ("_token",)
+
+    def __init__(self) -> None:
+        self._token: "Optional[Token]" = None
+
+    def __enter__(self) -> IdentityMap:
+        instances = IdentityMap()
+        self._token = current_identity_map.set(instances)
+        return instances
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        current_identity_map.reset(self._token)  # type: ignore
+
+    async def __aenter__(self) -> IdentityMap:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+
+def clear_identity_map(model: Optional[Type["Model"]] = None) -> None:
+    """
+    Clears the identity map of the current context, if there is one.
+
+    :param model: The model to forget the instances of, defaults to all of them.
+    """
+    instances = current_identity_map.get()
+    if instances is not None:
+        instances.clear(model)
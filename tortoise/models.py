@@ -1,5 +1,6 @@
 import asyncio
 import inspect
+import logging
 import re
 from copy import copy, deepcopy
 from functools import partial
@@ -12,6 +13,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -23,9 +25,12 @@ from pypika import Order, Query, Table
 from pypika.terms import Term
 
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.batching import current_batch_loader
+from tortoise.cache import PKCache
 from tortoise.exceptions import (
     ConfigurationError,
     DoesNotExist,
+    FieldError,
     IncompleteInstanceError,
     IntegrityError,
     OperationalError,
@@ -46,11 +51,19 @@ from tortoise.fields.relational import (
 )
 from tortoise.filters import get_filters_for_field
 from tortoise.functions import Function
+from tortoise.identity import current_identity_map
 from tortoise.queryset import ExistsQuery, Q, QuerySet, QuerySetSingle
 from tortoise.signals import Signals
 from tortoise.transactions import current_transaction_map, in_transaction
 
 MODEL = TypeVar("MODEL", bound="Model")
+logger = logging.getLogger("tortoise")
+_background_tasks: Set["asyncio.Future"] = set()
+# How Model.__init__ handles a kwarg
+_INIT_FIELD, _INIT_RELATION, _INIT_ERROR = range(3)
+HydrationPlan = Tuple[
+    bool, List[Tuple[int, str]], List[Tuple[int, str, Any]], List[Tuple[int, str, Any]]
+]
 EMPTY = object()
 
 
@@ -77,6 +90,39 @@ def prepare_default_ordering(meta: "Model.Meta") -> Tuple[Tuple[str, Order], ...
     return parsed_ordering
 
 
+class _LazyField:
+    """
+    Descriptor for a lazy field, that keeps the raw DB value until it is first accessed.
+    """
+
+    __slots__ = ("model_field", "raw_key", "to_python_value")
+
+    def __init__(self, model_field: str, raw_key: str, field: Field) -> None:
+        self.model_field = model_field
+        self.raw_key = raw_key
+        self.to_python_value = field.to_python_value
+
+    def __get__(self, instance: Optional["Model"], owner: Optional[Type["Model"]] = None) -> Any:
+        if instance is None:
+            return self
+        values = instance.__dict__
+        try:
+            return values[self.model_field]
+        except KeyError:
+            pass
+        try:
+            raw = values.pop(self.raw_key)
+        except KeyError:
+            raise AttributeError(self.model_field) from None
+        value = values[self.model_field] = self.to_python_value(raw)
+        return value
+
+    def __set__(self, instance: "Model", value: Any) -> None:
+        values = instance.__dict__
+        values.pop(self.raw_key, None)
+        values[self.model_field] = value
+
+
 def _fk_setter(
     self: "Model", value: "Optional[Model]", _key: str, relation_field: str, to_field: str
 ) -> None:
@@ -92,7 +138,10 @@ def _fk_getter(
     except AttributeError:
         value = getattr(self, relation_field)
         if value:
-            return ftype.filter(**{to_field: value}).first()
+            queryset = ftype.filter(**{to_field: value}).first()
+            if to_field == ftype._meta.pk_attr:
+                queryset._pk_lookup = value  # type: ignore
+            return queryset
         return NoneAwaitable
 
 
@@ -127,6 +176,39 @@ def _m2m_getter(
     return val
 
 
+def _get_slots(fields_map: Dict[str, Field], slots: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Get the instance slots for the fields, and the state of a model.
+
+    The relations are class properties, so only their cached values get slots.
+    Backward relations are only known after all the models are loaded,
+    so those are cached in the ``__dict__``, which is only created when used.
+    """
+    names = {*slots, "_partial", "_saved_in_db", "_custom_generated_pk"}
+    for key, field in fields_map.items():
+        if isinstance(field, (ForeignKeyFieldInstance, OneToOneFieldInstance)):
+            names.add(f"{key}_id")
+            names.add(f"_{key}")
+        elif isinstance(field, ManyToManyFieldInstance):
+            names.add(f"_{key}")
+        else:
+            names.add(key)
+    return tuple(sorted(names))
+
+
+def _background_task_done(task: "asyncio.Future") -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error("Background signal listener failed", exc_info=task.exception())
+
+
+def _run_in_background(awaitable: Awaitable) -> None:
+    # Keep a reference to the task, else it could be garbage collected before it is done
+    task = asyncio.ensure_future(awaitable)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_task_done)
+
+
 def _get_comments(cls: "Type[Model]") -> Dict[str, str]:
     """
     Get comments exactly before attributes
@@ -192,6 +274,15 @@ class MetaInfo:
         "db_native_fields",
         "db_default_fields",
         "db_complex_fields",
+        "_hydration_plans",
+        "_lazy_fields",
+        "lazy_fields",
+        "slots",
+        "signals",
+        "pk_cache",
+        "_init_fields",
+        "_init_defaults",
+        "_init_default_factories",
         "_default_ordering",
         "_ordering_validated",
     )
@@ -231,6 +322,22 @@ class MetaInfo:
         self.db_native_fields: List[Tuple[str, str, Field]] = []
         self.db_default_fields: List[Tuple[str, str, Field]] = []
         self.db_complex_fields: List[Tuple[str, str, Field]] = []
+        self._hydration_plans: Dict[Tuple[str, ...], HydrationPlan] = {}
+        lazy_fields = getattr(meta, "lazy_fields", False)
+        # None is for all the fields
+        self._lazy_fields: Optional[Set[str]] = (
+            None if lazy_fields is True else set(lazy_fields or ())
+        )
+        self.lazy_fields: Dict[str, str] = {}
+        self.slots: bool = getattr(meta, "slots", False)
+        self.signals: Set[Signals] = set()
+        pk_cache_size = getattr(meta, "pk_cache_size", 0)
+        self.pk_cache: Optional[PKCache] = (
+            PKCache(pk_cache_size, getattr(meta, "pk_cache_ttl", None)) if pk_cache_size else None
+        )
+        self._init_fields: Dict[str, Tuple[int, Any]] = {}
+        self._init_defaults: List[Tuple[str, Any]] = []
+        self._init_default_factories: List[Tuple[str, Callable[[], Any]]] = []
 
     @property
     def full_name(self) -> str:
@@ -309,12 +416,51 @@ class MetaInfo:
             generated_fields.append(field.source_field or field.model_field_name)
         self.generated_db_fields = tuple(generated_fields)  # type: ignore
 
+        self._generate_init_fields()
+
         self._ordering_validated = True
         for field_name, _ in self._default_ordering:
             if field_name.split("__")[0] not in self.fields:
                 self._ordering_validated = False
                 break
 
+    def _generate_init_fields(self) -> None:
+        """
+        Precomputes how ``Model.__init__`` handles each kwarg, and the defaults of the fields.
+        """
+        self._init_fields = {}
+        for key in self.fields_db_projection:
+            self._init_fields[key] = (_INIT_FIELD, self.fields_map[key])
+        for key in self.fk_fields | self.o2o_fields:
+            self._init_fields[key] = (_INIT_RELATION, self.fields_map[key].source_field)
+        for key in self.backward_fk_fields:
+            self._init_fields[key] = (
+                _INIT_ERROR,
+                "You can't set backward relations through init, change related model instead",
+            )
+        for key in self.backward_o2o_fields:
+            self._init_fields[key] = (
+                _INIT_ERROR,
+                "You can't set backward one to one relations through init,"
+                " change related model instead",
+            )
+        for key in self.m2m_fields:
+            self._init_fields[key] = (
+                _INIT_ERROR,
+                "You can't set m2m relations through init, use m2m_manager instead",
+            )
+
+        self._init_defaults = []
+        self._init_default_factories = []
+        for key in self.fields_map:
+            if key in self.fetch_fields:
+                continue
+            default = self.fields_map[key].default
+            if callable(default):
+                self._init_default_factories.append((key, default))
+            else:
+                self._init_defaults.append((key, default))
+
     def _generate_lazy_fk_m2m_fields(self) -> None:
         # Create lazy FK fields on model.
         for key in self.fk_fields:
@@ -430,9 +576,13 @@ class MetaInfo:
             )
 
     def _generate_db_fields(self) -> None:
+        self._hydration_plans.clear()
         self.db_default_fields.clear()
         self.db_complex_fields.clear()
         self.db_native_fields.clear()
+        for model_field in self.lazy_fields:
+            delattr(self._model, model_field)
+        self.lazy_fields.clear()
 
         for key in self.db_fields:
             model_field = self.fields_db_projection_reverse[key]
@@ -446,11 +596,74 @@ class MetaInfo:
                 self.db_native_fields.append((key, model_field, field))
             elif not default_converter:
                 self.db_complex_fields.append((key, model_field, field))
+                if (self._lazy_fields is None or model_field in self._lazy_fields) and not (
+                    field.pk or getattr(field, "auto_now_add", False)
+                ):
+                    self.lazy_fields[model_field] = f"_{model_field}_raw"
             elif field.field_type in self.db.executor_class.DB_NATIVE:
                 self.db_native_fields.append((key, model_field, field))
             else:
                 self.db_default_fields.append((key, model_field, field))
 
+        for model_field, raw_key in self.lazy_fields.items():
+            setattr(
+                self._model,
+                model_field,
+                _LazyField(model_field, raw_key, self.fields_map[model_field]),
+            )
+
+    def get_hydration_plan(self, columns: Tuple[str, ...]) -> HydrationPlan:
+        """
+        Resolves the row positions of the DB columns, and how to convert each of them.
+
+        The plans are cached per column tuple, so that partial rows from ``.only()``
+        get the same native/default/complex split as full rows.
+
+        :param columns: The column names of the result set, in row order.
+        :return: The partial flag, and the native, default and complex
+            ``(position, model_field[, converter])`` lists.
+            The raw values of lazy fields are in the native list, keyed by their raw key.
+        """
+        plan = self._hydration_plans.get(columns)
+        if plan is None:
+            positions = {column: pos for pos, column in enumerate(columns)}
+            if self.db_fields.issubset(positions):
+                partial = False
+            else:
+                # Partial rows are keyed by the field names
+                partial = True
+                positions = {
+                    self.fields_db_projection[column]: pos
+                    for column, pos in positions.items()
+                    if column in self.fields_db_projection
+                }
+            plan = (
+                partial,
+                [
+                    (positions[key], model_field)
+                    for key, model_field, _ in self.db_native_fields
+                    if key in positions
+                ]
+                # Lazy fields keep the raw value, to be converted on first access
+                + [
+                    (positions[key], self.lazy_fields[model_field])
+                    for key, model_field, _ in self.db_complex_fields
+                    if key in positions and model_field in self.lazy_fields
+                ],
+                [
+                    (positions[key], model_field, field.field_type)
+                    for key, model_field, field in self.db_default_fields
+                    if key in positions
+                ],
+                [
+                    (positions[key], model_field, field.to_python_value)
+                    for key, model_field, field in self.db_complex_fields
+                    if key in positions and model_field not in self.lazy_fields
+                ],
+            )
+            self._hydration_plans[columns] = plan
+        return plan
+
     def _generate_filters(self) -> None:
         get_overridden_filter_func = self.db.executor_class.get_overridden_filter_func
         for key, filter_info in self._filters.items():
@@ -579,6 +792,8 @@ class ModelMeta(type):
         for slot in fields_map:
             attrs.pop(slot, None)
         attrs["_meta"] = meta = MetaInfo(meta_class)
+        if meta.slots and not meta.abstract:
+            attrs["__slots__"] = _get_slots(fields_map, attrs.get("__slots__", ()))
 
         meta.fields_map = fields_map
         meta.fields_db_projection = fields_db_projection
@@ -631,6 +846,10 @@ class Model(metaclass=ModelMeta):
         Signals.pre_delete: {},
         Signals.post_delete: {},
     }
+    _background_listeners: Dict[Signals, Dict[Type[MODEL], List[Callable]]] = {  # type: ignore
+        Signals.post_save: {},
+        Signals.post_delete: {},
+    }
 
     def __init__(self, **kwargs: Any) -> None:
         # self._meta is a very common attribute lookup, lets cache it.
@@ -640,58 +859,54 @@ class Model(metaclass=ModelMeta):
         self._custom_generated_pk = False
 
         # Assign defaults for missing fields
-        for key in meta.fields.difference(self._set_kwargs(kwargs)):
-            field_object = meta.fields_map[key]
-            if callable(field_object.default):
-                setattr(self, key, field_object.default())
-            else:
-                setattr(self, key, field_object.default)
+        passed_fields = self._set_kwargs(kwargs) if kwargs else ()
+        for key, default in meta._init_defaults:
+            if key not in passed_fields:
+                setattr(self, key, default)
+        for key, default_factory in meta._init_default_factories:
+            if key not in passed_fields:
+                setattr(self, key, default_factory())
 
     def _set_kwargs(self, kwargs: dict) -> Set[str]:
-        meta = self._meta
+        init_fields = self._meta._init_fields
 
         # Assign values and do type conversions
-        passed_fields = {*kwargs.keys()} | meta.fetch_fields
+        passed_fields = set(kwargs)
 
         for key, value in kwargs.items():
-            if key in meta.fk_fields or key in meta.o2o_fields:
-                if value and not value._saved_in_db:
-                    raise OperationalError(
-                        f"You should first call .save() on {value} before referring to it"
-                    )
-                setattr(self, key, value)
-                passed_fields.add(meta.fields_map[key].source_field)
-            elif key in meta.fields_db_projection:
-                field_object = meta.fields_map[key]
+            try:
+                kind, field_object = init_fields[key]
+            except KeyError:
+                continue
+            if kind == _INIT_FIELD:
                 if field_object.generated:
                     self._custom_generated_pk = True
                 if value is None and not field_object.null:
                     raise ValueError(f"{key} is non nullable field, but null was passed")
                 setattr(self, key, field_object.to_python_value(value))
-            elif key in meta.backward_fk_fields:
-                raise ConfigurationError(
-                    "You can't set backward relations through init, change related model instead"
-                )
-            elif key in meta.backward_o2o_fields:
-                raise ConfigurationError(
-                    "You can't set backward one to one relations through init,"
-                    " change related model instead"
-                )
-            elif key in meta.m2m_fields:
-                raise ConfigurationError(
-                    "You can't set m2m relations through init, use m2m_manager instead"
-                )
+            elif kind == _INIT_RELATION:
+                if value and not value._saved_in_db:
+                    raise OperationalError(
+                        f"You should first call .save() on {value} before referring to it"
+                    )
+                setattr(self, key, value)
+                # The source field of the relation
+                passed_fields.add(field_object)
+            else:
+                raise ConfigurationError(field_object)
 
         return passed_fields
 
     @classmethod
     def _init_from_db(cls: Type[MODEL], **kwargs: Any) -> MODEL:
+        meta = cls._meta
+        if meta.lazy_fields or current_identity_map.get() is not None:
+            return cls._init_from_db_rows([kwargs])[0]
+
         self = cls.__new__(cls)
         self._partial = False
         self._saved_in_db = True
 
-        meta = self._meta
-
         try:
             # This is like so for performance reasons.
             #  We want to avoid conditionals and calling .to_python_value()
@@ -708,13 +923,95 @@ class Model(metaclass=ModelMeta):
             for key, model_field, field in meta.db_complex_fields:
                 setattr(self, model_field, field.to_python_value(kwargs[key]))
         except KeyError:
-            self._partial = True
-            # TODO: Apply similar perf optimisation as above for partial
-            for key, value in kwargs.items():
-                setattr(self, key, meta.fields_map[key].to_python_value(value))
+            # Partial rows from .only() have their own cached plan
+            return cls._init_from_db_rows([kwargs])[0]
 
         return self
 
+    @classmethod
+    def _init_from_db_rows(
+        cls: Type[MODEL],
+        rows: Sequence[Any],
+        columns: Optional[Tuple[str, ...]] = None,
+        offset: int = 0,
+        cache_rows: bool = False,
+        use_identity_map: bool = True,
+    ) -> List[MODEL]:
+        """
+        Creates instances from the rows of a single result set.
+
+        The column positions and converters are resolved once for all the rows,
+        and the values are written to the instance ``__dict__`` directly.
+
+        :param rows: The rows, either dicts or sequences indexable by position.
+        :param columns: The column names of this model, defaults to the keys of the first row.
+        :param offset: The row position of the first column of this model.
+        :param cache_rows: Should the rows be added to the PK cache of the model, if it has one?
+        :param use_identity_map: Can the instances be shared through the current identity map?
+        """
+        if not rows:
+            return []
+        first = rows[0]
+        if columns is None:
+            columns = tuple(first.keys())
+        if isinstance(first, dict):
+            rows = [tuple(row.values()) for row in rows]
+        plan = cls._meta.get_hydration_plan(columns)
+        if cache_rows and cls._meta.pk_cache is not None and not plan[0]:
+            cls._meta.pk_cache.set_rows(cls, rows, columns, offset)
+        identity_map = current_identity_map.get()
+        if identity_map is not None and use_identity_map and not plan[0]:
+            return identity_map._get_instances(  # type: ignore
+                cls,
+                rows,
+                columns.index(cls._meta.db_pk_column) + offset,
+                partial(cls._hydrate_rows, plan=plan, offset=offset),
+            )
+        return cls._hydrate_rows(rows, plan, offset)
+
+    @classmethod
+    def _hydrate_rows(
+        cls: Type[MODEL], rows: Sequence[Sequence[Any]], plan: HydrationPlan, offset: int
+    ) -> List[MODEL]:
+        partial, native_fields, default_fields, complex_fields = plan
+        native_attrs = [model_field for _, model_field in native_fields]
+        native_positions = [pos + offset for pos, _ in native_fields]
+        if offset:
+            default_fields = [(pos + offset, attr, conv) for pos, attr, conv in default_fields]
+            complex_fields = [(pos + offset, attr, conv) for pos, attr, conv in complex_fields]
+
+        instances = []
+        new = cls.__new__
+        if cls._meta.slots:
+            # The values are stored in the slots, so the __dict__ can't be written directly
+            for row in rows:
+                self = new(cls)
+                self._partial = partial
+                self._saved_in_db = True
+                for pos, model_field in native_fields:
+                    setattr(self, model_field, row[pos + offset])
+                for pos, model_field, field_type in default_fields:
+                    value = row[pos]
+                    setattr(self, model_field, None if value is None else field_type(value))
+                for pos, model_field, to_python_value in complex_fields:
+                    setattr(self, model_field, to_python_value(row[pos]))
+                instances.append(self)
+            return instances
+
+        for row in rows:
+            self = new(cls)
+            values = self.__dict__
+            values["_partial"] = partial
+            values["_saved_in_db"] = True
+            values.update(zip(native_attrs, [row[pos] for pos in native_positions]))
+            for pos, model_field, field_type in default_fields:
+                value = row[pos]
+                values[model_field] = None if value is None else field_type(value)
+            for pos, model_field, to_python_value in complex_fields:
+                values[model_field] = to_python_value(row[pos])
+            instances.append(self)
+        return instances
+
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}>"
 
@@ -792,20 +1089,31 @@ class Model(metaclass=ModelMeta):
         return self
 
     @classmethod
-    def register_listener(cls, signal: Signals, listener: Callable):
+    def register_listener(cls, signal: Signals, listener: Callable, background: bool = False):
         """
         Register listener to current model class for special Signal.
 
         :param signal: one of tortoise.signals.Signal
         :param listener: callable listener
+        :param background: Run the listener as a background task, instead of waiting for it.
+            Only available for the post_save and post_delete signals.
 
-        :raises ConfigurationError: When listener is not callable
+        :raises ConfigurationError: When listener is not callable,
+            or a background listener is not for a post signal
         """
         if not callable(listener):
             raise ConfigurationError("Signal listener must be callable!")
-        cls_listeners = cls._listeners.get(signal).setdefault(cls, [])  # type:ignore
+        if background:
+            if signal not in cls._background_listeners:
+                raise ConfigurationError(f"Signal {signal.name} can't run in the background")
+            listeners = cls._background_listeners
+        else:
+            listeners = cls._listeners
+        cls_listeners = listeners.get(signal).setdefault(cls, [])  # type:ignore
         if listener not in cls_listeners:
             cls_listeners.append(listener)
+        # Saves and deletes only dispatch the signals that have listeners
+        cls._meta.signals.add(signal)
 
     async def _pre_delete(
         self,
@@ -827,6 +1135,8 @@ class Model(metaclass=ModelMeta):
         self,
         using_db: Optional[BaseDBAsyncClient] = None,
     ) -> None:
+        for listener in self._background_listeners[Signals.post_delete].get(self.__class__, []):
+            _run_in_background(listener(self.__class__, self, using_db))
         listeners = []
         cls_listeners = self._listeners.get(Signals.post_delete, {}).get(self.__class__, [])
         for listener in cls_listeners:
@@ -856,6 +1166,8 @@ class Model(metaclass=ModelMeta):
         created: bool = False,
         update_fields: Optional[Iterable[str]] = None,
     ) -> None:
+        for listener in self._background_listeners[Signals.post_save].get(self.__class__, []):
+            _run_in_background(listener(self.__class__, self, created, using_db, update_fields))
         listeners = []
         cls_listeners = self._listeners.get(Signals.post_save, {}).get(self.__class__, [])
         for listener in cls_listeners:
@@ -884,7 +1196,7 @@ class Model(metaclass=ModelMeta):
         :raises IntegrityError: If the model can't be created or updated (specifically if force_create or force_update has been set)
         """
         db = using_db or self._meta.db
-        executor = db.executor_class(model=self.__class__, db=db)
+        executor = db.get_executor(self.__class__)
         if self._partial:
             if update_fields:
                 for field in update_fields:
@@ -900,7 +1212,8 @@ class Model(metaclass=ModelMeta):
                 raise IncompleteInstanceError(
                     f"{self.__class__.__name__} is a partial model, can only be saved with the relevant update_field provided"
                 )
-        await self._pre_save(using_db, update_fields)
+        if Signals.pre_save in self._meta.signals:
+            await self._pre_save(using_db, update_fields)
 
         if force_create:
             await executor.execute_insert(self)
@@ -919,12 +1232,13 @@ class Model(metaclass=ModelMeta):
                     await executor.execute_update(self, update_fields)
                     created = False
             else:
-                # TODO: Do a merge/upsert operation here instead. Let the executor determine an optimal strategy for each DB engine.
+                # Upserts are explicit, see get_or_create() and update_or_create()
                 await executor.execute_insert(self)
                 created = True
 
         self._saved_in_db = True
-        await self._post_save(using_db, created, update_fields)
+        if Signals.post_save in self._meta.signals:
+            await self._post_save(using_db, created, update_fields)
 
     async def delete(self, using_db: Optional[BaseDBAsyncClient] = None) -> None:
         """
@@ -937,9 +1251,14 @@ class Model(metaclass=ModelMeta):
         db = using_db or self._meta.db
         if not self._saved_in_db:
             raise OperationalError("Can't delete unpersisted record")
-        await self._pre_delete(using_db)
-        await db.executor_class(model=self.__class__, db=db).execute_delete(self)
-        await self._post_delete(using_db)
+        if Signals.pre_delete in self._meta.signals:
+            await self._pre_delete(using_db)
+        await db.get_executor(self.__class__).execute_delete(self)
+        identity_map = current_identity_map.get()
+        if identity_map is not None:
+            identity_map.discard(self.__class__, self.pk)
+        if Signals.post_delete in self._meta.signals:
+            await self._post_delete(using_db)
 
     async def fetch_related(self, *args: Any, using_db: Optional[BaseDBAsyncClient] = None) -> None:
         """
@@ -953,6 +1272,10 @@ class Model(metaclass=ModelMeta):
         :param using_db: Specific DB connection to use instead of default bound
         """
         db = using_db or self._meta.db
+        loader = current_batch_loader.get()
+        if loader is not None:
+            await loader.fetch_related(db, self, args)
+            return
         await db.executor_class(model=self.__class__, db=db).fetch_for_list([self], *args)
 
     async def refresh_from_db(
@@ -989,6 +1312,11 @@ class Model(metaclass=ModelMeta):
         Fetches the object if exists (filtering on the provided parameters),
         else creates an instance with any unspecified parameters as default values.
 
+        If the query parameters specify a unique constraint, a missing instance is created
+        with an ``INSERT ... ON CONFLICT DO NOTHING`` statement on PostgreSQL and SQLite 3.35+,
+        instead of within a transaction, and fetched again if it was created concurrently.
+        Models with ``pre_save`` signals always use the transaction.
+
         :param defaults: Default values to be added to a created instance if it can't be fetched.
         :param using_db: Specific DB connection to use instead of default bound
         :param kwargs: Query parameters.
@@ -996,6 +1324,18 @@ class Model(metaclass=ModelMeta):
         if not defaults:
             defaults = {}
         db = using_db if using_db else cls._meta.db
+        on_conflict = cls._get_conflict_target(db, kwargs)
+        if on_conflict:
+            queryset = cls.filter(**kwargs).using_db(db)
+            existing = await queryset.first()
+            if existing:
+                return existing, False
+            created = cls(**defaults, **kwargs)
+            if await created._insert_on_conflict(db, on_conflict):
+                return created, True
+            # Created concurrently
+            return await queryset.get(), False
+
         async with in_transaction(connection_name=db.connection_name):
             instance = await cls.filter(**kwargs).first()
             if instance:
@@ -1008,6 +1348,51 @@ class Model(metaclass=ModelMeta):
         # Try after transaction in case transaction error
         return await cls.get(**kwargs), False
 
+    @classmethod
+    async def update_or_create(
+        cls: Type[MODEL],
+        defaults: Optional[dict] = None,
+        using_db: Optional[BaseDBAsyncClient] = None,
+        **kwargs: Any,
+    ) -> Tuple[MODEL, bool]:
+        """
+        Updates the object with the defaults if exists (filtering on the provided parameters),
+        else creates an instance with any unspecified parameters as default values.
+
+        The existing instance is locked with ``SELECT ... FOR UPDATE`` within a transaction,
+        so concurrent updates are not lost. A missing instance is created as
+        with :meth:`get_or_create`.
+
+        :param defaults: Values to be updated, or added to a created instance.
+        :param using_db: Specific DB connection to use instead of default bound
+        :param kwargs: Query parameters.
+        """
+        if not defaults:
+            defaults = {}
+        db = using_db if using_db else cls._meta.db
+        async with in_transaction(connection_name=db.connection_name) as connection:
+            instance = await cls.filter(**kwargs).select_for_update().using_db(connection).first()
+            if instance:
+                await instance.update_from_dict(defaults).save(using_db=connection)
+                return instance, False
+        return await cls.get_or_create(defaults, db, **kwargs)
+
+    async def _insert_on_conflict(self, db: BaseDBAsyncClient, on_conflict: List[str]) -> bool:
+        """
+        Creates the object, unless it conflicts with an existing row on the unique fields.
+
+        Doesn't send ``pre_save``, as it can't tell yet whether the object will be saved.
+
+        :return: If the object was created.
+        """
+        executor = db.get_executor(self.__class__)
+        if not await executor.execute_upsert(self, on_conflict):
+            return False
+        self._saved_in_db = True
+        if Signals.post_save in self._meta.signals:
+            await self._post_save(db, True)
+        return True
+
     @classmethod
     async def create(cls: Type[MODEL], **kwargs: Any) -> MODEL:
         """
@@ -1037,6 +1422,10 @@ class Model(metaclass=ModelMeta):
         cls: Type[MODEL],
         objects: Iterable[MODEL],
         using_db: Optional[BaseDBAsyncClient] = None,
+        batch_size: Optional[int] = None,
+        fetch_generated: bool = False,
+        on_conflict: Optional[Iterable[str]] = None,
+        update_fields: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Bulk insert operation:
@@ -1046,11 +1435,16 @@ class Model(metaclass=ModelMeta):
             created in the DB has all the defaults and generated fields set,
             but may be incomplete reference in Python.
 
-            e.g. ``IntField`` primary keys will not be populated.
+            e.g. ``IntField`` primary keys will not be populated, unless ``fetch_generated`` is set.
 
         This is recommend only for throw away inserts where you want to ensure optimal
         insert performance.
 
+        With ``fetch_generated`` the generated fields get populated from the multi-row inserts:
+        with ``RETURNING`` on PostgreSQL and SQLite 3.35+,
+        and from the consecutive IDs after ``LAST_INSERT_ID()`` on MySQL
+        (which requires an ``auto_increment_increment`` of ``1``).
+
         .. code-block:: python3
 
             User.bulk_create([
@@ -1058,11 +1452,136 @@ class Model(metaclass=ModelMeta):
                 User(name="...", email="...")
             ])
 
+        MySQL and SQLite insert the rows with multi-row ``INSERT`` statements,
+        that are split to stay within the parameter and packet limits of the DB.
+
+        With ``on_conflict`` the rows that conflict with existing rows on those unique fields
+        are skipped, or update the ``update_fields`` of the existing rows instead:
+        with ``ON CONFLICT ... DO NOTHING/UPDATE`` on PostgreSQL and SQLite,
+        and with ``ON DUPLICATE KEY UPDATE`` on MySQL (which checks all unique keys).
+
+        .. code-block:: python3
+
+            User.bulk_create(users, on_conflict=["email"], update_fields=["name"])
+
         :param objects: List of objects to bulk create
         :param using_db: Specific DB connection to use instead of default bound
+        :param batch_size: Max number of rows to insert per statement (MySQL and SQLite)
+        :param fetch_generated: Populate the generated fields (e.g. primary keys) of the objects.
+        :param on_conflict: The unique field names, that conflicting rows are skipped on.
+        :param update_fields: The field names to update of the conflicting rows instead.
+        :raises FieldError: If a conflict or update field is unknown or virtual.
+        :raises IntegrityError: If an update field is the PK.
+        :raises ParamsError: If batch_size is not a positive number,
+            or the conflict parameters are incomplete or combined with ``fetch_generated``.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ParamsError("batch_size must be a positive number")
+        on_conflict_fields = cls._get_source_fields(on_conflict or [], update=False)
+        update_source_fields = cls._get_source_fields(update_fields or [])
+        if update_source_fields and not on_conflict_fields:
+            raise ParamsError("update_fields requires on_conflict")
+        if on_conflict_fields and fetch_generated:
+            raise ParamsError("fetch_generated can not be combined with on_conflict")
+        db = using_db or cls._meta.db
+        await db.get_executor(cls).execute_bulk_insert(
+            objects, batch_size, fetch_generated, on_conflict_fields, update_source_fields
+        )
+
+    @classmethod
+    async def bulk_update(
+        cls: Type[MODEL],
+        objects: Iterable[MODEL],
+        fields: Iterable[str],
+        batch_size: Optional[int] = None,
+        using_db: Optional[BaseDBAsyncClient] = None,
+    ) -> int:
+        """
+        Bulk update operation:
+
+        Updates the given fields of the (saved) objects with as few statements as possible,
+        instead of a ``save()`` per object.
+
+        .. code-block:: python3
+
+            for user in users:
+                user.name = user.name.title()
+            await User.bulk_update(users, fields=["name"])
+
+        The rows are updated with ``UPDATE ... SET col = CASE WHEN pk = ... THEN ... END`` statements,
+        or with ``UPDATE ... FROM (VALUES ...)`` on PostgreSQL,
+        that are split to stay within the parameter limits of the DB.
+
+        .. note::
+            Like ``bulk_create()``, this does not send the save signals.
+
+        :param objects: List of objects to bulk update
+        :param fields: The field names to update
+        :param batch_size: Max number of rows to update per statement
+        :param using_db: Specific DB connection to use instead of default bound
+        :return: The number of updated rows
+        :raises FieldError: If a field is unknown or virtual.
+        :raises IntegrityError: If a field is the PK.
+        :raises ParamsError: If no fields are given, or batch_size is not a positive number.
         """
+        if batch_size is not None and batch_size < 1:
+            raise ParamsError("batch_size must be a positive number")
+        db_fields = cls._get_source_fields(fields)
+        if not db_fields:
+            raise ParamsError("bulk_update() requires at least one field")
         db = using_db or cls._meta.db
-        await db.executor_class(model=cls, db=db).execute_bulk_insert(objects)
+        return await db.get_executor(cls).execute_bulk_update(objects, db_fields, batch_size)
+
+    @classmethod
+    def _get_source_fields(cls, fields: Iterable[str], update: bool = True) -> List[str]:
+        """
+        Validates the field names, and maps relations to their source fields.
+
+        :raises FieldError: If a field is unknown or virtual.
+        :raises IntegrityError: If a field to ``update`` is the PK.
+        """
+        meta = cls._meta
+        source_fields = []
+        for field in fields:
+            field_object = meta.fields_map.get(field)
+            if not field_object:
+                raise FieldError(f"Unknown keyword argument {field} for model {cls}")
+            if update and field_object.pk:
+                raise IntegrityError(f"Field {field} is PK and can not be updated")
+            if isinstance(field_object, (ForeignKeyFieldInstance, OneToOneFieldInstance)):
+                field = field_object.source_field  # type: ignore
+            elif field not in meta.fields_db_projection:
+                raise FieldError(f"Field {field} is virtual and can not be used")
+            source_fields.append(field)
+        return source_fields
+
+    @classmethod
+    def _get_conflict_target(
+        cls, db: BaseDBAsyncClient, kwargs: Dict[str, Any]
+    ) -> Optional[List[str]]:
+        """
+        Returns the source fields of a unique constraint, that is fully specified by the filter,
+        if the DB can upsert with it and the model has no ``pre_save`` signals.
+        """
+        if not db.executor_class.UPSERT_RETURNING or Signals.pre_save in cls._meta.signals:
+            return None
+        meta = cls._meta
+        fields = []
+        for key in kwargs:
+            field_object = meta.fields_map.get(key)
+            if isinstance(field_object, (ForeignKeyFieldInstance, OneToOneFieldInstance)):
+                key = field_object.source_field  # type: ignore
+            elif key not in meta.fields_db_projection:
+                # Lookups and virtual fields can't match a unique constraint
+                return None
+            if meta.fields_map[key].unique:
+                return [key]
+            fields.append(key)
+        for together in meta.unique_together:
+            source_fields = cls._get_source_fields(together, update=False)
+            if set(fields).issuperset(source_fields):
+                return source_fields
+        return None
 
     @classmethod
     def first(cls: Type[MODEL]) -> QuerySetSingle[Optional[MODEL]]:
@@ -1122,7 +1641,12 @@ class Model(metaclass=ModelMeta):
         :raises MultipleObjectsReturned: If provided search returned more than one object.
         :raises DoesNotExist: If object can not be found.
         """
-        return QuerySet(cls).get(*args, **kwargs)
+        queryset = QuerySet(cls).get(*args, **kwargs)
+        if not args and len(kwargs) == 1:
+            key, value = next(iter(kwargs.items()))
+            if key in ("pk", cls._meta.pk_attr):
+                queryset._pk_lookup = value  # type: ignore
+        return queryset
 
     @classmethod
     def exists(cls: Type[MODEL], *args: Q, **kwargs: Any) -> ExistsQuery:
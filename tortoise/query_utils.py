@@ -1,27 +1,49 @@
 from copy import copy
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Set, Tuple, Type, cast
 
 from pypika import Table
 from pypika.terms import Criterion, Term
 
 from tortoise.exceptions import FieldError, OperationalError
 from tortoise.fields.relational import BackwardFKRelation, ManyToManyFieldInstance, RelationalField
+from tortoise.filters import BIND_MARKER, BINDABLE_OPERATORS, BindValue, bind_value
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.models import Model
     from tortoise.queryset import QuerySet
 
 
+def _get_filter_param(model: "Type[Model]", key: str, value: Any) -> Tuple[dict, Any]:
+    if value is None and f"{key}__isnull" in model._meta.filters:
+        return model._meta.get_filter(f"{key}__isnull"), True
+    return model._meta.get_filter(key), value
+
+
+def _encode_filter_value(model: "Type[Model]", param: dict, value: Any) -> Any:
+    if param.get("table"):
+        if param.get("value_encoder"):
+            value = param["value_encoder"](value, model)
+    elif isinstance(value, Term):
+        return value
+    else:
+        field_object = model._meta.fields_map[param["field"]]
+        value = (
+            param["value_encoder"](value, model, field_object)
+            if param.get("value_encoder")
+            else model._meta.db.executor_class._field_to_db(field_object, value, model)
+        )
+    if param["operator"] in BINDABLE_OPERATORS:
+        value = bind_value(value)
+    return value
+
+
 def _process_filter_kwarg(
     model: "Type[Model]", key: str, value: Any, table: Table
 ) -> Tuple[Criterion, Optional[Tuple[Table, Criterion]]]:
     join = None
 
-    if value is None and f"{key}__isnull" in model._meta.filters:
-        param = model._meta.get_filter(f"{key}__isnull")
-        value = True
-    else:
-        param = model._meta.get_filter(key)
+    param, value = _get_filter_param(model, key, value)
+    encoded_value = _encode_filter_value(model, param, value)
 
     pk_db_field = model._meta.db_pk_column
     if param.get("table"):
@@ -29,23 +51,41 @@ def _process_filter_kwarg(
             param["table"],
             table[pk_db_field] == param["table"][param["backward_key"]],
         )
-        if param.get("value_encoder"):
-            value = param["value_encoder"](value, model)
-        criterion = param["operator"](param["table"][param["field"]], value)
+        criterion = param["operator"](param["table"][param["field"]], encoded_value)
     else:
-        if isinstance(value, Term):
-            encoded_value = value
-        else:
-            field_object = model._meta.fields_map[param["field"]]
-            encoded_value = (
-                param["value_encoder"](value, model, field_object)
-                if param.get("value_encoder")
-                else model._meta.db.executor_class._field_to_db(field_object, value, model)
-            )
         criterion = param["operator"](table[param["source_field"]], encoded_value)
     return criterion, join
 
 
+def _get_filter_kwarg_shape(
+    model: "Type[Model]", key: str, value: Any, bind_types: Set[type], values: list
+) -> Optional[Hashable]:
+    """
+    Returns the shape of the SQL that :func:`_process_filter_kwarg` would generate,
+    and appends the values it would bind to ``values``.
+
+    Returns ``None`` if the SQL depends on the actual value.
+    """
+    param, value = _get_filter_param(model, key, value)
+    encoded_value = _encode_filter_value(model, param, value)
+    if param["operator"] not in BINDABLE_OPERATORS:
+        # The value is rendered into the SQL
+        if isinstance(value, Term) or not isinstance(value, Hashable):
+            return None
+        return key, type(value), value
+
+    shape: List[Optional[str]] = []
+    for element in encoded_value if isinstance(encoded_value, list) else [encoded_value]:
+        if element is None:
+            shape.append(None)
+        elif isinstance(element, BindValue) and type(element.get_bind_value()) in bind_types:
+            shape.append(BIND_MARKER)
+            values.append(element.get_bind_value())
+        else:
+            return None
+    return key, isinstance(encoded_value, list), tuple(shape)
+
+
 def _get_joins_for_related_field(
     table: Table, related_field: RelationalField, related_field_name: str
 ) -> List[Tuple[Table, Criterion]]:
@@ -386,6 +426,47 @@ class Q:
             return self._resolve_kwargs(model, table)
         return self._resolve_children(model, table)
 
+    def _get_shape(
+        self, model: "Type[Model]", bind_types: Set[type], values: list
+    ) -> Optional[Hashable]:
+        """
+        Returns the structural shape of the SQL this Q chain resolves to,
+        and appends the values it binds (in SQL order) to ``values``.
+
+        Returns ``None`` if the SQL depends on the filter values, or on annotations.
+        """
+        shapes = []
+        if self.filters:
+            for raw_key, raw_value in self.filters.items():
+                if raw_key in self._custom_filters:
+                    return None
+                key, value = self._get_actual_filter_params(model, raw_key, raw_value)
+                if (
+                    key not in model._meta.filters
+                    and key.split("__")[0] in model._meta.fetch_fields
+                ):
+                    related_field_name = key.split("__")[0]
+                    related_field = cast(
+                        RelationalField, model._meta.fields_map[related_field_name]
+                    )
+                    shape = Q(**{"__".join(key.split("__")[1:]): value})._get_shape(
+                        related_field.related_model, bind_types, values
+                    )
+                    if shape is not None:
+                        shape = (related_field_name, shape)
+                else:
+                    shape = _get_filter_kwarg_shape(model, key, value, bind_types, values)
+                if shape is None:
+                    return None
+                shapes.append(shape)
+        else:
+            for node in self.children:
+                shape = node._get_shape(model, bind_types, values)
+                if shape is None:
+                    return None
+                shapes.append(shape)
+        return self.join_type, self._is_negated, tuple(shapes)
+
 
 class Prefetch:
     """
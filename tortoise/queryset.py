@@ -1,5 +1,7 @@
+import hashlib
 import types
 from copy import copy
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -8,9 +10,11 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Hashable,
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -25,7 +29,10 @@ from pypika.queries import QueryBuilder
 from pypika.terms import Term, ValueWrapper
 from typing_extensions import Protocol
 
-from tortoise.backends.base.client import BaseDBAsyncClient, Capabilities
+from tortoise.backends.base.client import BaseDBAsyncClient, BaseTransactionWrapper, Capabilities
+from tortoise.backends.base.executor import BaseExecutor
+from tortoise.batching import current_batch_loader
+from tortoise.cache import get_cache_store, invalidate_model
 from tortoise.exceptions import (
     DoesNotExist,
     FieldError,
@@ -40,10 +47,14 @@ from tortoise.fields.relational import (
     RelationalField,
 )
 from tortoise.functions import Function
+from tortoise.identity import clear_identity_map, current_identity_map
 from tortoise.query_utils import Prefetch, Q, QueryModifier, _get_joins_for_related_field
+from tortoise.utils import LRUCache
 
 # Empty placeholder - Should never be edited.
 QUERY: QueryBuilder = QueryBuilder()
+#: Compiled SQL of parametrized queries, keyed by their structural shape
+QUERY_SHAPE_CACHE = LRUCache(maxsize=256)
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.models import Model
@@ -70,7 +81,14 @@ class QuerySetSingle(Protocol[T_co]):
     def only(self, *fields_for_select: str) -> "QuerySetSingle[MODEL]":
         ...  # pragma: nocoverage
 
-    def values_list(self, *fields_: str, flat: bool = False) -> "ValuesListQuery":
+    def cache(
+        self, ttl: Optional[float] = None, key: Optional[str] = None
+    ) -> "QuerySetSingle[MODEL]":
+        ...  # pragma: nocoverage
+
+    def values_list(
+        self, *fields_: str, flat: bool = False, raw: bool = False
+    ) -> "ValuesListQuery":
         ...  # pragma: nocoverage
 
     def values(self, *args: str, **kwargs: str) -> "ValuesQuery":
@@ -229,6 +247,14 @@ class AwaitableQuery(Generic[MODEL]):
         self._make_query()
         return self.query.get_sql()
 
+    def _get_sql_and_values(self) -> Tuple[str, Optional[list]]:
+        """
+        Returns the SQL to execute, and its bind values when the connection parametrizes queries.
+        """
+        if self._db.parametrize_queries:
+            return self._db.get_executor(self.model).parametrize_query(self.query)
+        return self.query.get_sql(), None
+
     def _make_query(self) -> None:
         raise NotImplementedError()  # pragma: nocoverage
 
@@ -257,6 +283,8 @@ class QuerySet(AwaitableQuery[MODEL]):
         "_select_for_update",
         "_select_related",
         "_select_related_idx",
+        "_pk_lookup",
+        "_cache",
     )
 
     def __init__(self, model: Type[MODEL]) -> None:
@@ -281,6 +309,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         self._select_related_idx: List[
             Tuple["Type[Model]", int, str, "Type[Model]"]
         ] = []  # format with: model,idx,model_name,parent_model
+        # The pk of a plain ``Model.get(pk=...)`` or FK lookup, which can be served from caches
+        self._pk_lookup: Any = None
+        self._cache: Optional[Tuple[Optional[float], Optional[str]]] = None
 
     def _clone(self) -> "QuerySet[MODEL]":
         queryset = QuerySet.__new__(QuerySet)
@@ -308,6 +339,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._select_for_update = self._select_for_update
         queryset._select_related = self._select_related
         queryset._select_related_idx = self._select_related_idx
+        # Only the plain lookup can be served from caches, not querysets derived from it
+        queryset._pk_lookup = None
+        queryset._cache = self._cache
         return queryset
 
     def _filter_or_exclude(self, *args: Q, negate: bool, **kwargs: Any) -> "QuerySet[MODEL]":
@@ -424,6 +458,23 @@ class QuerySet(AwaitableQuery[MODEL]):
             return queryset
         return self
 
+    def cache(self, ttl: Optional[float] = None, key: Optional[str] = None) -> "QuerySet[MODEL]":
+        """
+        Make QuerySet cache its results.
+
+        The rows are cached in the store from :func:`tortoise.cache.set_cache_store`,
+        and hydrated again on each execution. Writes to any of the queried tables
+        through the models and many-to-many relations invalidate the cached results,
+        but raw SQL doesn't, see :func:`tortoise.cache.invalidate_tables`.
+        Prefetches are not cached, and neither are queries in a transaction.
+
+        :param ttl: Number of seconds to cache the results for, or ``None`` to keep them.
+        :param key: Cache key, instead of one derived from the SQL and its values.
+        """
+        queryset = self._clone()
+        queryset._cache = (ttl, key)
+        return queryset
+
     def annotate(self, **kwargs: Function) -> "QuerySet[MODEL]":
         """
         Annotate result with aggregation or function result.
@@ -450,12 +501,18 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._group_bys = fields
         return queryset
 
-    def values_list(self, *fields_: str, flat: bool = False) -> "ValuesListQuery":
+    def values_list(
+        self, *fields_: str, flat: bool = False, raw: bool = False
+    ) -> "ValuesListQuery":
         """
         Make QuerySet returns list of tuples for given args instead of objects.
 
         If ```flat=True`` and only one arg is passed can return flat list.
 
+        If ``raw=True``, the rows are returned as the DB driver returns them,
+        and only the columns that the driver doesn't already return as python types are converted.
+        The rows are sequences indexed by position, but not necessarily tuples.
+
         If no arguments are passed it will default to a tuple containing all fields
         in order of declaration.
         """
@@ -464,6 +521,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             model=self.model,
             q_objects=self._q_objects,
             flat=flat,
+            raw=raw,
             fields_for_select_list=fields_  # type: ignore
             or [
                 field
@@ -701,9 +759,7 @@ class QuerySet(AwaitableQuery[MODEL]):
         if self._db is None:
             self._db = self.model._meta.db  # type: ignore
         self._make_query()
-        return await self._db.executor_class(model=self.model, db=self._db).execute_explain(
-            self.query
-        )
+        return await self._db.get_executor(self.model).execute_explain(self.query)
 
     def using_db(self, _db: BaseDBAsyncClient) -> "QuerySet[MODEL]":
         """
@@ -788,24 +844,186 @@ class QuerySet(AwaitableQuery[MODEL]):
                     forwarded_fields="__".join(field_split[1:]) if len(field_split) > 1 else "",
                 )
 
+    def _get_shape(self) -> Optional[Tuple[Hashable, list]]:
+        """
+        Returns the structural shape of the query, and the values it binds.
+
+        Returns ``None`` if the query can't be cached by shape.
+        """
+        if self._annotations or self._custom_filters or self._having:
+            return None
+        values: list = []
+        q_shapes = []
+        for node in self._q_objects:
+            q_shape = node._get_shape(self.model, self._db.executor_class.DB_NATIVE, values)
+            if q_shape is None:
+                return None
+            q_shapes.append(q_shape)
+        shape = (
+            self.model,
+            self._db.executor_class,
+            self._fields_for_select,
+            tuple(self._orderings),
+            self._limit,
+            self._offset,
+            self._distinct,
+            self._select_for_update,
+            frozenset(self._select_related),
+            tuple(q_shapes),
+        )
+        return shape, values
+
+    def _compile(self) -> Tuple[str, Optional[list]]:
+        """
+        Builds the query, and returns its SQL and bind values.
+
+        Parametrized queries are looked up in the query shape cache first,
+        so repeat executions of a shape skip building the query and only encode the values.
+        """
+        shape = None
+        if self._db.parametrize_queries and QUERY_SHAPE_CACHE.maxsize > 0:
+            shape = self._get_shape()
+        if shape is None:
+            self._make_query()
+            return self._get_sql_and_values()
+
+        key, values = shape
+        cached = QUERY_SHAPE_CACHE.get(key)
+        if cached is not None:
+            sql, self._select_related_idx = cached
+            return sql, values or None
+
+        self._make_query()
+        sql, bound_values = self._get_sql_and_values()
+        # Only cache the shape if it predicted the bind values correctly
+        if (bound_values or []) == values:
+            QUERY_SHAPE_CACHE.set(key, (sql, self._select_related_idx))
+        return sql, bound_values
+
     def __await__(self) -> Generator[Any, None, List[MODEL]]:
         if self._db is None:
             self._db = self.model._meta.db  # type: ignore
-        self._make_query()
         return self._execute().__await__()
 
-    async def __aiter__(self) -> AsyncIterator[MODEL]:
-        for val in await self:
-            yield val
+    def __aiter__(self) -> AsyncIterator[MODEL]:
+        return self.iterator()
 
-    async def _execute(self) -> List[MODEL]:
-        instance_list = await self._db.executor_class(
+    async def iterator(self, chunk_size: int = 1000) -> AsyncIterator[MODEL]:
+        """
+        Iterates over the objects, while streaming the rows from the DB in chunks,
+        instead of loading the whole resultset into memory.
+
+        .. code-block:: python3
+
+            async for user in User.filter(active=True).iterator(chunk_size=500):
+                ...
+
+        ``async for`` on the QuerySet itself uses the default ``chunk_size``.
+
+        The rows are streamed with server-side cursors on PostgreSQL (within a transaction),
+        unbuffered cursors on MySQL (outside of transactions) and incremental fetches on SQLite.
+        Prefetches are done per chunk.
+        The cursor is released when the iteration ends, or when the iterator is closed
+        with ``aclose()`` after leaving the loop early.
+
+        :param chunk_size: The number of rows to fetch and hydrate at once.
+        :raises ParamsError: If chunk_size is not a positive number.
+        """
+        if chunk_size < 1:
+            raise ParamsError("chunk_size must be a positive number")
+        if self._db is None:
+            self._db = self.model._meta.db  # type: ignore
+        sql, values = self._compile()
+        stream = self._get_executor().execute_select_stream(
+            sql, values, list(self._annotations.keys()), chunk_size
+        )
+        try:
+            async for instance_list in stream:
+                for instance in instance_list:
+                    yield instance
+        finally:
+            await stream.aclose()
+
+    async def iterate_by_key(self, key: str = "pk", batch_size: int = 1000) -> AsyncIterator[MODEL]:
+        """
+        Iterates over the objects in batches ordered by a unique key, using keyset pagination:
+        every batch is a separate ``WHERE key > last ORDER BY key LIMIT batch_size`` query.
+
+        Unlike ``limit()``/``offset()`` paging, every batch is an index range scan,
+        and unlike ``iterator()``, no transaction or cursor is held open between the batches.
+        Filters, ``only()`` and ``prefetch_related()`` apply to every batch.
+
+        .. code-block:: python3
+
+            async for user in User.filter(active=True).iterate_by_key(batch_size=500):
+                ...
+
+        :param key: The unique field to order and paginate by.
+        :param batch_size: The number of objects to fetch per query.
+        :raises FieldError: If the key is not a field, or not selected with ``only()``.
+        :raises ParamsError: If batch_size is not a positive number,
+            or the QuerySet is limited or offset.
+        """
+        if batch_size < 1:
+            raise ParamsError("batch_size must be a positive number")
+        if self._limit or self._offset:
+            raise ParamsError("iterate_by_key() can not be combined with limit() or offset()")
+        field = self.model._meta.pk_attr if key == "pk" else key
+        if field not in self.model._meta.fields_db_projection:
+            raise FieldError(f"Unknown key field {key} for model {self.model.__name__}")
+        if self._fields_for_select and field not in self._fields_for_select:
+            raise FieldError(f"Key field {key} must be included in only()")
+
+        queryset = self.order_by(field).limit(batch_size)
+        batch = queryset
+        while True:
+            instance_list = await batch
+            for instance in instance_list:
+                yield instance
+            if len(instance_list) < batch_size:
+                break
+            batch = queryset.filter(**{f"{field}__gt": getattr(instance_list[-1], field)})
+
+    def _get_executor(self) -> BaseExecutor:
+        if not (self._prefetch_map or self._prefetch_queries or self._select_related):
+            return self._db.get_executor(self.model)
+        return self._db.executor_class(
             model=self.model,
             db=self._db,
             prefetch_map=self._prefetch_map,
             prefetch_queries=self._prefetch_queries,
             select_related_idx=self._select_related_idx,
-        ).execute_select(self.query, custom_fields=list(self._annotations.keys()))
+        )
+
+    async def _execute(self) -> List[MODEL]:
+        if self._pk_lookup is not None:
+            pk = self._pk_lookup
+            identity_map = current_identity_map.get()
+            instance = None if identity_map is None else identity_map.get(self.model, pk)
+            pk_cache = self.model._meta.pk_cache
+            if (
+                instance is None
+                and pk_cache is not None
+                and not isinstance(self._db, BaseTransactionWrapper)
+            ):
+                instance = pk_cache.get(self.model, pk)
+            loader = current_batch_loader.get()
+            if instance is None and loader is not None:
+                instance = await loader.load(self.model, self._db, pk)
+                if instance is None and self._raise_does_not_exist:
+                    raise DoesNotExist("Object does not exist")
+                return instance  # type: ignore
+            if instance is not None:
+                return instance  # type: ignore
+        instance_list: list
+        # Rows read in a transaction may not be committed, so they are kept out of the cache
+        if self._cache is not None and not isinstance(self._db, BaseTransactionWrapper):
+            instance_list = await self._execute_cached()
+        else:
+            sql, values = self._compile()
+            instance_list = await self._get_executor().execute_select_sql(
+                sql, values, custom_fields=list(self._annotations.keys())
+            )
         if self._single:
             if len(instance_list) == 1:
                 return instance_list[0]
@@ -816,6 +1034,47 @@ class QuerySet(AwaitableQuery[MODEL]):
             raise MultipleObjectsReturned("Multiple objects returned, expected exactly one")
         return instance_list
 
+    async def _execute_cached(self) -> List[MODEL]:
+        # The query is always built, as its joins are the tables that the results depend on
+        self._make_query()
+        sql, values = self._get_sql_and_values()
+        tables = sorted(
+            {
+                table._table_name
+                for table in [*self.query._from, *[join.item for join in self.query._joins]]
+                if isinstance(table, Table)
+            }
+        )
+        ttl, key = self._cache  # type: ignore
+        if key is None:
+            key = hashlib.sha1(repr((sql, values)).encode()).hexdigest()
+        store = get_cache_store()
+        versions = await store.get_versions(tables)
+        key = f"{self._db.connection_name}:{key}:" + ",".join(
+            f"{table}={version}" for table, version in zip(tables, versions)
+        )
+
+        entry = await store.get(key)
+        if entry is None:
+            raw_results: Sequence[Any] = (await self._db.execute_query(sql, values))[1]
+            # Compact rows, as tuples of the DB values
+            entry = (
+                tuple(raw_results[0].keys()) if raw_results else (),
+                [
+                    tuple(row.values()) if isinstance(row, dict) else tuple(row)
+                    for row in raw_results
+                ],
+            )
+            await store.set(key, entry, ttl)
+
+        columns, rows = entry
+        executor = self._get_executor()
+        instance_list = executor._init_instances(
+            [dict(zip(columns, row)) for row in rows], list(self._annotations.keys())
+        )
+        await executor._execute_prefetch_queries(instance_list)
+        return instance_list
+
 
 class UpdateQuery(AwaitableQuery):
     __slots__ = ("update_kwargs", "q_objects", "annotations", "custom_filters")
@@ -846,7 +1105,7 @@ class UpdateQuery(AwaitableQuery):
             custom_filters=self.custom_filters,
         )
         # Need to get executor to get correct column_map
-        executor = self._db.executor_class(model=self.model, db=self._db)
+        executor = self._db.get_executor(self.model)
 
         for key, value in self.update_kwargs.items():
             field_object = self.model._meta.fields_map.get(key)
@@ -881,7 +1140,10 @@ class UpdateQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(str(self.query)))[0]
+        clear_identity_map(self.model)
+        rows = (await self._db.execute_query(*self._get_sql_and_values()))[0]
+        await invalidate_model(self.model, connection=self._db)
+        return rows
 
 
 class DeleteQuery(AwaitableQuery):
@@ -918,7 +1180,10 @@ class DeleteQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(str(self.query)))[0]
+        clear_identity_map(self.model)
+        rows = (await self._db.execute_query(*self._get_sql_and_values()))[0]
+        await invalidate_model(self.model, connection=self._db)
+        return rows
 
 
 class ExistsQuery(AwaitableQuery):
@@ -956,7 +1221,7 @@ class ExistsQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> bool:
-        result, _ = await self._db.execute_query(str(self.query))
+        result, _ = await self._db.execute_query(*self._get_sql_and_values())
         return bool(result)
 
 
@@ -998,7 +1263,7 @@ class CountQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        _, result = await self._db.execute_query(str(self.query))
+        _, result = await self._db.execute_query(*self._get_sql_and_values())
         count = list(dict(result[0]).values())[0] - self.offset
         if self.limit and count > self.limit:
             return self.limit
@@ -1115,6 +1380,7 @@ class FieldSelectQuery(AwaitableQuery):
 class ValuesListQuery(FieldSelectQuery):
     __slots__ = (
         "flat",
+        "raw",
         "fields",
         "limit",
         "offset",
@@ -1141,6 +1407,7 @@ class ValuesListQuery(FieldSelectQuery):
         annotations: Dict[str, Any],
         custom_filters: Dict[str, Dict[str, Any]],
         group_bys: Tuple[str, ...],
+        raw: bool = False,
     ) -> None:
         super().__init__(model, annotations)
         if flat and (len(fields_for_select_list) != 1):
@@ -1156,6 +1423,7 @@ class ValuesListQuery(FieldSelectQuery):
         self.q_objects = q_objects
         self.fields_for_select_list = fields_for_select_list
         self.flat = flat
+        self.raw = raw
         self._db = db
         self.group_bys = group_bys
 
@@ -1188,23 +1456,88 @@ class ValuesListQuery(FieldSelectQuery):
         self._make_query()
         return self._execute().__await__()  # pylint: disable=E1101
 
-    async def __aiter__(self) -> AsyncIterator[Any]:
-        for val in await self:
-            yield val
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.iterator()
 
-    async def _execute(self) -> List[Any]:
-        _, result = await self._db.execute_query(str(self.query))
+    async def iterator(self, chunk_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        Iterates over the values, while streaming the rows from the DB in chunks,
+        as with ``QuerySet.iterator()``.
+
+        :param chunk_size: The number of rows to fetch at once.
+        :raises ParamsError: If chunk_size is not a positive number.
+        """
+        if chunk_size < 1:
+            raise ParamsError("chunk_size must be a positive number")
+        if self._db is None:
+            self._db = self.model._meta.db  # type: ignore
+        self._make_query()
+        sql, values = self._get_sql_and_values()
+        stream = self._db.execute_query_stream(sql, values, chunk_size)
+        try:
+            async for result in stream:
+                for row in self._resolve_rows(result):
+                    yield row
+        finally:
+            await stream.aclose()
+
+    def _get_rowmap(self) -> Callable[[Any], Any]:
         columns = [
             (key, self.resolve_to_python_value(self.model, name))
-            for key, name in sorted(self.fields.items())
+            for key, name in self.fields.items()
         ]
         if self.flat:
             func = columns[0][1]
-            flatmap = lambda entry: func(entry["0"])  # noqa
-            return list(map(flatmap, result))
+            return lambda entry: func(entry["0"])
+
+        return lambda entry: tuple(func(entry[column]) for column, func in columns)
+
+    def _get_raw_rowmap(self) -> Optional[Callable[[Any], Any]]:
+        # Annotations are selected after the fields, so the positions are taken from the query
+        aliases = [select.alias for select in self.query._selects]
+        positions = [aliases.index(key) for key in self.fields]
+        # Native columns are passed through, so rows that only have those are returned as is
+        converters = [
+            (pos, func)
+            for pos, func in enumerate(
+                self.resolve_to_python_value(self.model, name) for name in self.fields.values()
+            )
+            if not isinstance(func, types.LambdaType)
+        ]
+        if self.flat:
+            column = positions[0]
+            if converters:
+                func = converters[0][1]
+                return lambda entry: func(entry[column])
+            return itemgetter(column)
+        if positions == list(range(len(aliases))):
+            if not converters:
+                return None
+            getrow: Callable[[Any], list] = list
+        else:
+            getrow = lambda entry: [entry[pos] for pos in positions]  # noqa: E731
+
+        def rowmap(entry: Any) -> tuple:
+            row = getrow(entry)
+            for pos, func in converters:
+                row[pos] = func(row[pos])
+            return tuple(row)
+
+        return rowmap
+
+    def _resolve_rows(self, result: Sequence[Any]) -> List[Any]:
+        if not self.raw:
+            return list(map(self._get_rowmap(), result))
+        if result and isinstance(result[0], dict):
+            result = [tuple(row.values()) for row in result]
+        rowmap = self._get_raw_rowmap()
+        if rowmap is None:
+            return list(result)
+        return list(map(rowmap, result))
 
-        listmap = lambda entry: tuple(func(entry[column]) for column, func in columns)  # noqa
-        return list(map(listmap, result))
+    async def _execute(self) -> List[Any]:
+        _, result = await self._db.execute_query(*self._get_sql_and_values())
+        return self._resolve_rows(result)
 
 
 class ValuesQuery(FieldSelectQuery):
@@ -1274,13 +1607,37 @@ class ValuesQuery(FieldSelectQuery):
         self._make_query()
         return self._execute().__await__()  # pylint: disable=E1101
 
-    async def __aiter__(self) -> AsyncIterator[dict]:
-        for val in await self:
-            yield val
+    def __aiter__(self) -> AsyncIterator[dict]:
+        return self.iterator()
 
-    async def _execute(self) -> List[dict]:
-        result = await self._db.execute_query_dict(str(self.query))
-        columns = [
+    async def iterator(self, chunk_size: int = 1000) -> AsyncIterator[dict]:
+        """
+        Iterates over the values, while streaming the rows from the DB in chunks,
+        as with ``QuerySet.iterator()``.
+
+        :param chunk_size: The number of rows to fetch at once.
+        :raises ParamsError: If chunk_size is not a positive number.
+        """
+        if chunk_size < 1:
+            raise ParamsError("chunk_size must be a positive number")
+        if self._db is None:
+            self._db = self.model._meta.db  # type: ignore
+        self._make_query()
+        sql, values = self._get_sql_and_values()
+        columns = self._get_columns()
+        stream = self._db.execute_query_stream(sql, values, chunk_size)
+        try:
+            async for result in stream:
+                for entry in result:
+                    row = dict(entry)
+                    for col, func in columns:
+                        row[col] = func(row[col])
+                    yield row
+        finally:
+            await stream.aclose()
+
+    def _get_columns(self) -> List[Tuple[str, Callable]]:
+        return [
             val
             for val in [
                 (alias, self.resolve_to_python_value(self.model, field_name))
@@ -1289,6 +1646,10 @@ class ValuesQuery(FieldSelectQuery):
             if not isinstance(val[1], types.LambdaType)
         ]
 
+    async def _execute(self) -> List[dict]:
+        result = await self._db.execute_query_dict(*self._get_sql_and_values())
+        columns = self._get_columns()
+
         if columns:
             for row in result:
                 for col, func in columns:
@@ -4,16 +4,17 @@ from typing import Callable
 Signals = Enum("Signals", ["pre_save", "post_save", "pre_delete", "post_delete"])
 
 
-def post_save(*senders) -> Callable:
+def post_save(*senders, background: bool = False) -> Callable:
     """
     Register given models post_save signal.
 
     :param senders: Model class
+    :param background: Run the listener as a background task, instead of waiting for it.
     """
 
     def decorator(f):
         for sender in senders:
-            sender.register_listener(Signals.post_save, f)
+            sender.register_listener(Signals.post_save, f, background=background)
         return f
 
     return decorator
@@ -49,16 +50,17 @@ def pre_delete(*senders) -> Callable:
     return decorator
 
 
-def post_delete(*senders) -> Callable:
+def post_delete(*senders, background: bool = False) -> Callable:
     """
     Register given models post_delete signal.
 
     :param senders: Model class
+    :param background: Run the listener as a background task, instead of waiting for it.
     """
 
     def decorator(f):
         for sender in senders:
-            sender.register_listener(Signals.post_delete, f)
+            sender.register_listener(Signals.post_delete, f, background=background)
         return f
 
     return decorator
@@ -1,5 +1,6 @@
 import logging
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional
 
 logger = logging.getLogger("tortoise")
 
@@ -30,3 +31,77 @@ async def generate_schema_for_client(client: "BaseDBAsyncClient", safe: bool) ->
     logger.debug("Creating schema: %s", schema)
     if schema:  # pragma: nobranch
         await generator.generate_from_string(schema)
+
+
+class LRUCache:
+    """
+    A least-recently-used mapping, that tracks its hit/miss counts.
+
+    :param maxsize: Maximum number of entries to keep. ``0`` disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached value for the given key, or ``None`` if it isn't cached.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Caches the value for the given key, evicting the least recently used entries if full.
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Removes the entry for the given key, if it is cached.
+        """
+        self._data.pop(key, None)
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Changes the maximum number of entries, evicting entries if required.
+        """
+        self.maxsize = maxsize
+        while len(self._data) > max(maxsize, 0):
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries, and resets the counters.
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Returns the cache statistics, as a dict of ``hits``, ``misses``, ``size`` and ``maxsize``.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }